@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Paridad y tiempos de los backends (pandas, Polars, DuckDB): cada seccion
+# del reporte se compara contra pandas con tolerancia relativa (las sumas
+# en float32 cambian en el ultimo digito segun el orden de acumulacion).
+# Los backends sin su dependencia instalada se omiten. Sale con codigo 1
+# si alguna seccion no coincide.
+#
+# Uso:
+#   python benchmarks/backend_parity.py --scale 1 20
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / 'src'))
+
+from bench_load import make_scaled_csv  # noqa: E402
+from videogame_sales.backends import (  # noqa: E402
+    available_backends, backend_report, get_backend)
+
+RTOL = 1e-5
+
+
+def flatten(report):
+    for key, value in report.items():
+        if isinstance(value, dict):
+            for sub, item in value.items():
+                yield f'{key}/{sub}', item
+        else:
+            yield key, value
+
+
+def compare(expected, actual):
+    """Lista de secciones que no coinciden."""
+    actual = dict(flatten(actual))
+    failures = []
+    for key, left in flatten(expected):
+        right = actual[key]
+        try:
+            if isinstance(left, pd.Series):
+                pd.testing.assert_series_equal(left, right, rtol=RTOL,
+                                               check_index_type=False)
+            else:
+                pd.testing.assert_frame_equal(left, right, rtol=RTOL,
+                                              check_index_type=False)
+        except AssertionError as exc:
+            failures.append((key, str(exc).splitlines()[0]))
+    return failures
+
+
+def timed_report(name, path):
+    start = time.perf_counter()
+    report = backend_report(get_backend(name, path))
+    return report, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Paridad de backends')
+    parser.add_argument('--scale', type=int, nargs='+', default=[1])
+    parser.add_argument('--backends', nargs='+', default=None)
+    args = parser.parse_args()
+    names = args.backends or available_backends()
+
+    ok = True
+    print(f'{"escala":>8}{"backend":>10}{"tiempo [s]":>12}  paridad')
+    with tempfile.TemporaryDirectory() as tmp:
+        for scale in args.scale:
+            path = make_scaled_csv(scale, tmp)
+            expected, elapsed = timed_report('pandas', path)
+            print(f'{scale:>8}{"pandas":>10}{elapsed:>12.2f}  referencia')
+            for name in names:
+                if name == 'pandas':
+                    continue
+                report, elapsed = timed_report(name, path)
+                failures = compare(expected, report)
+                ok &= not failures
+                status = 'ok' if not failures else f'{len(failures)} fallas'
+                print(f'{scale:>8}{name:>10}{elapsed:>12.2f}  {status}')
+                for key, message in failures:
+                    print(f'{"":>10}{key}: {message}')
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Benchmark del pronostico vectorizado: backtest + pronostico de todos los
+# modelos para miles de series a la vez, contra el mismo codigo llamado
+# serie por serie en un ciclo de Python (medido en las primeras
+# --loop-series series y extrapolado). Las series salen de las reales
+# (plataforma/genero x region desde 2010) con ruido multiplicativo.
+#
+# Uso:
+#   python benchmarks/bench_forecast.py --series 1000 10000 100000
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / 'src'))
+
+from videogame_sales import load_games_cached  # noqa: E402
+from videogame_sales.aggregations import TRENDS_YEAR  # noqa: E402
+from videogame_sales.cube import SalesCube  # noqa: E402
+from videogame_sales.forecast import (  # noqa: E402
+    FORECAST_REGIONS, backtest, forecast_matrix)
+from videogame_sales.lifecycle import year_matrix  # noqa: E402
+
+
+def real_series():
+    cube = SalesCube.from_frame(load_games_cached()).since(TRENDS_YEAR)
+    matrix = pd.concat([year_matrix(cube, FORECAST_REGIONS, by)
+                        for by in ('platform', 'genre')])
+    return matrix[matrix.to_numpy().sum(axis=1) > 0].to_numpy()
+
+
+def synthetic_matrix(base, n_series, seed=0):
+    rng = np.random.default_rng(seed)
+    rows = base[rng.integers(0, len(base), n_series)]
+    noisy = rows * rng.lognormal(0, 0.2, rows.shape)
+    return pd.DataFrame(noisy, columns=np.arange(2010, 2010 + base.shape[1]))
+
+
+def fit_all(matrix):
+    backtest(matrix)
+    forecast_matrix(matrix)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark del pronostico por series')
+    parser.add_argument('--series', type=int, nargs='+',
+                        default=[1_000, 10_000, 100_000])
+    parser.add_argument('--loop-series', type=int, default=500)
+    args = parser.parse_args()
+
+    base = real_series()
+    fit_all(synthetic_matrix(base, 10))
+
+    print(f'{"series":>10}{"vectorizado [s]":>18}{"ciclo [s]":>12}'
+          f'{"razon":>8}')
+    for n_series in args.series:
+        matrix = synthetic_matrix(base, n_series)
+        start = time.perf_counter()
+        fit_all(matrix)
+        vectorized = time.perf_counter() - start
+
+        sample = min(n_series, args.loop_series)
+        start = time.perf_counter()
+        for i in range(sample):
+            fit_all(matrix.iloc[i:i + 1])
+        loop = (time.perf_counter() - start) * n_series / sample
+        print(f'{n_series:>10}{vectorized:>18.3f}{loop:>12.1f}'
+              f'{loop / vectorized:>8.0f}')
+
+
+if __name__ == '__main__':
+    main()
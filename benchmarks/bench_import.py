@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Benchmark de tiempo de arranque: cuanto cuesta importar cada parte del
+# paquete comparado con las librerias que el notebook importaba siempre.
+# Cada import corre en un interprete nuevo y se toma la mediana.
+#
+# Uso:
+#   python benchmarks/bench_import.py --repeat 10
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[1] / 'src'
+
+CASES = {
+    'python (vacio)': 'pass',
+    'notebook original (pandas+mpl+seaborn+scipy)':
+        'import pandas, numpy, seaborn, scipy.stats; '
+        'from matplotlib import pyplot',
+    'videogame_sales': 'import videogame_sales',
+    'videogame_sales.report': 'import videogame_sales.report',
+    'videogame_sales.plots (sin usar)': 'import videogame_sales.plots',
+    'videogame_sales + scipy (al usar stats)':
+        'import videogame_sales.stats, scipy.stats',
+}
+
+# Modulos pesados que no deben cargarse al importar el paquete
+HEAVY = ('matplotlib', 'seaborn', 'scipy')
+
+
+def time_import(code, repeat):
+    env = dict(os.environ, PYTHONPATH=str(SRC))
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], check=True, env=env)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def loaded_heavy_modules(module):
+    env = dict(os.environ, PYTHONPATH=str(SRC))
+    code = (f'import sys, {module}; '
+            f'print(",".join(m for m in {HEAVY!r} if m in sys.modules))')
+    out = subprocess.run([sys.executable, '-c', code], check=True, env=env,
+                         capture_output=True, text=True)
+    return out.stdout.strip()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark de tiempo de import del paquete')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    for name, code in CASES.items():
+        print(f'{name:<46}{time_import(code, args.repeat) * 1000:>10.0f} ms')
+
+    for module in ('videogame_sales', 'videogame_sales.report',
+                   'videogame_sales.plots'):
+        heavy = loaded_heavy_modules(module)
+        print(f'{module} carga: {heavy or "ninguna libreria pesada"}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Benchmark del caso "que pasa si" por ventanas de años: para cada
+# plataforma y cada ventana de --width años entre 1995 y 2016 se toman sus
+# juegos y se suman las ventas. Mascaras booleanas sobre la tabla completa
+# (una pasada por consulta) vs SortedGames (busqueda binaria y rebanada
+# contigua). Se reporta tambien el costo de construir el indice.
+#
+# Uso:
+#   python benchmarks/bench_index.py --scale 1 10 50 --width 3
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / 'src'))
+
+from bench_load import make_scaled_csv  # noqa: E402
+from videogame_sales.aggregations import RECENT_YEAR  # noqa: E402
+from videogame_sales.correlations import year_windows  # noqa: E402
+from videogame_sales.index import SortedGames  # noqa: E402
+from videogame_sales.loader import load_games  # noqa: E402
+
+
+def masked_windows(df, platforms, windows):
+    years = df['year_of_release'].to_numpy(dtype='float64', na_value=np.nan)
+    platform = df['platform']
+    totals = {}
+    for name in platforms:
+        in_platform = (platform == name).to_numpy(bool)
+        for first, last in windows:
+            rows = df[in_platform & (years >= first) & (years <= last)]
+            totals[name, first] = rows['total_sales'].sum()
+    return totals
+
+
+def indexed_windows(index, platforms, windows):
+    totals = {}
+    for name in platforms:
+        for first, last in windows:
+            rows = index.select(first, last, platforms=name)
+            totals[name, first] = rows['total_sales'].sum()
+    return totals
+
+
+def timed(func, *args, repeat=3):
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Consultas por ventana de años: mascaras vs indice')
+    parser.add_argument('--scale', type=int, nargs='+', default=[1, 10],
+                        help='veces que se replica Data/games.csv')
+    parser.add_argument('--width', type=int, default=3,
+                        help='años por ventana')
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for scale in args.scale:
+            df = load_games(make_scaled_csv(scale, tmp))
+            platforms = list(df['platform'].cat.categories)
+            windows = year_windows(RECENT_YEAR, 2016, args.width)
+
+            build, index = timed(SortedGames, df, repeat=1)
+            mask_time, expected = timed(masked_windows, df, platforms,
+                                        windows)
+            index_time, totals = timed(indexed_windows, index, platforms,
+                                       windows)
+            assert all(np.isclose(totals[key], expected[key])
+                       for key in expected)
+            results.append({
+                'filas': len(df),
+                'consultas': len(expected),
+                'indice_s': build,
+                'mascaras_s': mask_time,
+                'indexado_s': index_time,
+                'aceleracion': mask_time / index_time,
+            })
+
+    pd.set_option('display.float_format', '{:.3f}'.format)
+    print(pd.DataFrame(results).to_string(index=False))
+
+
+if __name__ == '__main__':
+    main()
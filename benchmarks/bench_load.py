@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Benchmark de carga: secuencia de celdas original vs load_games.
+# Cada variante corre en un subproceso nuevo para medir su pico de memoria
+# (ru_maxrss) sin que la otra lo contamine.
+#
+# Uso:
+#   python benchmarks/bench_load.py --scale 100
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / 'src'))
+
+from videogame_sales.loader import DEFAULT_PATH, load_games  # noqa: E402
+
+
+def legacy_load(path):
+    # Copia fiel de las celdas de limpieza del notebook
+    df = pd.read_csv(path)
+    df.columns = df.columns.str.lower().str.replace(' ', '_')
+    df['user_score'] = df['user_score'].replace('tbd', np.nan)
+    df['user_score'] = df['user_score'].astype(float)
+    df['year_of_release'] = df['year_of_release'].astype('Int64')
+    df['critic_score'] = df['critic_score'].astype('Int64')
+    df.dropna(subset=['name', 'genre'], inplace=True)
+    df['total_sales'] = df['na_sales'] + \
+        df['eu_sales'] + df['jp_sales'] + df['other_sales']
+    return df
+
+
+VARIANTS = {
+    'legacy': legacy_load,
+    'load_games[c]': lambda path: load_games(path, engine='c'),
+    'load_games[pyarrow]': lambda path: load_games(path, engine='pyarrow'),
+}
+
+
+def run_variant(name, path, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        df = VARIANTS[name](path)
+        times.append(time.perf_counter() - start)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {
+        'variant': name,
+        'rows': len(df),
+        'best_s': min(times),
+        'peak_rss_mb': peak / 1024,
+        'frame_mb': df.memory_usage(deep=True).sum() / 2**20,
+    }
+
+
+def make_scaled_csv(scale, directory):
+    # Replica el CSV original `scale` veces para simular catalogos grandes
+    if scale == 1:
+        return DEFAULT_PATH
+    target = Path(directory) / f'games_x{scale}.csv'
+    lines = DEFAULT_PATH.read_text(encoding='utf-8').splitlines(keepends=True)
+    with open(target, 'w', encoding='utf-8') as out:
+        out.write(lines[0])
+        for _ in range(scale):
+            out.writelines(lines[1:])
+    return target
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark de carga del catalogo de juegos')
+    parser.add_argument('--scale', type=int, default=1,
+                        help='veces que se replica Data/games.csv')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--variant', help=argparse.SUPPRESS)
+    parser.add_argument('--path', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.variant:
+        print(json.dumps(run_variant(args.variant, args.path, args.repeat)))
+        return
+
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        VARIANTS.pop('load_games[pyarrow]')
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = make_scaled_csv(args.scale, tmp)
+        print(f'{"variante":<22}{"filas":>10}{"mejor [s]":>12}'
+              f'{"pico RSS [MB]":>16}{"DataFrame [MB]":>16}')
+        for name in VARIANTS:
+            out = subprocess.run(
+                [sys.executable, __file__, '--variant', name,
+                 '--path', str(path), '--repeat', str(args.repeat)],
+                check=True, capture_output=True, text=True)
+            r = json.loads(out.stdout)
+            print(f'{r["variant"]:<22}{r["rows"]:>10}{r["best_s"]:>12.3f}'
+                  f'{r["peak_rss_mb"]:>16.1f}{r["frame_mb"]:>16.1f}')
+
+
+if __name__ == '__main__':
+    main()
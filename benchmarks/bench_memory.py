@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Perfil de memoria de la tabla de juegos: notebook original (object +
+# float64 + copias de df_recent/recent_years/ps4_games) vs load_games vs
+# load_games(compact=True) con subconjuntos como arreglos de posiciones.
+#
+# Uso:
+#   python benchmarks/bench_memory.py --scale 10
+
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / 'src'))
+
+from bench_load import legacy_load, make_scaled_csv  # noqa: E402
+from videogame_sales.compact import (  # noqa: E402
+    column_profile, memory_profile, subset_positions)
+from videogame_sales.loader import load_games  # noqa: E402
+
+
+def notebook_objects(df):
+    # Las copias que arma el notebook original
+    recent = df[df['year_of_release'] >= 1995]
+    return {
+        'df': df,
+        'df_recent': recent,
+        'recent_years': recent[recent['year_of_release'] >= 2010],
+        'ps4_games': recent[recent['platform'] == 'PS4'],
+    }
+
+
+def compact_objects(df):
+    years = df['year_of_release']
+    recent = (years >= 1995).fillna(False)
+    return {
+        'df': df,
+        'df_recent': subset_positions(recent),
+        'recent_years': subset_positions(recent & (years >= 2010)
+                                         .fillna(False)),
+        'ps4_games': subset_positions(recent & (df['platform'] == 'PS4')),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Perfil de memoria de la tabla de juegos')
+    parser.add_argument('--scale', type=int, default=1,
+                        help='veces que se replica Data/games.csv')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = make_scaled_csv(args.scale, tmp)
+        variants = {
+            'notebook': notebook_objects(legacy_load(path)),
+            'load_games': notebook_objects(load_games(path)),
+            'compact': compact_objects(load_games(path, compact=True)),
+        }
+
+    profiles = {name: memory_profile(objects)
+                for name, objects in variants.items()}
+    summary = pd.DataFrame({
+        name: {'bytes/fila (df)': p.loc['df', 'bytes_per_row'],
+               'MB df': p.loc['df', 'bytes'] / 2**20,
+               'MB subconjuntos': p['bytes'].drop('df').sum() / 2**20,
+               'MB total': p['bytes'].sum() / 2**20}
+        for name, p in profiles.items()})
+    pd.set_option('display.float_format', '{:.2f}'.format)
+    print(summary)
+
+    for name in ('notebook', 'compact'):
+        print(f'\nBytes por columna ({name}):')
+        print(column_profile(variants[name]['df']))
+
+
+if __name__ == '__main__':
+    main()
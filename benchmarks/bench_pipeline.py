@@ -0,0 +1,246 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Benchmark por etapas del pipeline (carga, limpieza, reporte, agregaciones,
+# correlaciones, pruebas t, graficos) con catalogos sinteticos de N filas.
+# Cada tamaño corre en un subproceso nuevo; por etapa se guarda el mejor
+# tiempo y el pico de memoria asignada (tracemalloc, en una pasada aparte),
+# y por tamaño el pico RSS del proceso. Los resultados van a
+# benchmarks/results/<label>.json; con --compare se contrastan contra una
+# corrida anterior y el script sale con codigo 1 si alguna etapa empeoro
+# mas que --threshold.
+# Los CSV sinteticos se guardan en Data/.cache/synthetic/ y se reutilizan.
+# --rows 0 usa Data/games.csv tal cual.
+#
+# Uso:
+#   python benchmarks/bench_pipeline.py --rows 0 1000000 --label base
+#   python benchmarks/bench_pipeline.py --rows 0 1000000 \
+#       --compare benchmarks/results/base.json
+
+import argparse
+import json
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+import matplotlib
+matplotlib.use('Agg')
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / 'src'))
+
+from videogame_sales import aggregations as agg  # noqa: E402
+from videogame_sales.correlations import grouped_correlations  # noqa: E402
+from videogame_sales.loader import (  # noqa: E402
+    COLUMN_DTYPES, DEFAULT_PATH, NA_VALUES, clean_games)
+from videogame_sales.render import render_figures  # noqa: E402
+from videogame_sales.report import build_report  # noqa: E402
+from videogame_sales.stats import pairwise_welch_tests  # noqa: E402
+from videogame_sales.synthetic import write_synthetic_csv  # noqa: E402
+
+RESULTS_DIR = ROOT / 'benchmarks' / 'results'
+SYNTHETIC_DIR = DEFAULT_PATH.parent / '.cache' / 'synthetic'
+
+# Diferencias de tiempo menores a esto se consideran ruido
+MIN_DELTA_S = 0.05
+
+
+def stage_load(state):
+    state['raw'] = pd.read_csv(state['path'], dtype=COLUMN_DTYPES,
+                               na_values=NA_VALUES)
+
+
+def stage_clean(state):
+    state['df'] = clean_games(state['raw'])
+
+
+def stage_report(state):
+    state['report'] = build_report(state['df'])
+
+
+def stage_aggregations(state):
+    recent = agg.filter_since(state['df'], agg.RECENT_YEAR)
+    agg.games_per_year(state['df'])
+    agg.platform_year_sales(recent)
+    agg.genre_stats(recent)
+    agg.esrb_sales(recent)
+    for region in agg.REGION_COLUMNS:
+        agg.top_platforms(recent, region, 5)
+        agg.top_genres(recent, region, 5)
+
+
+def stage_correlations(state):
+    grouped_correlations(agg.filter_since(state['df'], agg.RECENT_YEAR),
+                         'platform')
+
+
+def stage_ttests(state):
+    recent = agg.filter_since(state['df'], agg.RECENT_YEAR)
+    pairwise_welch_tests(recent, 'user_score', 'platform')
+    pairwise_welch_tests(recent, 'user_score', 'genre')
+
+
+def stage_plotting(state):
+    with tempfile.TemporaryDirectory() as tmp:
+        render_figures(state['df'], state['report'], tmp, force=True)
+
+
+STAGES = {
+    'load': stage_load,
+    'clean': stage_clean,
+    'report': stage_report,
+    'aggregations': stage_aggregations,
+    'correlations': stage_correlations,
+    'ttests': stage_ttests,
+    'plotting': stage_plotting,
+}
+
+
+def run_stages(path, repeat):
+    # Los tiempos se toman sin tracemalloc (su costo por asignacion los
+    # distorsiona); el pico de memoria sale de una pasada extra con trazas
+    state = {'path': path}
+    results = []
+    for name, stage in STAGES.items():
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            stage(state)
+            times.append(time.perf_counter() - start)
+        tracemalloc.start()
+        stage(state)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        results.append({'stage': name, 'best_s': min(times),
+                        'peak_mb': peak / 2**20})
+    return {
+        'rows': len(state['df']),
+        'stages': results,
+        'peak_rss_mb':
+            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def dataset(rows, seed, regenerate):
+    if rows == 0:
+        return DEFAULT_PATH
+    path = SYNTHETIC_DIR / f'games_{rows}_s{seed}.csv'
+    if regenerate or not path.exists():
+        write_synthetic_csv(path, rows, seed)
+    return path
+
+
+def git_revision():
+    try:
+        out = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'],
+                             cwd=ROOT, check=True, capture_output=True,
+                             text=True)
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+    return out.stdout.strip()
+
+
+def environment():
+    return {
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'matplotlib': matplotlib.__version__,
+        'machine': platform.machine(),
+    }
+
+
+def compare(baseline, current, threshold):
+    """Filas (rows, etapa, antes, ahora, razon, regresion)."""
+    before = {(run['requested_rows'], s['stage']): s
+              for run in baseline['runs'] for s in run['stages']}
+    table = []
+    for run in current['runs']:
+        for stage in run['stages']:
+            old = before.get((run['requested_rows'], stage['stage']))
+            if old is None:
+                continue
+            ratio = stage['best_s'] / max(old['best_s'], 1e-9)
+            worse = (ratio > 1 + threshold
+                     and stage['best_s'] - old['best_s'] > MIN_DELTA_S)
+            table.append((run['requested_rows'], stage['stage'],
+                          old['best_s'], stage['best_s'], ratio, worse))
+    return table
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark por etapas del pipeline')
+    parser.add_argument('--rows', type=int, nargs='+', default=[0, 1_000_000],
+                        help='filas del catalogo sintetico (0 = original)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--label', default=None,
+                        help='nombre del archivo de resultados '
+                             '(por defecto, la revision de git)')
+    parser.add_argument('--compare', type=Path, default=None,
+                        help='resultados anteriores para comparar')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='aumento relativo de tiempo tolerado')
+    parser.add_argument('--regenerate', action='store_true')
+    parser.add_argument('--run', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        print(json.dumps(run_stages(args.run, args.repeat)))
+        return 0
+
+    revision = git_revision()
+    current = {
+        'label': args.label or revision,
+        'revision': revision,
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'environment': environment(),
+        'runs': [],
+    }
+    print(f'{"filas":>10}{"etapa":>14}{"mejor [s]":>12}{"pico [MB]":>12}')
+    for rows in args.rows:
+        path = dataset(rows, args.seed, args.regenerate)
+        out = subprocess.run(
+            [sys.executable, __file__, '--run', str(path),
+             '--repeat', str(args.repeat)],
+            check=True, capture_output=True, text=True)
+        run = json.loads(out.stdout)
+        run['requested_rows'] = rows
+        current['runs'].append(run)
+        for stage in run['stages']:
+            print(f'{run["rows"]:>10}{stage["stage"]:>14}'
+                  f'{stage["best_s"]:>12.3f}{stage["peak_mb"]:>12.1f}')
+        print(f'{run["rows"]:>10}{"pico RSS":>14}{"":>12}'
+              f'{run["peak_rss_mb"]:>12.1f}')
+
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    target = RESULTS_DIR / f'{current["label"]}.json'
+    target.write_text(json.dumps(current, indent=2))
+    print(f'Resultados en {target}')
+
+    if args.compare is None:
+        return 0
+    baseline = json.loads(args.compare.read_text())
+    table = compare(baseline, current, args.threshold)
+    print(f'\nContra {baseline["label"]} ({baseline["revision"]}):')
+    print(f'{"filas":>10}{"etapa":>14}{"antes [s]":>12}{"ahora [s]":>12}'
+          f'{"razon":>8}')
+    for rows, stage, old, new, ratio, worse in table:
+        flag = '  REGRESION' if worse else ''
+        print(f'{rows:>10}{stage:>14}{old:>12.3f}{new:>12.3f}'
+              f'{ratio:>8.2f}{flag}')
+    return 1 if any(row[-1] for row in table) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Benchmark de escalamiento del remuestreo: bootstrap de r de Pearson y
+# permutacion de t de Welch con 1, 2, 4, ... procesos. Con lotes
+# independientes el tiempo deberia bajar casi linealmente con los nucleos.
+#
+# Uso:
+#   python benchmarks/bench_resampling.py --resamples 50000
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / 'src'))
+
+from videogame_sales import load_games_cached  # noqa: E402
+from videogame_sales.aggregations import (  # noqa: E402
+    RECENT_YEAR, filter_since)
+from videogame_sales.resampling import resample  # noqa: E402
+from videogame_sales.stats import group_values  # noqa: E402
+
+
+def worker_counts(limit):
+    counts = [1]
+    while counts[-1] * 2 <= limit:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != limit:
+        counts.append(limit)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark de escalamiento del remuestreo')
+    parser.add_argument('--resamples', type=int, default=20_000)
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    recent = filter_since(load_games_cached(), RECENT_YEAR)
+    scored = recent[['critic_score', 'total_sales']].dropna()
+    cases = {
+        'bootstrap pearson (critic vs ventas)': (
+            'bootstrap', 'pearson',
+            (scored['critic_score'], scored['total_sales'])),
+        'permutation welch_t (Action vs Sports)': (
+            'permutation', 'welch_t',
+            (group_values(recent, 'user_score', 'genre', 'Action'),
+             group_values(recent, 'user_score', 'genre', 'Sports'))),
+    }
+
+    print(f'{args.resamples} remuestreos, hasta {args.max_workers} procesos')
+    for name, (mode, statistic, data) in cases.items():
+        print(f'\n{name}')
+        print(f'{"procesos":>10}{"tiempo [s]":>12}{"aceleracion":>14}'
+              f'{"eficiencia":>12}')
+        base = None
+        for workers in worker_counts(args.max_workers):
+            start = time.perf_counter()
+            resample(mode, statistic, data, args.resamples, workers=workers)
+            elapsed = time.perf_counter() - start
+            base = base or elapsed
+            speedup = base / elapsed
+            print(f'{workers:>10}{elapsed:>12.2f}{speedup:>14.2f}'
+                  f'{speedup / workers:>12.0%}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Benchmark de la dispersion score vs ventas con catalogos grandes:
+# un marcador por juego vs malla 2D vs submuestra estratificada.
+# Las filas se generan remuestreando Data/games.csv con un poco de ruido.
+#
+# Uso:
+#   python benchmarks/bench_scatter.py --rows 100000 1000000
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import matplotlib
+matplotlib.use('Agg')
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+from matplotlib import pyplot as plt  # noqa: E402
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / 'src'))
+
+from videogame_sales import load_games_cached  # noqa: E402
+from videogame_sales.plots import score_vs_sales  # noqa: E402
+
+
+def synthetic_scores(rows, seed=0):
+    games = load_games_cached()[['critic_score', 'total_sales']].dropna()
+    rng = np.random.default_rng(seed)
+    idx = rng.integers(0, len(games), rows)
+    critic = games['critic_score'].to_numpy(dtype='float64')[idx]
+    sales = games['total_sales'].to_numpy(dtype='float64')[idx]
+    return pd.DataFrame({
+        'critic_score': critic + rng.normal(0, 1.0, rows),
+        'total_sales': np.abs(sales * rng.lognormal(0, 0.1, rows)),
+    })
+
+
+def time_mode(df, mode, directory):
+    start = time.perf_counter()
+    fig = score_vs_sales(df, 'critic_score', 'Ventas vs critica',
+                         'Calificacion de Critica', mode=mode)
+    path = Path(directory) / f'{mode}.png'
+    fig.savefig(path)
+    plt.close(fig)
+    return time.perf_counter() - start, path.stat().st_size / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark de dispersiones grandes')
+    parser.add_argument('--rows', type=int, nargs='+',
+                        default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--modes', nargs='+',
+                        default=['points', 'hist2d', 'sample'])
+    args = parser.parse_args()
+
+    # Calentamos imports de seaborn/matplotlib fuera de la medicion
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode in args.modes:
+            time_mode(synthetic_scores(100), mode, tmp)
+
+    print(f'{"filas":>10}{"modo":>10}{"tiempo [s]":>12}{"PNG [KB]":>10}')
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in args.rows:
+            df = synthetic_scores(rows)
+            for mode in args.modes:
+                elapsed, size = time_mode(df, mode, tmp)
+                print(f'{rows:>10}{mode:>10}{elapsed:>12.2f}{size:>10.0f}')
+
+
+if __name__ == '__main__':
+    main()
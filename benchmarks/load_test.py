@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Prueba de carga del servicio HTTP. Por defecto arranca el servicio en este
+# mismo proceso en un puerto libre; con --url se prueba uno ya corriendo.
+# Manda peticiones concurrentes a una mezcla de endpoints y verifica los
+# objetivos de latencia (sale con codigo 1 si no se cumplen).
+#
+# Uso:
+#   python benchmarks/load_test.py --requests 2000 --concurrency 16 --p95-ms 50
+
+import argparse
+import statistics
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / 'src'))
+
+# Consultas tipicas del reporte con distintos parametros, para mezclar
+# aciertos y fallos del cache
+QUERIES = [
+    '/top?region={region}&since={year}&n=5',
+    '/top?by=genre&region={region}&since={year}&n=10',
+    '/genres?region={region}&since={year}',
+    '/esrb?since={year}',
+    '/correlations?by=platform&since={year}',
+    '/welch?by=platform&a=XOne&b=PC&since={year}',
+    '/welch/pairs?by=genre&since={year}',
+]
+REGIONS = ['na_sales', 'eu_sales', 'jp_sales', 'total_sales']
+YEARS = range(1995, 2015)
+
+
+def query_mix(count):
+    paths = []
+    for i in range(count):
+        template = QUERIES[i % len(QUERIES)]
+        paths.append(template.format(region=REGIONS[i % len(REGIONS)],
+                                     year=YEARS[(i // 7) % len(YEARS)]))
+    return paths
+
+
+def start_local_server():
+    from videogame_sales import load_games_cached
+    from videogame_sales.service import QueryService, make_server
+
+    service = QueryService(load_games_cached())
+    service.warm()
+    server = make_server(service, port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f'http://127.0.0.1:{server.server_address[1]}'
+
+
+def fetch(url):
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(url) as response:
+            response.read()
+            status = response.status
+    except urllib.error.HTTPError as exc:
+        # 4xx/5xx: se cuentan como errores en lugar de abortar la prueba
+        exc.read()
+        status = exc.code
+    return status, (time.perf_counter() - start) * 1000
+
+
+def percentile(values, q):
+    return statistics.quantiles(values, n=100)[q - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Prueba de carga del servicio HTTP')
+    parser.add_argument('--url', help='servicio ya corriendo')
+    parser.add_argument('--requests', type=int, default=1000)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--p50-ms', type=float, default=20.0)
+    parser.add_argument('--p95-ms', type=float, default=100.0)
+    args = parser.parse_args()
+
+    server = None
+    base = args.url
+    if base is None:
+        server, base = start_local_server()
+
+    urls = [base + path for path in query_mix(args.requests)]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        results = list(pool.map(fetch, urls))
+    elapsed = time.perf_counter() - start
+    if server is not None:
+        server.shutdown()
+
+    latencies = [ms for _, ms in results]
+    errors = sum(status != 200 for status, _ in results)
+    p50, p95, p99 = (percentile(latencies, q) for q in (50, 95, 99))
+    print(f'{args.requests} peticiones, {args.concurrency} concurrentes, '
+          f'{elapsed:.2f} s ({args.requests / elapsed:.0f} req/s)')
+    print(f'p50 {p50:.1f} ms  p95 {p95:.1f} ms  p99 {p99:.1f} ms  '
+          f'max {max(latencies):.1f} ms  errores {errors}')
+
+    ok = errors == 0 and p50 <= args.p50_ms and p95 <= args.p95_ms
+    print('objetivos cumplidos' if ok else
+          f'objetivos NO cumplidos (p50 <= {args.p50_ms} ms, '
+          f'p95 <= {args.p95_ms} ms, sin errores)')
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,16 +1,25 @@
 #!/usr/bin/env python
 # coding: utf-8
 
-# Importamos librerias
-import pandas as pd
-import numpy as np
+# Importamos librerias.
+# La logica vive en el paquete videogame_sales; este notebook conserva el
+# recorrido del analisis y muestra los resultados.
 from matplotlib import pyplot as plt
-import seaborn as sns
-from scipy import stats
 
+from videogame_sales import DEFAULT_PATH, load_games_cached
+from videogame_sales import aggregations as agg
+from videogame_sales import lifecycle, plots
+from videogame_sales.cube import SalesCube
+from videogame_sales.query import GamesQuery
+from videogame_sales.stats import ALPHA, welch_ttest
 
-# Cargamos el archivo con el que trabajaremos
-df = pd.read_csv('/datasets/games.csv')
+
+# Cargamos el archivo con el que trabajaremos.
+# load_games declara el esquema desde la lectura: columnas en snake_case,
+# 'tbd' de user_score como NaN, year_of_release y critic_score como enteros
+# nullables, plataforma/genero/rating como categorias y ventas en float32.
+# La tabla limpia se guarda en Data/.cache y se reutiliza mientras el CSV no cambie.
+df = load_games_cached(DEFAULT_PATH)
 
 
 # **Podemos observar los datos del archivo con el cual estaremos trabajando, observamos distintas columnas como nombre, plataforma año de lanzamiento, ventas por region, critica, entre otros. Asi como valores ausentes en algunas de nuestras columnas**
@@ -19,46 +28,21 @@ df = pd.read_csv('/datasets/games.csv')
 
 
 # Preparando los datos
-
-# Le daré formato snake_case a los nombres de todas las columnas
-df.columns = df.columns.str.lower().str.replace(' ', '_')
 df.info()
 df.describe()
 
 
-# **Vamos a comenzar a corregir algunos tipos de datos. Voy a tratar los valores 'tbd' que existen en la columna 'user_score' como valores ausentes para poder trabajar con la columna de manera numerica.**:
-
-# In[34]:
-
-
-# Convertimos 'tbd' en valores NaN y convertimos a tipo float
-df['user_score'] = df['user_score'].replace('tbd', np.nan)
-df['user_score'] = df['user_score'].astype(float)
-
-# Convertiremos la columna year_of_release en Int64, asi como critic_score
-df['year_of_release'] = df['year_of_release'].astype('Int64')
-df['critic_score'] = df['critic_score'].astype('Int64')
-df.info()
-
+# **Los valores 'tbd' que existen en la columna 'user_score' se tratan como valores ausentes para poder trabajar con la columna de manera numerica.**
 
 # **Haciendo un breve analisis de los valores ausentes y como los vamos a tratar he determinado que los valores nulos de la columna 'name' coinciden con la columna 'genre', por lo que considero oportuno eliminar estas filas ya que las ventas del videojuego son minimas (no afectaria en los analisis estadisticos), no tiene reseñas y tenemos datos incompletos, por lo tanto, el dato no sirve.
 # Por otro lado, la columna 'year_of_release' tambien tiene valores nulos, probablemente los juegos son poco conocidos o hubo errores al obtener la informacion; por lo que prefiero dejarlos como NaN y no inventar datos.
 # En las columnas critic_score, user_score y rating también tienen muchos valores nulos, puede que no todos los criticos o usuarios opinen sobre el juego, algunos no tienen clasificacion ESRB, por lo que prefiero dejar los valores ausentes como NaN y no sesgar los analisis.**
 
-# In[35]:
-
-
-# Eliminamos filas donde name y genre estan nulos
-df.dropna(subset=['name', 'genre'], inplace=True)
-df.info()
-
+# **El cargador ya elimina las filas donde name y genre estan nulos y calcula las ventas totales (total_sales) de cada juego.**
 
 # In[36]:
 
 
-# Procederemos a calcular las ventas totales para cada juego
-df['total_sales'] = df['na_sales'] + \
-    df['eu_sales'] + df['jp_sales'] + df['other_sales']
 df.head()
 
 
@@ -68,21 +52,14 @@ df.head()
 
 
 # Calculamos cuantos juegos se lanzaron en diferentes años
-games_per_year = df['year_of_release'].value_counts(
-).sort_index(ascending=False)
+games_per_year = agg.games_per_year(df)
 
 
 # In[38]:
 
 
 # Graficando
-plt.figure(figsize=(10, 5))
-plt.bar(games_per_year.index, games_per_year.values)
-plt.xlabel('Año de lanzamiento')
-plt.ylabel('Numero de juegos lanzados')
-plt.title('Cantidad de juegos lanzados por año')
-plt.grid(axis='y')
-plt.tight_layout()
+plots.games_per_year(games_per_year)
 plt.show()
 
 
@@ -94,36 +71,27 @@ plt.show()
 
 
 # Aplicamos el filtro para mayores de 1995.
-df_recent = df[df['year_of_release'] >= 1995]
+# GamesQuery guarda cada subconjunto filtrado para no volver a armarlo.
+games = GamesQuery(df)
+df_recent = games.select(since=agg.RECENT_YEAR)
 
 
 # In[40]:
 
 
 # Calculamos las ventas totales por plataforma a lo largo del tiempo
-platform_year_sales = df_recent.groupby(['year_of_release', 'platform'])[
-    'total_sales'].sum().reset_index()
+platform_year_sales = agg.platform_year_sales(df_recent)
 
 # Filtramos las plataformas mas exitosas
-# Agregamos .index al final ya que solo necesitamos los nombres de las plataformas.
-top_platforms = df_recent.groupby('platform')['total_sales'].sum(
-).sort_values(ascending=False).head(10).index
-platform_year_sales_top = platform_year_sales[platform_year_sales['platform'].isin(
-    top_platforms)]
+platform_year_sales_top = agg.top_platform_series(platform_year_sales, 10)
 
 
 # In[41]:
 
 
 # Obtenemos el gráfico
-plt.figure(figsize=(12, 6))
-sns.lineplot(data=platform_year_sales_top, x='year_of_release',
-             y='total_sales', hue='platform')
-plt.title('Ventas totales por año y plataforma')
-plt.xlabel('Año de lanzamiento')
-plt.ylabel('Ventas globales [M]')
-plt.grid(True)
-plt.tight_layout()
+plots.platform_sales_trend(platform_year_sales_top,
+                           'Ventas totales por año y plataforma')
 plt.show()
 
 
@@ -135,27 +103,17 @@ plt.show()
 
 
 # Creamos un filtro desde 2010 en adelante
-recent_years = df_recent[df_recent['year_of_release'] >= 2010]
+recent_years = games.select(since=agg.TRENDS_YEAR)
 
 # Agrupamos por año y plataforma
-platform_trends = recent_years.groupby(['year_of_release', 'platform'])[
-    'total_sales'].sum().reset_index()
+platform_trends = agg.platform_year_sales(recent_years)
 
 # Plataformas que son frecuentes desde 2010
-top_recent_platforms = (platform_trends.groupby('platform')[
-                        'total_sales'].sum().sort_values(ascending=False).head(6).index)
-platform_trends_top = platform_trends[platform_trends['platform'].isin(
-    top_recent_platforms)]
+platform_trends_top = agg.top_platform_series(platform_trends, 6)
 
 # Obtenemos la grafica
-plt.figure(figsize=(12, 6))
-sns.lineplot(data=platform_trends_top, x='year_of_release',
-             y='total_sales', hue='platform')
-plt.title('Tendencia de ventar por plataforma (desde 2010)')
-plt.xlabel('Año de lanzamiento')
-plt.ylabel('Ventas globales [M]')
-plt.grid(True)
-plt.tight_layout()
+plots.platform_sales_trend(platform_trends_top,
+                           'Tendencia de ventar por plataforma (desde 2010)')
 plt.show()
 
 
@@ -168,21 +126,19 @@ plt.show()
 # In[43]:
 
 
-# Filtramos los datos desde 2010
-recent_years = df_recent[df_recent['year_of_release'] >= 2010]
-
-# Agrupamos por plataformas mas importantes
-active_platforms = ['PS4', 'XOne', '3DS']
-recent_platforms_data = recent_years[recent_years['platform'].isin(
-    active_platforms)]
+# Agrupamos por plataformas mas importantes.
+# La regla de lifecycle elige las que siguen vendiendo en el ultimo año, con
+# al menos 10% de las ventas de ese año y sin pasar la vida tipica de las
+# plataformas retiradas (resultado: PS4, XOne y 3DS).
+lifecycles = lifecycle.platform_lifecycles(SalesCube.from_frame(df))
+print(f"Vida tipica de una plataforma: {lifecycle.typical_lifespan(lifecycles):.1f} años")
+active_platforms = lifecycle.active_platforms(lifecycles)
+recent_platforms_data = games.select(since=agg.TRENDS_YEAR,
+                                     platforms=active_platforms)
 
 # Creamos los diagramas de caja
-plt.figure(figsize=(12, 6))
-sns.boxplot(data=recent_platforms_data, x='platform', y='total_sales')
-plt.title('Distribución de ventas por plataforma (2010-2016)')
-plt.xlabel('Plataforma')
-plt.ylabel('Ventas globales [M]')
-plt.grid(True)
+plots.sales_boxplot(recent_platforms_data, active_platforms,
+                    'Distribución de ventas por plataforma (2010-2016)')
 plt.show()
 
 
@@ -194,25 +150,19 @@ plt.show()
 
 
 # Analizaremos como las reseñas afectan las ventas
-ps4_games = df_recent[df_recent['platform'] == 'PS4']
+ps4_games = games.select(since=agg.RECENT_YEAR, platforms=['PS4'])
 ps4_games[['critic_score', 'user_score', 'total_sales']].isna().sum()
 
 # Graficamos User Score vs Total Sales
-plt.figure(figsize=(12, 5))
-sns.scatterplot(data=ps4_games, x='user_score', y='total_sales', alpha=0.5)
-plt.title('PS4 Ventas vs Calificaciones de Usuarios')
-plt.xlabel('Calificacion de Usuario')
-plt.ylabel('Ventas Globales [M]')
-plt.grid(True)
+plots.score_vs_sales(ps4_games, 'user_score',
+                     'PS4 Ventas vs Calificaciones de Usuarios',
+                     'Calificacion de Usuario')
 plt.show()
 
 # Grafico de Critic Score vs Total Sales
-plt.figure(figsize=(12, 5))
-sns.scatterplot(data=ps4_games, x='critic_score', y='total_sales', alpha=0.5)
-plt.title('PS4 Ventas vs Calificaciones Criticas')
-plt.xlabel('Calificacion de Critica')
-plt.ylabel('Ventas Globales [M]')
-plt.grid(True)
+plots.score_vs_sales(ps4_games, 'critic_score',
+                     'PS4 Ventas vs Calificaciones Criticas',
+                     'Calificacion de Critica')
 plt.show()
 
 
@@ -223,17 +173,11 @@ plt.show()
 # In[45]:
 
 
-# Filtramos por PS4 y quitamos los NaN
-ps4 = df_recent[df_recent['platform'] == 'PS4'][[
-    'user_score', 'critic_score', 'total_sales']].dropna()
-ps4 = ps4.astype(float)
-
-# Obtenemos Correlaciones
-cor_user = ps4['user_score'].corr(ps4['total_sales'])
-cor_critic = ps4['critic_score'].corr(ps4['total_sales'])
+# Obtenemos Correlaciones para PS4
+ps4_corr = agg.score_correlations(df_recent, ['PS4'])['PS4']
 
-print(f"Correlación entre user_score y total_sales: {cor_user:.2f}")
-print(f"Correlación entre critic_score y total_sales: {cor_critic:.2f}")
+print(f"Correlación entre user_score y total_sales: {ps4_corr['User Score Corr']:.2f}")
+print(f"Correlación entre critic_score y total_sales: {ps4_corr['Critic Score Corr']:.2f}")
 
 
 # **Podemos observar que para la correlacion entre user_score y total sales es de -0.03, este valor es casi 0, por lo que podemos afirmar que las calificaciones de los usuarios no estan relacionadas con las ventas**
@@ -244,25 +188,7 @@ print(f"Correlación entre critic_score y total_sales: {cor_critic:.2f}")
 
 
 # Comparamos las relaciones con las otras plataformas populares:
-
-platforms_to_check = ['PS4', 'XOne', '3DS']
-
-# Creamos un diccionario para guardar los resultados
-correlations = {}
-
-for platform in platforms_to_check:
-    subset = df_recent[df_recent['platform'] == platform][[
-        'user_score', 'critic_score', 'total_sales']].dropna()
-    subset = subset.astype(float)  # Asegura que los datos sean numéricos
-    user_corr = subset['user_score'].corr(subset['total_sales'])
-    critic_corr = subset['critic_score'].corr(subset['total_sales'])
-    correlations[platform] = {
-        'User Score Corr': user_corr,
-        'Critic Score Corr': critic_corr
-    }
-
-# Mostramos los resultados
-correlation_df = pd.DataFrame(correlations)  # Convertimos a DF el diccionario
+correlation_df = agg.score_correlations(df_recent, active_platforms)
 print(correlation_df)
 
 
@@ -272,62 +198,24 @@ print(correlation_df)
 
 
 # Pasamos con la comparacion de la distribucion general de los juegos por genero
-
-# Numero de juegos por genero
-genre_counts = df_recent['genre'].value_counts()
-
-# Ventas totales por genero
-genre_sales = df_recent.groupby(
-    'genre')['total_sales'].sum().sort_values(ascending=False)
-
-# Calculamos media y mediana de ventas por genero
-genre_mean_sales = df_recent.groupby(
-    'genre')['total_sales'].mean().sort_values(ascending=False)
-genre_median_sales = df_recent.groupby(
-    'genre')['total_sales'].median().sort_values(ascending=False)
+genre_stats = agg.genre_stats(df_recent)
 
 # Mostramos los resultados
 print("Número de juegos por género:")
-print(genre_counts)
+print(genre_stats['count'])
 print("\nVentas globales totales por género:")
-print(genre_sales)
+print(genre_stats['total'].sort_values(ascending=False))
 print("\nPromedio de ventas por género:")
-print(genre_mean_sales)
+print(genre_stats['mean'].sort_values(ascending=False))
 print("\nMediana de ventas por género:")
-print(genre_median_sales)
+print(genre_stats['median'].sort_values(ascending=False))
 
 
 # In[48]:
 
 
 # Graficando los resultados
-plt.figure(figsize=(14, 6))
-
-# Cantidad de juegos por genero
-plt.subplot(1, 3, 1)
-sns.barplot(x=genre_counts.values, y=genre_counts.index,
-            alpha=0.7, palette='viridis')
-plt.title('Número de juegos por género')
-plt.xlabel('Número de juegos')
-plt.ylabel('Género')
-
-# Ventas totales por genero
-plt.subplot(1, 3, 2)
-sns.barplot(x=genre_sales.values, y=genre_sales.index,
-            alpha=0.7, palette='plasma')
-plt.title('Ventas totales por género')
-plt.xlabel('Ventas globales [M]')
-plt.ylabel('Género')
-
-# Promedio de ventas por genero
-plt.subplot(1, 3, 3)
-sns.barplot(x=genre_mean_sales.values, y=genre_mean_sales.index,
-            alpha=0.7, palette='magma')
-plt.title('Promedio de ventas por género')
-plt.xlabel('Promedio de ventas [M]')
-plt.ylabel('Género')
-
-plt.tight_layout()
+plots.genre_overview(genre_stats)
 plt.show()
 
 
@@ -341,45 +229,24 @@ plt.show()
 
 
 # Agruparemos las ventas por región y plataforma para ver cuales dominan en cada mercado
-top_platforms_na = df_recent.groupby(
-    'platform')['na_sales'].sum().sort_values(ascending=False).head(5)
-top_platforms_eu = df_recent.groupby(
-    'platform')['eu_sales'].sum().sort_values(ascending=False).head(5)
-top_platforms_jp = df_recent.groupby(
-    'platform')['jp_sales'].sum().sort_values(ascending=False).head(5)
+top_platforms_region = {region: agg.top_platforms(df_recent, region, n=10)
+                        for region in agg.REGION_COLUMNS}
 
 # Mostramos los resultados
-print("Top 5 plataformas en NA:\n", top_platforms_na)
-print("\nTop 5 plataformas en EU:\n", top_platforms_eu)
-print("\nTop 5 plataformas en JP:\n", top_platforms_jp)
+print("Top 5 plataformas en NA:\n", top_platforms_region['na_sales'].head(5))
+print("\nTop 5 plataformas en EU:\n", top_platforms_region['eu_sales'].head(5))
+print("\nTop 5 plataformas en JP:\n", top_platforms_region['jp_sales'].head(5))
 
 
 # In[50]:
 
 
-# Creamos una figura con 3 subplots
-fig, axes = plt.subplots(1, 3, figsize=(20, 6))
-
-# Norteamérica
-df_recent.groupby('platform')['na_sales'].sum().sort_values(
-    ascending=False).head(10).plot(kind='bar', ax=axes[0], color='skyblue')
-axes[0].set_title('Ventas por plataforma en Norteamérica')
-axes[0].set_ylabel('Ventas en millones')
-axes[0].set_xlabel('Plataforma')
-
-# Europa
-df_recent.groupby('platform')['eu_sales'].sum().sort_values(
-    ascending=False).head(10).plot(kind='bar', ax=axes[1], color='lightgreen')
-axes[1].set_title('Ventas por plataforma en Europa')
-axes[1].set_xlabel('Plataforma')
-
-# Japón
-df_recent.groupby('platform')['jp_sales'].sum().sort_values(
-    ascending=False).head(10).plot(kind='bar', ax=axes[2], color='salmon')
-axes[2].set_title('Ventas por plataforma en Japón')
-axes[2].set_xlabel('Plataforma')
-
-plt.tight_layout()
+# Creamos una figura con 3 subplots (NA, EU, JP)
+plots.region_bars(
+    [top_platforms_region[region] for region in agg.REGION_COLUMNS],
+    ['Ventas por plataforma en Norteamérica', 'Ventas por plataforma en Europa',
+     'Ventas por plataforma en Japón'],
+    ['skyblue', 'lightgreen', 'salmon'], 'Plataforma')
 plt.show()
 
 
@@ -391,28 +258,11 @@ plt.show()
 # Analisis por género y región
 
 # Gráficas de ventas por género en cada región
-fig, axes = plt.subplots(1, 3, figsize=(20, 6))
-
-# NA
-df_recent.groupby('genre')['na_sales'].sum().sort_values(ascending=False).head(
-    10).plot(kind='bar', ax=axes[0], color='mediumslateblue')
-axes[0].set_title('Ventas por género en NA')
-axes[0].set_ylabel('Ventas en millones')
-axes[0].set_xlabel('Género')
-
-# EU
-df_recent.groupby('genre')['eu_sales'].sum().sort_values(ascending=False).head(
-    10).plot(kind='bar', ax=axes[1], color='mediumseagreen')
-axes[1].set_title('Ventas por género en EU')
-axes[1].set_xlabel('Género')
-
-# JP
-df_recent.groupby('genre')['jp_sales'].sum().sort_values(
-    ascending=False).head(10).plot(kind='bar', ax=axes[2], color='coral')
-axes[2].set_title('Ventas por género en JP')
-axes[2].set_xlabel('Género')
-
-plt.tight_layout()
+plots.region_bars(
+    [agg.top_genres(df_recent, region, n=10) for region in agg.REGION_COLUMNS],
+    ['Ventas por género en NA', 'Ventas por género en EU',
+     'Ventas por género en JP'],
+    ['mediumslateblue', 'mediumseagreen', 'coral'], 'Género')
 plt.show()
 
 
@@ -424,19 +274,10 @@ plt.show()
 # Clasificacion ESRB
 
 # Ventas promedio por clasificacion ESRB y región
-esrb_sales = df_recent.pivot_table(
-    index='rating', values=['na_sales', 'eu_sales', 'jp_sales'], aggfunc='mean')
-# Para que salga ordenado el grafico
-esrb_sales = esrb_sales[['na_sales', 'eu_sales', 'jp_sales']]
+esrb_sales = agg.esrb_sales(df_recent)
 
 # Graficando
-esrb_sales.plot(kind='bar', figsize=(10, 6))
-plt.title('Ventas promedio por clasificacion ESRB y región')
-plt.xlabel('Clasificación ESRB')
-plt.ylabel('Ventas promedio [M]')
-plt.grid(axis='y')
-plt.xticks(rotation=0)
-plt.tight_layout()
+plots.esrb_sales(esrb_sales)
 plt.show()
 
 
@@ -466,15 +307,9 @@ df_recent['rating'].value_counts()
 # In[54]:
 
 
-# Filtramos los puntajes de usuario por plataforma
-xone_scores = df_recent[(df_recent['platform'] == 'XOne') & (
-    df_recent['user_score'].notna())]['user_score']
-pc_scores = df_recent[(df_recent['platform'] == 'PC') & (
-    df_recent['user_score'].notna())]['user_score']
-
-# Realizamos la prueba de hipotesis
-alpha = 0.05
-results = stats.ttest_ind(xone_scores, pc_scores, equal_var=False)
+# Realizamos la prueba de hipotesis con los puntajes de usuario de XOne y PC
+alpha = ALPHA
+results = welch_ttest(df_recent, 'user_score', 'platform', 'XOne', 'PC')
 
 print(f"p-valor: {results.pvalue:}")
 
@@ -499,14 +334,8 @@ else:
 # In[55]:
 
 
-# Filtramos los puntajes por genero
-action_scores = df_recent[(df_recent['genre'] == 'Action') & (
-    df_recent['user_score'].notna())]['user_score']
-sports_scores = df_recent[(df_recent['genre'] == 'Sports') & (
-    df_recent['user_score'].notna())]['user_score']
-
-# Realizamos la prueba de hipotesis
-results_genre = stats.ttest_ind(action_scores, sports_scores, equal_var=False)
+# Realizamos la prueba de hipotesis con los puntajes de Action y Sports
+results_genre = welch_ttest(df_recent, 'user_score', 'genre', 'Action', 'Sports')
 
 print(f"p-valor: {results_genre.pvalue:}")
 
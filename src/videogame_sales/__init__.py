@@ -0,0 +1,10 @@
+# coding: utf-8
+
+# Analisis del mercado de videojuegos como paquete importable.
+# Importar el paquete solo carga pandas; matplotlib, seaborn y scipy se
+# importan hasta que se pide un grafico o una prueba estadistica.
+
+from .cache import load_games_cached
+from .loader import DEFAULT_PATH, load_games
+
+__all__ = ['DEFAULT_PATH', 'load_games', 'load_games_cached']
@@ -0,0 +1,88 @@
+# coding: utf-8
+
+# Agregaciones del analisis (solo pandas, sin graficos ni scipy).
+
+import pandas as pd
+
+
+# A partir de 1995 la produccion de juegos despega; desde 2010 son
+# las tendencias "actuales" que usamos para planear 2017
+RECENT_YEAR = 1995
+TRENDS_YEAR = 2010
+
+REGION_COLUMNS = ['na_sales', 'eu_sales', 'jp_sales']
+SCORE_COLUMNS = ['user_score', 'critic_score']
+
+# Eleccion del notebook; lifecycle.active_platforms la calcula por regla
+ACTIVE_PLATFORMS = ['PS4', 'XOne', '3DS']
+
+
+def filter_since(df, year):
+    """Juegos lanzados en `year` o despues (los años nulos quedan fuera)."""
+    return df[df['year_of_release'] >= year]
+
+
+def filter_platforms(df, platforms):
+    return df[df['platform'].isin(platforms)]
+
+
+def games_per_year(df):
+    """Cantidad de juegos lanzados por año, del mas reciente al mas antiguo."""
+    return df['year_of_release'].value_counts().sort_index(ascending=False)
+
+
+def platform_year_sales(df):
+    """Ventas totales por año y plataforma en formato largo."""
+    return df.groupby(['year_of_release', 'platform'], observed=True)[
+        'total_sales'].sum().reset_index()
+
+
+def top_platforms(df, column='total_sales', n=10):
+    """Las `n` plataformas con mas ventas en `column`."""
+    return df.groupby('platform', observed=True)[column].sum().sort_values(
+        ascending=False).head(n)
+
+
+def top_platform_series(year_sales, n):
+    """Filtra `platform_year_sales` a las `n` plataformas con mas ventas."""
+    top = year_sales.groupby('platform', observed=True)[
+        'total_sales'].sum().sort_values(ascending=False).head(n).index
+    return year_sales[year_sales['platform'].isin(top)]
+
+
+def top_genres(df, column='total_sales', n=10):
+    return df.groupby('genre', observed=True)[column].sum().sort_values(
+        ascending=False).head(n)
+
+
+def genre_stats(df):
+    """Numero de juegos y ventas totales/promedio/mediana por genero."""
+    grouped = df.groupby('genre', observed=True)['total_sales']
+    stats = pd.DataFrame({
+        'count': grouped.size(),
+        'total': grouped.sum(),
+        'mean': grouped.mean(),
+        'median': grouped.median(),
+    })
+    return stats.sort_values('count', ascending=False)
+
+
+def esrb_sales(df):
+    """Ventas promedio por clasificacion ESRB y region."""
+    pivot = df.pivot_table(index='rating', values=REGION_COLUMNS,
+                           aggfunc='mean', observed=True)
+    return pivot[REGION_COLUMNS]
+
+
+def score_correlations(df, platforms, target='total_sales'):
+    """Correlacion de Pearson de user/critic score con las ventas por
+    plataforma (NaN para una plataforma sin juegos calificados)."""
+    from .correlations import grouped_correlations
+
+    table = grouped_correlations(filter_platforms(df, platforms), 'platform',
+                                 target=target, methods=['pearson'])
+    wide = table.pivot(index='score', columns='platform', values='pearson')
+    wide = wide.reindex(index=SCORE_COLUMNS, columns=platforms)
+    wide.index = ['User Score Corr', 'Critic Score Corr']
+    wide.columns.name = None
+    return wide
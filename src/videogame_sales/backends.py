@@ -0,0 +1,388 @@
+# coding: utf-8
+
+# Motores alternativos para las agregaciones del reporte.
+# Cada backend expone las mismas funciones (juegos por año, ventas por año y
+# plataforma, top N por region, estadisticas por genero, promedios ESRB) y
+# devuelve objetos de pandas con la misma forma, de modo que el reporte no
+# depende del motor. sales_cube arma en el motor las celdas del SalesCube;
+# con ese cubo build_report (y `python -m videogame_sales --backend`) corre
+# las mismas funciones del reporte sin pasar las filas por pandas.
+# pandas es el de referencia; Polars (lazy) y DuckDB (embebido) leen el CSV
+# o el Parquet directamente, empujan los filtros de año a la lectura y
+# ejecutan en varios hilos. Polars y DuckDB son opcionales: solo se
+# importan al crear su backend.
+
+from pathlib import Path
+
+import pandas as pd
+
+from . import aggregations as agg
+from .loader import DEFAULT_PATH, SALES_COLUMNS
+
+
+REGIONS = agg.REGION_COLUMNS
+SALES = SALES_COLUMNS
+
+# Agrupaciones y columnas que acepta top_n en todos los backends
+TOP_KEYS = ('platform', 'genre', 'rating')
+TOP_COLUMNS = SALES + ['total_sales']
+
+
+def _is_parquet(path):
+    return Path(path).suffix in ('.parquet', '.pq')
+
+
+def _check_top(column, by):
+    if column not in TOP_COLUMNS or by not in TOP_KEYS:
+        raise ValueError(f'columna no soportada: {column!r}/{by!r}')
+
+
+def _plain_index(obj):
+    # Indices categoricos de pandas -> texto, igual que en los otros motores
+    if isinstance(obj.index, pd.CategoricalIndex):
+        obj = obj.copy()
+        obj.index = obj.index.astype(str)
+    return obj
+
+
+class PandasBackend:
+    """Referencia: load_games + las funciones de aggregations."""
+
+    name = 'pandas'
+
+    def __init__(self, path=DEFAULT_PATH):
+        from .loader import load_games
+
+        if _is_parquet(path):
+            self.df = pd.read_parquet(path)
+        else:
+            self.df = load_games(path)
+
+    def _rows(self, since):
+        return self.df if since is None else agg.filter_since(self.df, since)
+
+    def games_per_year(self, since=None):
+        counts = agg.games_per_year(self._rows(since))
+        counts.index = counts.index.astype('int64')
+        return counts.astype('int64')
+
+    def platform_year_sales(self, since=None):
+        table = agg.platform_year_sales(self._rows(since))
+        return table.astype({'year_of_release': 'int64', 'platform': str,
+                             'total_sales': 'float64'})
+
+    def top_n(self, column, by='platform', n=5, since=None):
+        _check_top(column, by)
+        rows = self._rows(since)
+        top = rows.groupby(by, observed=True)[column].sum().sort_values(
+            ascending=False, kind='stable').head(n)
+        return _plain_index(top.astype('float64'))
+
+    def genre_stats(self, since=None):
+        stats = agg.genre_stats(self._rows(since))
+        return _plain_index(stats.astype({'count': 'int64', 'total': 'float64',
+                                          'mean': 'float64',
+                                          'median': 'float64'}))
+
+    def esrb_sales(self, since=None):
+        return _plain_index(agg.esrb_sales(self._rows(since)).astype(
+            'float64'))
+
+    def sales_cube(self):
+        from .cube import SalesCube
+
+        return SalesCube.from_frame(self.df)
+
+
+class PolarsBackend:
+    """Consultas lazy de Polars sobre el CSV (o el Parquet ya limpio)."""
+
+    name = 'polars'
+
+    def __init__(self, path=DEFAULT_PATH):
+        import polars as pl
+
+        self.pl = pl
+        self.path = str(path)
+
+    def _scan(self, since):
+        pl = self.pl
+        if _is_parquet(self.path):
+            games = pl.scan_parquet(self.path).with_columns(
+                pl.col(['platform', 'genre', 'rating']).cast(pl.Utf8))
+        else:
+            # Mismas reglas que load_games: 'tbd' nulo, tipos compactos,
+            # sin filas sin name/genre y total_sales calculado
+            raw = pl.scan_csv(self.path, null_values=['tbd'],
+                              schema_overrides={
+                                  'Year_of_Release': pl.Float64,
+                                  'Critic_Score': pl.Float64,
+                                  'User_Score': pl.Float32,
+                                  'NA_sales': pl.Float32,
+                                  'EU_sales': pl.Float32,
+                                  'JP_sales': pl.Float32,
+                                  'Other_sales': pl.Float32})
+            games = (raw.rename({c: c.lower() for c in
+                                 raw.collect_schema().names()})
+                     .with_columns(pl.col('year_of_release').cast(pl.Int16),
+                                   pl.col('critic_score').cast(pl.Int8))
+                     .filter(pl.col('name').is_not_null()
+                             & pl.col('genre').is_not_null())
+                     .with_columns(total_sales=pl.sum_horizontal(SALES)))
+        if since is not None:
+            games = games.filter(pl.col('year_of_release') >= since)
+        return games
+
+    def games_per_year(self, since=None):
+        pl = self.pl
+        table = (self._scan(since)
+                 .filter(pl.col('year_of_release').is_not_null())
+                 .group_by('year_of_release').agg(pl.len().alias('count'))
+                 .sort('year_of_release', descending=True).collect())
+        return pd.Series(table['count'].to_numpy().astype('int64'),
+                         index=pd.Index(table['year_of_release'].to_numpy()
+                                        .astype('int64'),
+                                        name='year_of_release'),
+                         name='count')
+
+    def platform_year_sales(self, since=None):
+        pl = self.pl
+        table = (self._scan(since)
+                 .filter(pl.col('year_of_release').is_not_null())
+                 .group_by(['year_of_release', 'platform'])
+                 .agg(pl.col('total_sales').cast(pl.Float64).sum())
+                 .sort(['year_of_release', 'platform']).collect())
+        return table.to_pandas().astype({'year_of_release': 'int64',
+                                         'platform': str,
+                                         'total_sales': 'float64'})
+
+    def top_n(self, column, by='platform', n=5, since=None):
+        _check_top(column, by)
+        pl = self.pl
+        # pandas descarta el grupo nulo (p. ej. juegos sin rating)
+        table = (self._scan(since).filter(pl.col(by).is_not_null())
+                 .group_by(by)
+                 .agg(pl.col(column).cast(pl.Float64).sum())
+                 .sort([column, by], descending=[True, False]).head(n)
+                 .collect().to_pandas())
+        return table.set_index(by)[column].astype('float64')
+
+    def genre_stats(self, since=None):
+        pl = self.pl
+        # Acumulamos en float64, como pandas y DuckDB
+        sales = pl.col('total_sales').cast(pl.Float64)
+        table = (self._scan(since).group_by('genre')
+                 .agg(pl.len().alias('count'), sales.sum().alias('total'),
+                      sales.mean().alias('mean'),
+                      sales.median().alias('median'))
+                 .sort(['count', 'genre'], descending=[True, False])
+                 .collect().to_pandas())
+        return table.set_index('genre').astype(
+            {'count': 'int64', 'total': 'float64', 'mean': 'float64',
+             'median': 'float64'})
+
+    def esrb_sales(self, since=None):
+        pl = self.pl
+        table = (self._scan(since).filter(pl.col('rating').is_not_null())
+                 .group_by('rating')
+                 .agg(pl.col(REGIONS).cast(pl.Float64).mean())
+                 .sort('rating').collect().to_pandas())
+        return table.set_index('rating')[REGIONS].astype('float64')
+
+    def sales_cube(self):
+        from .cube import KEYS, MEASURES, SalesCube
+
+        pl = self.pl
+        user = pl.col('user_score').cast(pl.Float64)
+        critic = pl.col('critic_score').cast(pl.Float64)
+        sales = pl.col('total_sales').cast(pl.Float64)
+        user0 = user.fill_null(0.0)
+        scored = user.is_not_null() & critic.is_not_null()
+        u, c, s = (pl.when(scored).then(value).otherwise(0.0)
+                   for value in (user, critic, sales))
+        sums = [pl.len().alias('count')]
+        for column in MEASURES:
+            value = pl.col(column).cast(pl.Float64)
+            sums += [value.sum().alias(f'{column}_sum'),
+                     (value * value).sum().alias(f'{column}_sumsq')]
+        sums += [user.count().alias('user_score_count'),
+                 user0.sum().alias('user_score_sum'),
+                 (user0 * user0).sum().alias('user_score_sumsq'),
+                 scored.sum().alias('scored_count'),
+                 u.sum().alias('scored_user_sum'),
+                 (u * u).sum().alias('scored_user_sumsq'),
+                 c.sum().alias('scored_critic_sum'),
+                 (c * c).sum().alias('scored_critic_sumsq'),
+                 s.sum().alias('scored_sales_sum'),
+                 (s * s).sum().alias('scored_sales_sumsq'),
+                 (u * s).sum().alias('scored_user_sales'),
+                 (c * s).sum().alias('scored_critic_sales')]
+        cells = self._scan(None).group_by(KEYS).agg(sums).collect()
+        return SalesCube.from_cells(cells.to_pandas())
+
+
+class DuckDBBackend:
+    """SQL en DuckDB embebido sobre el CSV (o el Parquet ya limpio)."""
+
+    name = 'duckdb'
+
+    def __init__(self, path=DEFAULT_PATH):
+        import duckdb
+
+        self.con = duckdb.connect()
+        path = str(path).replace("'", "''")
+        if _is_parquet(path):
+            source = f"SELECT * FROM read_parquet('{path}')"
+        else:
+            # Mismas reglas que load_games, en SQL
+            source = f"""
+                SELECT Name AS name, Platform AS platform,
+                       CAST(CAST(Year_of_Release AS DOUBLE) AS SMALLINT)
+                           AS year_of_release,
+                       Genre AS genre,
+                       CAST(NA_sales AS REAL) AS na_sales,
+                       CAST(EU_sales AS REAL) AS eu_sales,
+                       CAST(JP_sales AS REAL) AS jp_sales,
+                       CAST(Other_sales AS REAL) AS other_sales,
+                       CAST(CAST(Critic_Score AS DOUBLE) AS TINYINT)
+                           AS critic_score,
+                       TRY_CAST(User_Score AS REAL) AS user_score,
+                       Rating AS rating,
+                       CAST(CAST(NA_sales AS REAL) + CAST(EU_sales AS REAL)
+                            + CAST(JP_sales AS REAL)
+                            + CAST(Other_sales AS REAL) AS REAL)
+                           AS total_sales
+                FROM read_csv('{path}', header = true, all_varchar = true)
+                WHERE Name IS NOT NULL AND Genre IS NOT NULL"""
+        self.con.execute(f'CREATE VIEW games AS {source}')
+
+    def _query(self, sql, since, params=()):
+        where = 'WHERE year_of_release >= ?' if since is not None else ''
+        params = ([since] if since is not None else []) + list(params)
+        return self.con.execute(sql.format(where=where), params).df()
+
+    def games_per_year(self, since=None):
+        table = self._query("""
+            SELECT year_of_release, COUNT(*) AS count FROM games {where}
+            GROUP BY year_of_release HAVING year_of_release IS NOT NULL
+            ORDER BY year_of_release DESC""", since)
+        return pd.Series(table['count'].to_numpy().astype('int64'),
+                         index=pd.Index(table['year_of_release']
+                                        .astype('int64'),
+                                        name='year_of_release'),
+                         name='count')
+
+    def platform_year_sales(self, since=None):
+        table = self._query("""
+            SELECT year_of_release, platform, SUM(total_sales) AS total_sales
+            FROM games {where}
+            GROUP BY year_of_release, platform
+            HAVING year_of_release IS NOT NULL
+            ORDER BY year_of_release, platform""", since)
+        return table.astype({'year_of_release': 'int64', 'platform': str,
+                             'total_sales': 'float64'})
+
+    def top_n(self, column, by='platform', n=5, since=None):
+        _check_top(column, by)
+        table = self._query(f"""
+            SELECT {by}, SUM({column}) AS {column} FROM games {{where}}
+            GROUP BY {by} HAVING {by} IS NOT NULL
+            ORDER BY {column} DESC, {by} LIMIT ?""",
+                            since, [n])
+        return table.set_index(by)[column].astype('float64')
+
+    def genre_stats(self, since=None):
+        table = self._query("""
+            SELECT genre, COUNT(*) AS count, SUM(total_sales) AS total,
+                   AVG(total_sales) AS mean, MEDIAN(total_sales) AS median
+            FROM games {where} GROUP BY genre
+            ORDER BY count DESC, genre""", since)
+        return table.set_index('genre').astype(
+            {'count': 'int64', 'total': 'float64', 'mean': 'float64',
+             'median': 'float64'})
+
+    def esrb_sales(self, since=None):
+        table = self._query("""
+            SELECT rating, AVG(na_sales) AS na_sales,
+                   AVG(eu_sales) AS eu_sales, AVG(jp_sales) AS jp_sales
+            FROM games {where} GROUP BY rating
+            HAVING rating IS NOT NULL ORDER BY rating""", since)
+        return table.set_index('rating')[REGIONS].astype('float64')
+
+    def sales_cube(self):
+        from .cube import KEYS, MEASURES, SalesCube
+
+        sums = ['COUNT(*) AS count']
+        for column in MEASURES:
+            sums += [f'SUM({column}) AS {column}_sum',
+                     f'SUM({column} * {column}) AS {column}_sumsq']
+        sums += ['COUNT(user_score) AS user_score_count',
+                 'SUM(user0) AS user_score_sum',
+                 'SUM(user0 * user0) AS user_score_sumsq',
+                 'SUM(CAST(scored AS INTEGER)) AS scored_count',
+                 'SUM(u) AS scored_user_sum',
+                 'SUM(u * u) AS scored_user_sumsq',
+                 'SUM(c) AS scored_critic_sum',
+                 'SUM(c * c) AS scored_critic_sumsq',
+                 'SUM(s) AS scored_sales_sum',
+                 'SUM(s * s) AS scored_sales_sumsq',
+                 'SUM(u * s) AS scored_user_sales',
+                 'SUM(c * s) AS scored_critic_sales']
+        doubles = ', '.join(f'CAST({column} AS DOUBLE) AS {column}'
+                            for column in MEASURES)
+        keys = ', '.join(KEYS)
+        cells = self.con.execute(f"""
+            WITH scores AS (
+                SELECT {keys}, {doubles},
+                       CAST(user_score AS DOUBLE) AS user_score,
+                       COALESCE(CAST(user_score AS DOUBLE), 0) AS user0,
+                       user_score IS NOT NULL AND critic_score IS NOT NULL
+                           AS scored,
+                       CAST(critic_score AS DOUBLE) AS critic
+                FROM games),
+            scored_values AS (
+                SELECT *,
+                       CASE WHEN scored THEN user_score ELSE 0 END AS u,
+                       CASE WHEN scored THEN critic ELSE 0 END AS c,
+                       CASE WHEN scored THEN total_sales ELSE 0 END AS s
+                FROM scores)
+            SELECT {keys}, {', '.join(sums)}
+            FROM scored_values GROUP BY {keys}""").df()
+        return SalesCube.from_cells(cells)
+
+
+BACKENDS = {
+    'pandas': PandasBackend,
+    'polars': PolarsBackend,
+    'duckdb': DuckDBBackend,
+}
+
+
+def get_backend(name, path=DEFAULT_PATH):
+    if name not in BACKENDS:
+        raise ValueError(f'backend no soportado: {name!r}')
+    return BACKENDS[name](path)
+
+
+def available_backends():
+    """Backends cuyas dependencias estan instaladas."""
+    import importlib.util
+
+    return [name for name in BACKENDS
+            if name == 'pandas' or importlib.util.find_spec(name)]
+
+
+def backend_report(backend, since=agg.RECENT_YEAR, n=5):
+    """Las secciones del reporte calculadas con `backend`."""
+    return {
+        'games_per_year': backend.games_per_year(),
+        'platform_year_sales': backend.platform_year_sales(since),
+        'top_platforms': {region: backend.top_n(region, 'platform', n, since)
+                          for region in REGIONS},
+        'top_genres': {region: backend.top_n(region, 'genre', n, since)
+                       for region in REGIONS},
+        'top_ratings': {region: backend.top_n(region, 'rating', n, since)
+                        for region in REGIONS},
+        'genre_stats': backend.genre_stats(since),
+        'esrb_sales': backend.esrb_sales(since),
+    }
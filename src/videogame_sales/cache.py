@@ -0,0 +1,138 @@
+# coding: utf-8
+
+# Cache columnar de la tabla de juegos ya limpia.
+# La primera corrida escribe el DataFrame de load_games en Feather (o Parquet);
+# las siguientes lo leen con memory-map mientras el CSV de origen y la version
+# de la limpieza no cambien.
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from .instrument import stage
+from .loader import CLEANING_VERSION, DEFAULT_PATH, load_games
+
+
+FORMATS = ('feather', 'parquet')
+
+_HASH_BLOCK = 1 << 20
+
+
+def _file_hash(path):
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as fh:
+        for block in iter(lambda: fh.read(_HASH_BLOCK), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def source_fingerprint(path, previous=None):
+    """Huella del CSV: tamaño, mtime y hash del contenido.
+
+    Si `previous` coincide en tamaño y mtime se reutiliza su hash para no
+    releer archivos de varios GB en cada corrida.
+    """
+    st = os.stat(path)
+    fingerprint = {'size': st.st_size, 'mtime_ns': st.st_mtime_ns}
+    if (previous and previous.get('size') == st.st_size
+            and previous.get('mtime_ns') == st.st_mtime_ns):
+        fingerprint['hash'] = previous['hash']
+    else:
+        fingerprint['hash'] = _file_hash(path)
+    return fingerprint
+
+
+def cache_paths(path, cache_dir=None, fmt='feather', compact=False):
+    path = Path(path)
+    cache_dir = Path(cache_dir) if cache_dir else path.parent / '.cache'
+    stem = f'{path.stem}.compact' if compact else path.stem
+    data = cache_dir / f'{stem}.{fmt}'
+    return data, data.with_suffix(f'.{fmt}.json')
+
+
+def _read(data_path, fmt):
+    if fmt == 'feather':
+        from pyarrow import feather
+        return feather.read_table(data_path, memory_map=True).to_pandas()
+    import pyarrow.parquet as pq
+    return pq.read_table(data_path, memory_map=True).to_pandas()
+
+
+def _write(df, data_path, fmt):
+    # Escribimos a un temporal y renombramos para no dejar caches a medias
+    tmp = data_path.with_name(data_path.name + '.tmp')
+    if fmt == 'feather':
+        df.to_feather(tmp)
+    else:
+        df.to_parquet(tmp, index=False)
+    os.replace(tmp, data_path)
+
+
+def _read_meta(meta_path):
+    # Un meta ilegible (p. ej. una corrida interrumpida con una version
+    # anterior) cuenta como fallo de cache, no como error
+    try:
+        meta = json.loads(meta_path.read_text())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(meta, dict) or not isinstance(meta.get('source'), dict):
+        return None
+    return meta
+
+
+def _write_meta(meta, meta_path):
+    tmp = meta_path.with_name(meta_path.name + '.tmp')
+    tmp.write_text(json.dumps(meta))
+    os.replace(tmp, meta_path)
+
+
+def load_games_cached(path=DEFAULT_PATH, cache_dir=None, fmt='feather',
+                      refresh=False, compact=False):
+    """Como load_games, pero reutiliza la tabla limpia guardada en disco.
+
+    El cache se invalida cuando cambia el CSV (tamaño/mtime/hash) o
+    CLEANING_VERSION. Sin pyarrow se carga directamente del CSV. La tabla
+    compacta (compact=True) se guarda en su propio archivo.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f'formato no soportado: {fmt!r}')
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return load_games(path, compact=compact)
+
+    data_path, meta_path = cache_paths(path, cache_dir, fmt, compact)
+    with stage('load.cache', format=fmt, compact=compact) as ctx:
+        df = _load_cached(path, data_path, meta_path, fmt, refresh, compact,
+                          ctx)
+        ctx['rows_out'] = len(df)
+    return df
+
+
+def _load_cached(path, data_path, meta_path, fmt, refresh, compact, ctx):
+    meta = None
+    if meta_path.exists() and data_path.exists():
+        meta = _read_meta(meta_path)
+
+    fingerprint = source_fingerprint(path, meta and meta.get('source'))
+    expected = {'source': fingerprint, 'cleaning_version': CLEANING_VERSION}
+
+    if not refresh and meta is not None:
+        if meta == expected:
+            ctx['cache'] = 'hit'
+            return _read(data_path, fmt)
+        if (meta.get('cleaning_version') == CLEANING_VERSION
+                and meta['source'].get('hash') == fingerprint['hash']):
+            # Solo cambio el mtime (p. ej. se copio el archivo): el contenido
+            # es el mismo, actualizamos la huella y usamos el cache
+            _write_meta(expected, meta_path)
+            ctx['cache'] = 'hit'
+            return _read(data_path, fmt)
+
+    ctx['cache'] = 'miss'
+    df = load_games(path, compact=compact)
+    data_path.parent.mkdir(parents=True, exist_ok=True)
+    _write(df, data_path, fmt)
+    _write_meta(expected, meta_path)
+    return df
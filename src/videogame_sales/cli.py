@@ -0,0 +1,252 @@
+# coding: utf-8
+
+# Punto de entrada de linea de comandos:
+#   python -m videogame_sales [--data games.csv] [--figures salida/] [--show]
+
+import argparse
+import os
+from pathlib import Path
+
+from . import instrument
+from .aggregations import REGION_COLUMNS
+from .backends import BACKENDS
+from .instrument import stage
+from .loader import DEFAULT_PATH
+
+
+def print_report(report, alpha):
+    print('Número de juegos por género:')
+    print(report['genre_stats']['count'])
+    print('\nVentas globales totales por género:')
+    print(report['genre_stats']['total'].sort_values(ascending=False))
+    print('\nPromedio de ventas por género:')
+    print(report['genre_stats']['mean'].sort_values(ascending=False))
+    print('\nMediana de ventas por género:')
+    print(report['genre_stats']['median'].sort_values(ascending=False))
+
+    print(f"\nPlataformas activas: {', '.join(report['active_platforms'])} "
+          f"(vida tipica {report['typical_lifespan']:.1f} años)")
+
+    print('\nCorrelaciones score vs ventas:')
+    print(report['correlations'])
+
+    for region in REGION_COLUMNS:
+        label = region.split('_')[0].upper()
+        print(f'\nTop 5 plataformas en {label}:')
+        print(report['top_platforms_region'][region].head(5))
+
+    print('\nVentas promedio por clasificacion ESRB:')
+    print(report['esrb_sales'])
+
+    for name, result in report['hypotheses'].items():
+        verdict = ('Rechazamos la hipótesis nula' if result['pvalue'] < alpha
+                   else 'No rechazamos la hipótesis nula')
+        print(f"\n{name}: p-valor {result['pvalue']:.4g}. {verdict}.")
+
+    for by, table in report['pairwise_tests'].items():
+        print(f'\nPares de {by} con user_score distinto (Holm, '
+              f'alpha={alpha}): {int((table["pvalue_adj"] < alpha).sum())} '
+              f'de {len(table)}')
+
+
+def print_forecast(forecasts, summaries=None, n=5):
+    for by, table in forecasts.items():
+        year = int(table['year'].iloc[0])
+        if summaries is not None:
+            print(f'\nBacktest por {by} (MAE, WAPE y series ganadas por '
+                  'modelo):')
+            print(summaries[by].round(3))
+        for region in REGION_COLUMNS + ['total_sales']:
+            label = region.split('_')[0].upper()
+            top = table.xs(region, level='region').nlargest(n, 'forecast')
+            print(f'\nPronostico {year} por {by} en {label}:')
+            print(top[['last_sales', 'forecast', 'model', 'mae']].round(2))
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='videogame_sales',
+        description='Analisis del mercado de videojuegos')
+    parser.add_argument('--data', type=Path, default=DEFAULT_PATH,
+                        help='CSV con el catalogo de juegos')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='leer siempre el CSV sin usar el cache')
+    parser.add_argument('--backend', default='pandas',
+                        choices=list(BACKENDS),
+                        help='motor que arma el cubo del reporte (polars y '
+                             'duckdb leen el CSV directo; no generan '
+                             'figuras)')
+    parser.add_argument('--compact', action='store_true',
+                        help='tabla compacta: name como pool de categorias '
+                             '(tambien en el cache)')
+    parser.add_argument('--chunksize', type=int,
+                        help='procesar el CSV por bloques de N filas sin '
+                             'cargarlo completo (no genera figuras)')
+    parser.add_argument('--alpha', type=float, default=0.05)
+    parser.add_argument('--resamples', type=int, default=0,
+                        help='IC bootstrap y pruebas de permutacion con N '
+                             'remuestreos')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='procesos para el remuestreo y las figuras')
+    parser.add_argument('--forecast', action='store_true',
+                        help='pronostico del año siguiente por plataforma y '
+                             'genero (con backtest)')
+    parser.add_argument('--figures', type=Path,
+                        help='carpeta donde guardar las figuras (sin '
+                             'pantalla; solo se redibujan las que cambiaron)')
+    parser.add_argument('--formats', default='png',
+                        help='formatos de las figuras separados por coma '
+                             '(png,svg)')
+    parser.add_argument('--force', action='store_true',
+                        help='redibujar todas las figuras')
+    parser.add_argument('--show', action='store_true',
+                        help='mostrar las figuras en pantalla')
+    parser.add_argument('--trace', metavar='PATH',
+                        help='eventos JSON por etapa en PATH (- para '
+                             f'stderr); equivale a {instrument.TRACE_ENV}')
+    parser.add_argument('--profile', default='',
+                        help='perfiles por etapa separados por coma '
+                             '(cprofile,tracemalloc); requiere --trace o '
+                             f'{instrument.TRACE_ENV}')
+    parser.add_argument('--profile-dir', type=Path, default=Path('.'),
+                        help='carpeta para los .prof de cProfile')
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    trace = args.trace or os.environ.get(instrument.TRACE_ENV)
+    if args.profile and not trace:
+        parser.error('--profile requiere --trace')
+    if args.trace or args.profile:
+        try:
+            instrument.configure(
+                trace, [p for p in args.profile.split(',') if p],
+                args.profile_dir)
+        except ValueError as exc:
+            parser.error(str(exc))
+        except OSError as exc:
+            parser.error(f'--trace: no se pudo abrir {trace}: '
+                         f'{exc.strerror}')
+
+    with stage('pipeline', data=str(args.data)):
+        return _run(parser, args)
+
+
+def _run(parser, args):
+    from .render import FORMATS
+
+    formats = tuple(fmt for fmt in args.formats.split(',') if fmt)
+    unknown = [fmt for fmt in formats if fmt not in FORMATS]
+    if unknown or not formats:
+        parser.error(f"--formats acepta {', '.join(FORMATS)}; "
+                     f"no soportado: {', '.join(unknown) or '(vacio)'}")
+
+    if args.backend != 'pandas':
+        if args.chunksize or args.figures or args.show or args.resamples:
+            parser.error(f'--backend {args.backend} solo calcula el reporte '
+                         '(sin --chunksize, figuras ni remuestreo)')
+        return _run_backend(parser, args)
+
+    if args.chunksize:
+        if args.figures or args.show:
+            parser.error('--chunksize no se puede combinar con figuras')
+        from .cube import SalesCube
+        from .loader import read_games_chunks
+        from .report import build_report
+        with stage('load.chunks', chunksize=args.chunksize) as ctx:
+            cube = SalesCube.from_chunks(
+                read_games_chunks(args.data, args.chunksize))
+            ctx['cells'] = len(cube.cells)
+        print_report(build_report(cube=cube), args.alpha)
+        if args.forecast:
+            _forecast(cube)
+        return 0
+
+    if args.no_cache:
+        from .loader import load_games
+        df = load_games(args.data, compact=args.compact)
+    else:
+        from .cache import load_games_cached
+        df = load_games_cached(args.data, compact=args.compact)
+
+    from .cube import SalesCube
+    from .report import build_figures, build_report
+    # El mismo cubo sirve al reporte y al pronostico
+    with stage('report', rows_in=len(df)):
+        with stage('report.cube', rows_in=len(df)) as ctx:
+            cube = SalesCube.from_frame(df)
+            ctx['cells'] = len(cube.cells)
+        report = build_report(df, cube)
+    print_report(report, args.alpha)
+
+    if args.resamples:
+        from .resampling import score_intervals
+        with stage('resampling', resamples=args.resamples,
+                   workers=args.workers):
+            intervals = score_intervals(df, args.resamples,
+                                        workers=args.workers)
+        print(f'\nIntervalos bootstrap 95% ({args.resamples} remuestreos):')
+        print(intervals.to_string())
+
+    if args.forecast:
+        _forecast(cube)
+
+    if args.figures:
+        from .render import render_figures
+        status = render_figures(df, report, args.figures,
+                                formats=formats,
+                                workers=args.workers, force=args.force)
+        rendered = sum(state == 'rendered' for state in status.values())
+        print(f'\nFiguras en {args.figures}: {rendered} dibujadas, '
+              f'{len(status) - rendered} sin cambios')
+
+    if args.show:
+        from matplotlib import pyplot as plt
+
+        build_figures(df, report)
+        plt.show()
+        plt.close('all')
+    return 0
+
+
+def _run_backend(parser, args):
+    from .aggregations import RECENT_YEAR
+    from .backends import get_backend
+    from .report import build_report
+
+    with stage('load.backend', backend=args.backend) as ctx:
+        try:
+            backend = get_backend(args.backend, args.data)
+        except ImportError:
+            parser.error(f'--backend {args.backend} requiere instalar '
+                         f'{args.backend}')
+        cube = backend.sales_cube()
+        ctx['cells'] = len(cube.cells)
+    # La mediana no sale del cubo: se la pide al mismo motor
+    median = backend.genre_stats(RECENT_YEAR)['median']
+    with stage('report', backend=args.backend):
+        report = build_report(cube=cube, genre_median=median)
+    print_report(report, args.alpha)
+    if args.forecast:
+        _forecast(cube)
+    return 0
+
+
+def _forecast(cube):
+    from .forecast import sales_forecast
+
+    forecasts, summaries = {}, {}
+    with stage('forecast') as ctx:
+        try:
+            for by in ('platform', 'genre'):
+                forecasts[by], summaries[by] = sales_forecast(cube, by,
+                                                              summary=True)
+        except ValueError as exc:
+            # Pocos años de datos para el backtest
+            print(f'\nSin pronostico: {exc}')
+            return
+        ctx['series'] = sum(len(table) for table in forecasts.values())
+    print_forecast(forecasts, summaries)
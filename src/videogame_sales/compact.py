@@ -0,0 +1,58 @@
+# coding: utf-8
+
+# Representacion compacta de la tabla de juegos y perfil de memoria.
+# load_games ya usa categorias, float32 y enteros pequeños; aqui ademas el
+# nombre pasa a un pool deduplicado (categoria: cada titulo se guarda una
+# vez aunque salga en varias plataformas) y los subconjuntos se pueden
+# representar como arreglos de posiciones en lugar de copias.
+
+import numpy as np
+import pandas as pd
+
+from .loader import SCHEMA
+
+
+def compact_games(df):
+    """Copia de la tabla con el esquema compacto y name como pool."""
+    dtypes = {column: dtype for column, dtype in SCHEMA.items()
+              if column in df}
+    dtypes['name'] = 'category'
+    if 'total_sales' in df:
+        dtypes['total_sales'] = 'float32'
+    return df.astype(dtypes)
+
+
+def subset_positions(mask):
+    """Posiciones int32 de las filas seleccionadas (en vez de una copia)."""
+    positions = np.flatnonzero(np.asarray(mask, dtype=bool))
+    if len(positions) and positions[-1] < np.iinfo(np.int32).max:
+        positions = positions.astype(np.int32)
+    return positions
+
+
+def frame_bytes(obj):
+    """Bytes reales de un DataFrame/Series (incluye strings y categorias)."""
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    usage = obj.memory_usage(deep=True, index=True)
+    return int(usage.sum() if isinstance(usage, pd.Series) else usage)
+
+
+def memory_profile(frames):
+    """Tabla de bytes totales y por fila de cada objeto de `frames`.
+
+    `frames` es {nombre: DataFrame | Series | arreglo de posiciones}.
+    """
+    rows = []
+    for name, obj in frames.items():
+        nbytes = frame_bytes(obj)
+        rows.append({'object': name, 'rows': len(obj), 'bytes': nbytes,
+                     'bytes_per_row': nbytes / max(len(obj), 1)})
+    return pd.DataFrame(rows).set_index('object')
+
+
+def column_profile(df):
+    """Bytes por columna y por fila, para ver que columna pesa mas."""
+    usage = df.memory_usage(deep=True, index=False)
+    return pd.DataFrame({'dtype': df.dtypes.astype(str), 'bytes': usage,
+                         'bytes_per_row': usage / max(len(df), 1)})
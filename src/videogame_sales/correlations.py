@@ -0,0 +1,97 @@
+# coding: utf-8
+
+# Correlaciones score vs ventas para muchos grupos a la vez.
+# En lugar de filtrar el DataFrame por cada plataforma y llamar Series.corr,
+# se calculan por grupo las sumas de productos cruzados de los valores
+# centrados y de ahi sale Pearson para todos los grupos en una pasada.
+# Spearman es Pearson sobre los rangos dentro de cada grupo.
+
+import numpy as np
+import pandas as pd
+
+from .aggregations import SCORE_COLUMNS
+from .cube import _as_list
+
+
+METHODS = ('pearson', 'spearman')
+
+
+def _grouped_pearson(frame, by, x, y):
+    """Pearson de x vs y por grupo; devuelve (n, r) indexados por `by`."""
+    grouped = frame.groupby(by, observed=True, sort=True)
+    xc = frame[x] - grouped[x].transform('mean')
+    yc = frame[y] - grouped[y].transform('mean')
+    products = pd.DataFrame({'xx': xc * xc, 'yy': yc * yc, 'xy': xc * yc})
+    keys = [frame[key] for key in by]
+    sums = products.groupby(keys, observed=True, sort=True).sum()
+    n = grouped.size()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        r = sums['xy'] / np.sqrt(sums['xx'] * sums['yy'])
+    # Con menos de 2 puntos la correlacion no esta definida
+    r[n < 2] = np.nan
+    return n, r
+
+
+def grouped_correlations(df, by, scores=SCORE_COLUMNS, target='total_sales',
+                         methods=METHODS, pairwise=False):
+    """Correlacion de cada score con `target` para todos los grupos de `by`.
+
+    Devuelve una tabla larga con las columnas de `by`, `score`, `n` y una
+    columna por metodo. Por defecto usa solo las filas con todos los scores
+    presentes (como el dropna del notebook); con pairwise=True cada score
+    usa todas sus filas no nulas.
+    """
+    by = _as_list(by)
+    for method in methods:
+        if method not in METHODS:
+            raise ValueError(f'metodo no soportado: {method!r}')
+
+    frame = df[by + list(scores) + [target]].copy()
+    for column in list(scores) + [target]:
+        frame[column] = frame[column].astype('float64')
+    if not pairwise:
+        frame = frame.dropna(subset=list(scores) + [target])
+
+    tables = []
+    for score in scores:
+        pair = frame.dropna(subset=[score, target])
+        result = {}
+        if 'pearson' in methods:
+            n, result['pearson'] = _grouped_pearson(pair, by, score, target)
+        if 'spearman' in methods:
+            ranks = pair.groupby(by, observed=True)[[score, target]].rank()
+            ranked = pd.concat([pair[by], ranks], axis=1)
+            n, result['spearman'] = _grouped_pearson(ranked, by, score,
+                                                     target)
+        table = pd.DataFrame({'n': n, **result}).reset_index()
+        table.insert(len(by), 'score', score)
+        tables.append(table)
+    return pd.concat(tables, ignore_index=True)
+
+
+def year_windows(first, last, width, step=1):
+    """Ventanas [inicio, fin] de `width` años entre `first` y `last`."""
+    return [(start, start + width - 1)
+            for start in range(first, last - width + 2, step)]
+
+
+def windowed_correlations(df, by, windows, **kwargs):
+    """grouped_correlations para cada ventana de años (first, last).
+
+    Las filas de cada ventana se apilan con indices (sin copiar por grupo)
+    y todas las ventanas se resuelven en la misma pasada agrupada.
+    """
+    by = _as_list(by)
+    years = df['year_of_release'].to_numpy(dtype='float64', na_value=np.nan)
+    positions, firsts, lasts = [], [], []
+    for first, last in windows:
+        idx = np.flatnonzero((years >= first) & (years <= last))
+        positions.append(idx)
+        firsts.append(np.full(len(idx), first))
+        lasts.append(np.full(len(idx), last))
+
+    stacked = df.iloc[np.concatenate(positions)].reset_index(drop=True)
+    stacked.insert(0, 'first_year', np.concatenate(firsts))
+    stacked.insert(1, 'last_year', np.concatenate(lasts))
+    return grouped_correlations(stacked, ['first_year', 'last_year'] + by,
+                                **kwargs)
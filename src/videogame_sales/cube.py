@@ -0,0 +1,211 @@
+# coding: utf-8
+
+# Cubo de agregacion año x plataforma x genero x rating.
+# Se construye con un solo groupby sobre la tabla limpia y guarda, por celda,
+# conteos, sumas y sumas de cuadrados de las ventas y de los scores. Con eso
+# se contestan totales, promedios, varianzas y correlaciones de cualquier
+# seccion del reporte sin volver a recorrer las filas. La mediana no se puede
+# reconstruir a partir de sumas, asi que sigue saliendo de las filas.
+
+import numpy as np
+import pandas as pd
+
+from .loader import SALES_COLUMNS, SCHEMA, align_categories
+
+
+KEYS = ['year_of_release', 'platform', 'genre', 'rating']
+MEASURES = SALES_COLUMNS + ['total_sales']
+
+# Columnas que _moments suma por celda, en orden (los backends de Polars y
+# DuckDB arman las mismas con su propio group by)
+MOMENTS = (['count']
+           + [f'{column}_{stat}' for column in MEASURES
+              for stat in ('sum', 'sumsq')]
+           + ['user_score_count', 'user_score_sum', 'user_score_sumsq',
+              'scored_count', 'scored_user_sum', 'scored_user_sumsq',
+              'scored_critic_sum', 'scored_critic_sumsq',
+              'scored_sales_sum', 'scored_sales_sumsq',
+              'scored_user_sales', 'scored_critic_sales'])
+
+
+def _as_list(by):
+    return [by] if isinstance(by, str) else list(by)
+
+
+def _moments(df):
+    """Columnas que se suman por celda para formar el cubo."""
+    out = {'count': np.ones(len(df), dtype=np.int64)}
+    for column in MEASURES:
+        values = df[column].to_numpy(dtype=np.float64)
+        out[f'{column}_sum'] = values
+        out[f'{column}_sumsq'] = values * values
+
+    user = df['user_score'].to_numpy(dtype=np.float64, na_value=np.nan)
+    critic = df['critic_score'].to_numpy(dtype=np.float64, na_value=np.nan)
+    sales = df['total_sales'].to_numpy(dtype=np.float64)
+
+    # user_score por si solo (para las pruebas t)
+    has_user = ~np.isnan(user)
+    user0 = np.where(has_user, user, 0.0)
+    out['user_score_count'] = has_user.astype(np.int64)
+    out['user_score_sum'] = user0
+    out['user_score_sumsq'] = user0 * user0
+
+    # Filas con ambos scores (las mismas que deja el dropna de las
+    # correlaciones del notebook)
+    scored = has_user & ~np.isnan(critic)
+    u = np.where(scored, user, 0.0)
+    c = np.where(scored, critic, 0.0)
+    s = np.where(scored, sales, 0.0)
+    out['scored_count'] = scored.astype(np.int64)
+    out['scored_user_sum'] = u
+    out['scored_user_sumsq'] = u * u
+    out['scored_critic_sum'] = c
+    out['scored_critic_sumsq'] = c * c
+    out['scored_sales_sum'] = s
+    out['scored_sales_sumsq'] = s * s
+    out['scored_user_sales'] = u * s
+    out['scored_critic_sales'] = c * s
+    return pd.DataFrame(out, index=df.index)
+
+
+class SalesCube:
+    """Sumas por celda año x plataforma x genero x rating."""
+
+    def __init__(self, cells):
+        self.cells = cells
+
+    @classmethod
+    def from_frame(cls, df):
+        moments = _moments(df)
+        keys = [df[key] for key in KEYS]
+        cells = moments.groupby(keys, observed=True, dropna=False).sum()
+        return cls(cells.reset_index())
+
+    @classmethod
+    def from_cells(cls, cells):
+        """Cubo a partir de celdas ya sumadas por otro motor (KEYS +
+        MOMENTS), con los mismos tipos que from_frame."""
+        dtypes = {key: SCHEMA[key] for key in KEYS}
+        dtypes.update({column: 'int64' if column.endswith('count')
+                       else 'float64' for column in MOMENTS})
+        return cls(cells[KEYS + MOMENTS].astype(dtypes)
+                   .reset_index(drop=True))
+
+    @classmethod
+    def from_chunks(cls, chunks):
+        """Acumula el cubo bloque por bloque (ver loader.read_games_chunks).
+
+        Solo se guarda el cubo parcial, cuyo tamaño depende del numero de
+        combinaciones año/plataforma/genero/rating y no de las filas.
+        """
+        cube = None
+        for chunk in chunks:
+            part = cls.from_frame(chunk)
+            cube = part if cube is None else cube + part
+        if cube is None:
+            # CSV sin filas (solo encabezado): cubo vacio, no None
+            cube = cls.from_cells(pd.DataFrame(columns=KEYS + MOMENTS))
+        return cube
+
+    def __len__(self):
+        return len(self.cells)
+
+    # Combinar cubos: todas las medidas son sumas, asi que un lote nuevo se
+    # suma celda por celda y una correccion se resta antes de sumar la
+    # version nueva.
+
+    def merge(self, other, sign=1):
+        """Cubo con las celdas de ambos sumadas (sign=-1 para restar)."""
+        theirs = other.cells.copy()
+        if sign != 1:
+            measures = [c for c in theirs.columns if c not in KEYS]
+            theirs[measures] = theirs[measures] * sign
+        mine, theirs = align_categories(self.cells, theirs)
+        cells = pd.concat([mine, theirs], ignore_index=True).groupby(
+            KEYS, observed=True, dropna=False).sum()
+        # Celdas que quedaron sin juegos despues de retractar
+        cells = cells[cells['count'] != 0]
+        return SalesCube(cells.reset_index())
+
+    def __add__(self, other):
+        return self.merge(other)
+
+    def __sub__(self, other):
+        return self.merge(other, sign=-1)
+
+    # Cortes del cubo
+
+    def _subset(self, mask):
+        return SalesCube(self.cells[mask])
+
+    def since(self, year):
+        """Celdas con year_of_release >= year (años nulos fuera)."""
+        return self._subset((self.cells['year_of_release'] >= year)
+                            .fillna(False).to_numpy(dtype=bool))
+
+    def between(self, first, last):
+        years = self.cells['year_of_release']
+        mask = (years >= first) & (years <= last)
+        return self._subset(mask.fillna(False).to_numpy(dtype=bool))
+
+    def where(self, **isin):
+        """Filtra por pertenencia, p. ej. where(platform=['PS4', 'XOne'])."""
+        mask = np.ones(len(self.cells), dtype=bool)
+        for key, values in isin.items():
+            mask &= self.cells[key].isin(values).to_numpy(dtype=bool)
+        return self._subset(mask)
+
+    # Agregados
+
+    def sums(self, by, columns=None):
+        """Suma de las columnas del cubo agrupadas por `by` (sin nulos)."""
+        grouped = self.cells.groupby(_as_list(by), observed=True)
+        if columns is not None:
+            grouped = grouped[columns]
+        else:
+            grouped = grouped[[c for c in self.cells.columns
+                               if c not in KEYS]]
+        return grouped.sum()
+
+    def count(self, by):
+        return self.sums(by, 'count')
+
+    def total(self, by, column='total_sales'):
+        return self.sums(by, f'{column}_sum').rename(column)
+
+    def mean(self, by, column='total_sales'):
+        sums = self.sums(by, ['count', f'{column}_sum'])
+        return (sums[f'{column}_sum'] / sums['count']).rename(column)
+
+    def var(self, by, column='total_sales', ddof=1):
+        sums = self.sums(by, ['count', f'{column}_sum', f'{column}_sumsq'])
+        n = sums['count']
+        total = sums[f'{column}_sum']
+        var = (sums[f'{column}_sumsq'] - total * total / n) / (n - ddof)
+        return var.rename(column)
+
+    def top(self, by, column='total_sales', n=10):
+        return self.total(by, column).sort_values(ascending=False).head(n)
+
+    def score_moments(self, by):
+        """Conteo, media y varianza muestral de user_score por grupo."""
+        sums = self.sums(by, ['user_score_count', 'user_score_sum',
+                              'user_score_sumsq'])
+        n = sums['user_score_count']
+        mean = sums['user_score_sum'] / n
+        var = (sums['user_score_sumsq'] - n * mean * mean) / (n - 1)
+        return pd.DataFrame({'n': n, 'mean': mean, 'var': var})
+
+    def correlation(self, by, score):
+        """Pearson entre `score` (user/critic) y total_sales por grupo."""
+        prefix = 'scored_user' if score == 'user_score' else 'scored_critic'
+        sums = self.sums(by, ['scored_count', f'{prefix}_sum',
+                              f'{prefix}_sumsq', 'scored_sales_sum',
+                              'scored_sales_sumsq', f'{prefix}_sales'])
+        n = sums['scored_count']
+        sx, sy = sums[f'{prefix}_sum'], sums['scored_sales_sum']
+        sxx = sums[f'{prefix}_sumsq'] - sx * sx / n
+        syy = sums['scored_sales_sumsq'] - sy * sy / n
+        sxy = sums[f'{prefix}_sales'] - sx * sy / n
+        return (sxy / np.sqrt(sxx * syy)).rename(score)
@@ -0,0 +1,75 @@
+# coding: utf-8
+
+# Preparacion de datos para dispersiones grandes (score vs ventas).
+# Con cientos de miles de juegos dibujar un marcador por fila es lento e
+# ilegible; aqui se reducen los puntos con NumPy antes de llegar a
+# matplotlib: o se cuentan en una malla 2D, o se submuestrean por estratos
+# conservando los valores atipicos.
+
+import numpy as np
+
+
+def _finite_xy(x, y):
+    x = np.asarray(x, dtype='float64')
+    y = np.asarray(y, dtype='float64')
+    keep = np.isfinite(x) & np.isfinite(y)
+    return x[keep], y[keep]
+
+
+def bin_points(x, y, bins=60):
+    """Conteos en una malla 2D: (counts, x_edges, y_edges).
+
+    `counts` tiene forma (len(x_edges) - 1, len(y_edges) - 1).
+    """
+    x, y = _finite_xy(x, y)
+    return np.histogram2d(x, y, bins=bins)
+
+
+def outlier_mask(y, whisker=1.5):
+    """Valores por encima del bigote superior del boxplot (Q3 + 1.5 IQR)."""
+    q1, q3 = np.percentile(y, [25, 75])
+    return y > q3 + whisker * (q3 - q1)
+
+
+def downsample_points(x, y, max_points=5000, strata=20, max_outliers=None,
+                      seed=0):
+    """Submuestra estratificada por x que conserva los atipicos en y.
+
+    Devuelve (x, y) con aproximadamente `max_points` puntos comunes mas los
+    atipicos (a lo mas `max_outliers`, por defecto max_points; si hay mas se
+    quedan los de mayor y). Cada franja de x aporta puntos en proporcion a
+    su tamaño, asi la forma de la nube se mantiene.
+    """
+    x, y = _finite_xy(x, y)
+    if max_outliers is None:
+        max_outliers = max_points
+    outliers = outlier_mask(y) if len(y) else np.zeros(0, dtype=bool)
+    common = np.flatnonzero(~outliers)
+    if len(common) <= max_points and outliers.sum() <= max_outliers:
+        return x, y
+
+    extreme = np.flatnonzero(outliers)
+    if len(extreme) > max_outliers:
+        extreme = extreme[np.argsort(y[extreme])[-max_outliers:]]
+    if len(common) <= max_points:
+        keep = np.concatenate([common, extreme])
+        return x[keep], y[keep]
+
+    rng = np.random.default_rng(seed)
+    edges = np.linspace(x[common].min(), x[common].max(), strata + 1)
+    stratum = np.clip(np.searchsorted(edges, x[common], side='right') - 1,
+                      0, strata - 1)
+    # Reparto proporcional; se toma una permutacion y se queda con los
+    # primeros de cada estrato
+    quota = np.ceil(np.bincount(stratum, minlength=strata)
+                    * max_points / len(common)).astype(np.int64)
+    order = rng.permutation(len(common))
+    shuffled = stratum[order]
+    rank = np.empty(len(order), dtype=np.int64)
+    sort = np.argsort(shuffled, kind='stable')
+    starts = np.searchsorted(shuffled[sort], np.arange(strata))
+    rank[sort] = np.arange(len(order)) - starts[shuffled[sort]]
+    chosen = common[order[rank < quota[shuffled]]]
+
+    keep = np.concatenate([chosen, extreme])
+    return x[keep], y[keep]
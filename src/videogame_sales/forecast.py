@@ -0,0 +1,180 @@
+# coding: utf-8
+
+# Pronostico de ventas del año siguiente para cada serie plataforma x region
+# y genero x region, en lugar de leerlo de las graficas de tendencia.
+# Las series se acomodan en una matriz (serie x año) como en lifecycle y
+# cada modelo ajusta todas las filas a la vez con NumPy: la tendencia
+# log-lineal por minimos cuadrados ponderados en forma cerrada y el
+# suavizamiento exponencial (simple y con tendencia amortiguada) con una
+# rejilla de parametros evaluada para todas las series juntas; el unico
+# ciclo de Python es sobre los años. El modelo de cada serie se elige por
+# su error en un backtest sobre los ultimos años observados.
+
+import numpy as np
+import pandas as pd
+
+from .aggregations import REGION_COLUMNS, TRENDS_YEAR
+from .lifecycle import year_matrix
+
+
+# Rejillas de parametros (alpha, beta, phi) del suavizamiento exponencial
+SES_GRID = [(alpha, 0.0, 1.0) for alpha in np.linspace(0.1, 0.9, 9)]
+DAMPED_GRID = [(alpha, beta, phi)
+               for alpha in (0.2, 0.4, 0.6, 0.8)
+               for beta in (0.05, 0.2, 0.4)
+               for phi in (0.8, 0.9, 0.98)]
+
+# Años retenidos para el backtest (pronosticos a un paso, origen movil)
+HOLDOUT_YEARS = 3
+
+FORECAST_REGIONS = REGION_COLUMNS + ['total_sales']
+
+
+def _weighted_line(y, w):
+    """Recta a + b*t por minimos cuadrados ponderados, fila por fila."""
+    t = np.arange(y.shape[1], dtype=np.float64)
+    sw = w.sum(axis=1)
+    st = w @ t
+    stt = w @ (t * t)
+    sy = (w * y).sum(axis=1)
+    sty = (w * y) @ t
+    det = sw * stt - st * st
+    with np.errstate(divide='ignore', invalid='ignore'):
+        b = (sw * sty - st * sy) / det
+        a = (sy - b * st) / sw
+    b[det <= 0] = np.nan
+    return a, b
+
+
+def _smoothing(y, grid):
+    """Suavizamiento exponencial con tendencia amortiguada (forma de
+    correccion de error) para cada (alpha, beta, phi) de `grid` y cada
+    fila de `y`; devuelve el pronostico con el menor SSE a un paso."""
+    alpha, beta, phi = (np.array(p, dtype=np.float64)[:, None]
+                        for p in zip(*grid))
+    n_series, n_years = y.shape
+    level = np.repeat(y[None, :, 0], len(grid), axis=0)
+    trend = np.where(beta > 0, (y[:, 1] - y[:, 0])[None, :], 0.0)
+    sse = np.zeros((len(grid), n_series))
+    for t in range(1, n_years):
+        step = level + phi * trend
+        error = y[:, t] - step
+        sse += error * error
+        level = step + alpha * error
+        trend = phi * trend + alpha * beta * error
+    forecast = level + phi * trend
+    best = np.argmin(sse, axis=0)
+    return forecast[best, np.arange(n_series)]
+
+
+# Modelos: historia (serie x año) -> pronostico del año siguiente por fila
+
+def _naive(history):
+    return history[:, -1].copy()
+
+
+def _ses(history):
+    return _smoothing(history, SES_GRID)
+
+
+def _damped(history):
+    return _smoothing(history, DAMPED_GRID)
+
+
+def _loglinear(history):
+    # Solo los años con ventas entran al ajuste; sin dos puntos no hay
+    # pendiente y se usa el ultimo valor
+    selling = history > 0
+    logs = np.log(np.where(selling, history, 1.0))
+    a, b = _weighted_line(logs, selling.astype(np.float64))
+    forecast = np.exp(a + b * history.shape[1])
+    return np.where(np.isfinite(forecast), forecast, history[:, -1])
+
+
+MODELS = {
+    'naive': _naive,
+    'ses': _ses,
+    'damped': _damped,
+    'loglinear': _loglinear,
+}
+
+
+def _check_models(models):
+    for name in models:
+        if name not in MODELS:
+            raise ValueError(f'modelo no soportado: {name!r}')
+
+
+def forecast_matrix(matrix, models=tuple(MODELS)):
+    """Pronostico del año siguiente de cada fila de `matrix` con cada modelo.
+
+    Devuelve un DataFrame con el indice de `matrix` y una columna por
+    modelo (las ventas no bajan de 0).
+    """
+    _check_models(models)
+    history = matrix.to_numpy(dtype=np.float64)
+    return pd.DataFrame({name: np.clip(MODELS[name](history), 0, None)
+                         for name in models}, index=matrix.index)
+
+
+def backtest(matrix, holdout=HOLDOUT_YEARS, models=tuple(MODELS)):
+    """Error absoluto medio de cada modelo en los ultimos `holdout` años.
+
+    Cada año retenido se pronostica con los años anteriores (origen
+    movil). Devuelve un DataFrame serie x modelo con el MAE.
+    """
+    _check_models(models)
+    values = matrix.to_numpy(dtype=np.float64)
+    if values.shape[1] - holdout < 3:
+        raise ValueError('se necesitan al menos 3 años antes del holdout')
+    errors = {name: np.zeros(len(values)) for name in models}
+    for cut in range(values.shape[1] - holdout, values.shape[1]):
+        history, actual = values[:, :cut], values[:, cut]
+        for name in models:
+            predicted = np.clip(MODELS[name](history), 0, None)
+            errors[name] += np.abs(predicted - actual)
+    return pd.DataFrame({name: total / holdout
+                         for name, total in errors.items()},
+                        index=matrix.index)
+
+
+def backtest_summary(matrix, errors, holdout=HOLDOUT_YEARS):
+    """MAE, WAPE (error absoluto / ventas reales del holdout) y numero de
+    series en que cada modelo tuvo el menor error."""
+    actual = matrix.iloc[:, -holdout:].to_numpy(dtype=np.float64).mean()
+    wins = errors.idxmin(axis=1).value_counts()
+    return pd.DataFrame({
+        'mae': errors.mean(),
+        'wape': errors.mean() / actual,
+        'series_won': wins.reindex(errors.columns, fill_value=0),
+    })
+
+
+def sales_forecast(cube, by='platform', regions=FORECAST_REGIONS,
+                   since=TRENDS_YEAR, holdout=HOLDOUT_YEARS,
+                   models=tuple(MODELS), summary=False):
+    """Pronostico del año siguiente por (`by`, region) desde `since`.
+
+    Columnas: year (año pronosticado), last_sales, model (el de menor MAE
+    en el backtest), forecast, mae y una columna por modelo. Solo entran
+    las series que vendieron algo en la ventana. Con summary=True devuelve
+    (tabla, backtest_summary) usando el mismo backtest.
+    """
+    matrix = year_matrix(cube.since(since), regions, by)
+    matrix = matrix[matrix.to_numpy().sum(axis=1) > 0]
+    errors = backtest(matrix, holdout, models)
+    forecasts = forecast_matrix(matrix, models)
+    best = errors.idxmin(axis=1)
+    picked = forecasts.to_numpy()[np.arange(len(forecasts)),
+                                  forecasts.columns.get_indexer(best)]
+    table = pd.DataFrame({
+        'year': matrix.columns[-1] + 1,
+        'last_sales': matrix.iloc[:, -1],
+        'model': best,
+        'forecast': picked,
+        'mae': errors.min(axis=1),
+    }, index=matrix.index)
+    table = pd.concat([table, forecasts], axis=1)
+    if summary:
+        return table, backtest_summary(matrix, errors, holdout)
+    return table
@@ -0,0 +1,114 @@
+# coding: utf-8
+
+# Indices ordenados para consultas por rango de años y por plataforma/genero.
+# SortedGames reordena la tabla por (platform, year_of_release) y guarda
+# donde empieza cada plataforma; un rango de años dentro de una plataforma
+# es entonces una busqueda binaria y un bloque contiguo de filas. Para
+# genero se guarda una permutacion de filas agrupadas por codigo de genero
+# con sus offsets.
+
+import numpy as np
+import pandas as pd
+
+
+def _codes(series):
+    if not isinstance(series.dtype, pd.CategoricalDtype):
+        series = series.astype('category')
+    return series.cat.codes.to_numpy(), series.cat.categories
+
+
+def _offsets(sorted_codes, n_categories):
+    return np.searchsorted(sorted_codes, np.arange(n_categories + 1))
+
+
+class SortedGames:
+    """Tabla ordenada por (platform, year_of_release) con sus offsets.
+
+    Los años nulos quedan al final de cada plataforma y solo aparecen en
+    consultas sin rango de años.
+    """
+
+    def __init__(self, table):
+        platform_codes, platforms = _codes(table['platform'])
+        years = table['year_of_release'].to_numpy(dtype='float64',
+                                                  na_value=np.inf)
+        order = np.lexsort((years, platform_codes))
+
+        self.table = table.take(order).reset_index(drop=True)
+        self.years = years[order]
+        self.platforms = platforms
+        self.platform_offsets = _offsets(platform_codes[order],
+                                         len(platforms))
+        self._platform_code = {p: i for i, p in enumerate(platforms)}
+
+        genre_codes, genres = _codes(self.table['genre'])
+        self.genre_codes = genre_codes
+        self.genres = genres
+        self.genre_order = np.argsort(genre_codes, kind='stable')
+        self.genre_offsets = _offsets(genre_codes[self.genre_order],
+                                      len(genres))
+        self._genre_code = {g: i for i, g in enumerate(genres)}
+
+    def __len__(self):
+        return len(self.table)
+
+    def _lookup(self, mapping, values):
+        if isinstance(values, str):
+            values = [values]
+        return sorted(mapping[v] for v in values if v in mapping)
+
+    def platform_ranges(self, platforms=None, since=None, until=None):
+        """Bloques [inicio, fin) de filas por plataforma y rango de años."""
+        if platforms is None:
+            codes = range(len(self.platforms))
+        else:
+            codes = self._lookup(self._platform_code, platforms)
+        ranges = []
+        for code in codes:
+            lo = self.platform_offsets[code]
+            hi = self.platform_offsets[code + 1]
+            if since is None and until is None:
+                ranges.append((lo, hi))
+                continue
+            segment = self.years[lo:hi]
+            start = lo + (np.searchsorted(segment, since, side='left')
+                          if since is not None else 0)
+            # Sin 'until' el corte es antes de los años nulos (inf)
+            stop = lo + np.searchsorted(
+                segment, until if until is not None else np.inf,
+                side='right' if until is not None else 'left')
+            if stop > start:
+                ranges.append((start, stop))
+        return ranges
+
+    def positions(self, since=None, until=None, platforms=None, genres=None):
+        """Posiciones (ordenadas) de las filas que cumplen los filtros."""
+        if (genres is not None and platforms is None
+                and since is None and until is None):
+            codes = self._lookup(self._genre_code, genres)
+            parts = [self.genre_order[self.genre_offsets[c]:
+                                      self.genre_offsets[c + 1]]
+                     for c in codes]
+            return np.sort(np.concatenate(parts)) if parts else \
+                np.empty(0, dtype=np.intp)
+
+        ranges = self.platform_ranges(platforms, since, until)
+        if not ranges:
+            return np.empty(0, dtype=np.intp)
+        positions = np.concatenate([np.arange(lo, hi) for lo, hi in ranges])
+        if genres is not None:
+            codes = self._lookup(self._genre_code, genres)
+            positions = positions[np.isin(self.genre_codes[positions],
+                                          codes)]
+        return positions
+
+    def select(self, since=None, until=None, platforms=None, genres=None):
+        """Filas que cumplen los filtros. Con un solo bloque y sin filtro de
+        genero el resultado es una rebanada contigua de la tabla."""
+        if genres is None:
+            ranges = self.platform_ranges(platforms, since, until)
+            if len(ranges) == 1:
+                lo, hi = ranges[0]
+                return self.table.iloc[lo:hi]
+        return self.table.iloc[self.positions(since, until, platforms,
+                                              genres)]
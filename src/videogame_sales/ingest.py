@@ -0,0 +1,95 @@
+# coding: utf-8
+
+# Ingesta incremental de lotes nuevos o corregidos.
+# GamesStore mantiene la tabla limpia junto con su cubo de agregacion; un lote
+# se limpia con las mismas reglas que el CSV, las filas que ya existian
+# (misma name/platform/year_of_release) se retractan del cubo y despues se
+# suma el lote, sin recalcular nada sobre la tabla completa.
+
+from collections import namedtuple
+from pathlib import Path
+
+import pandas as pd
+
+from .cube import SalesCube
+from .loader import DEFAULT_PATH, align_categories, clean_games, load_games
+
+
+KEY_COLUMNS = ['name', 'platform', 'year_of_release']
+
+# added/replaced cuentan claves del lote (nuevas / ya existentes);
+# retracted cuenta las filas viejas que salieron de la tabla
+IngestResult = namedtuple('IngestResult', ['added', 'replaced', 'retracted'])
+
+
+def _key_index(df):
+    return pd.MultiIndex.from_arrays(
+        [df[column].astype(object) for column in KEY_COLUMNS])
+
+
+class GamesStore:
+    """Tabla limpia + cubo de agregacion que se actualizan por lotes."""
+
+    TABLE_FILE = 'games.feather'
+    CUBE_FILE = 'cube.feather'
+
+    def __init__(self, table, cube=None):
+        self.table = table
+        self.cube = cube if cube is not None else SalesCube.from_frame(table)
+        # Sube con cada ingesta; GamesQuery lo usa para invalidar su memoria
+        self.version = 0
+
+    @classmethod
+    def from_csv(cls, path=DEFAULT_PATH, **kwargs):
+        from .cache import load_games_cached
+
+        return cls(load_games_cached(path, **kwargs))
+
+    @classmethod
+    def load(cls, directory):
+        from pyarrow import feather
+
+        directory = Path(directory)
+        table = feather.read_table(directory / cls.TABLE_FILE,
+                                   memory_map=True).to_pandas()
+        cells = feather.read_table(directory / cls.CUBE_FILE,
+                                   memory_map=True).to_pandas()
+        return cls(table, SalesCube(cells))
+
+    def save(self, directory):
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        self.table.to_feather(directory / self.TABLE_FILE)
+        self.cube.cells.reset_index(drop=True).to_feather(
+            directory / self.CUBE_FILE)
+
+    def ingest(self, batch):
+        """Agrega un lote (DataFrame crudo o ruta a CSV) a la tabla y al cubo.
+
+        Si una clave (name, platform, year_of_release) ya existe se toma como
+        correccion: la fila vieja se retracta y entra la nueva. Si la tabla
+        tenia varias filas con esa clave (Data/games.csv trae repetido
+        "Madden NFL 13 / PS3 / 2012") se retractan todas y queda solo la
+        del lote. Dentro del lote, la ultima fila de cada clave es la que
+        cuenta.
+        """
+        if isinstance(batch, pd.DataFrame):
+            batch = clean_games(batch)
+        else:
+            batch = load_games(batch)
+        batch = batch.drop_duplicates(subset=KEY_COLUMNS, keep='last')
+
+        table, batch = align_categories(self.table, batch)
+        table_keys, batch_keys = _key_index(table), _key_index(batch)
+        stale = table_keys.isin(batch_keys)
+        retracted = table[stale]
+        existing = int(batch_keys.isin(table_keys).sum())
+
+        cube = self.cube
+        if len(retracted):
+            cube = cube - SalesCube.from_frame(retracted)
+        self.cube = cube + SalesCube.from_frame(batch)
+        self.table = pd.concat([table[~stale], batch], ignore_index=True)
+        self.version += 1
+        return IngestResult(added=len(batch) - existing, replaced=existing,
+                            retracted=len(retracted))
@@ -0,0 +1,190 @@
+# coding: utf-8
+
+# Instrumentacion por etapas del pipeline.
+# Cada etapa (with stage('load.parse'): ...) emite un evento JSON por linea
+# con su duracion, filas de entrada/salida y pico RSS del proceso (en Unix);
+# con perfiles activos agrega el pico de memoria asignada (tracemalloc) y
+# guarda un .prof de cProfile por etapa. Se activa con la variable de entorno
+# VIDEOGAME_SALES_TRACE (ruta del archivo o '-' para stderr) o con
+# `python -m videogame_sales --trace`. Desactivada, stage() devuelve un
+# contexto vacio compartido y no mide nada.
+
+import json
+import os
+import sys
+import time
+import warnings
+from pathlib import Path
+
+
+TRACE_ENV = 'VIDEOGAME_SALES_TRACE'
+PROFILE_ENV = 'VIDEOGAME_SALES_PROFILE'
+PROFILE_DIR_ENV = 'VIDEOGAME_SALES_PROFILE_DIR'
+
+PROFILERS = ('cprofile', 'tracemalloc')
+
+
+class _NullStage:
+    # Contexto compartido cuando la instrumentacion esta apagada
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def __setitem__(self, key, value):
+        pass
+
+
+_NULL = _NullStage()
+
+
+class _Tracer:
+
+    def __init__(self, stream, profilers, profile_dir):
+        self.stream = stream
+        self.profilers = profilers
+        self.profile_dir = Path(profile_dir)
+        self.stack = []
+
+    def emit(self, event):
+        self.stream.write(json.dumps(event, default=str) + '\n')
+        self.stream.flush()
+
+
+_tracer = None
+
+
+def configure(trace=None, profile=(), profile_dir='.'):
+    """Activa (o con trace=None, apaga) la instrumentacion.
+
+    `trace` es una ruta (los eventos se agregan al final) o '-' para
+    stderr; `profile` es un subconjunto de PROFILERS.
+    """
+    global _tracer
+    if _tracer is not None and _tracer.stream is not sys.stderr:
+        _tracer.stream.close()
+    _tracer = None
+    if trace is None:
+        return
+    for name in profile:
+        if name not in PROFILERS:
+            raise ValueError(f'perfil no soportado: {name!r}')
+    stream = (sys.stderr if str(trace) == '-'
+              else open(trace, 'a', encoding='utf-8'))
+    _tracer = _Tracer(stream, tuple(profile), profile_dir)
+
+
+def configure_from_env(environ=os.environ):
+    trace = environ.get(TRACE_ENV)
+    if trace:
+        profile = [p for p in environ.get(PROFILE_ENV, '').split(',') if p]
+        try:
+            configure(trace, profile, environ.get(PROFILE_DIR_ENV, '.'))
+        except (OSError, ValueError) as exc:
+            # Se llama al importar el paquete: una variable mal puesta no
+            # debe impedir usarlo, solo deja la instrumentacion apagada
+            warnings.warn(f'{TRACE_ENV} ignorada: {exc}')
+
+
+def enabled():
+    return _tracer is not None
+
+
+def _peak_rss_mb():
+    # resource solo existe en Unix; en Windows el evento va sin pico RSS.
+    # ru_maxrss viene en KB en Linux y en bytes en macOS.
+    try:
+        import resource
+    except ImportError:
+        return None
+    scale = 2**20 if sys.platform == 'darwin' else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+
+
+class _Stage:
+
+    def __init__(self, tracer, name, fields):
+        self.tracer = tracer
+        self.event = {'event': 'stage', 'stage': name, **fields}
+        self.peak = 0
+        self.profiler = None
+
+    def __setitem__(self, key, value):
+        self.event[key] = value
+
+    def __enter__(self):
+        tracer = self.tracer
+        parent = tracer.stack[-1] if tracer.stack else None
+        self.event['depth'] = len(tracer.stack)
+        if parent is not None:
+            self.event['parent'] = parent.event['stage']
+        if 'tracemalloc' in tracer.profilers:
+            import tracemalloc
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            # El pico se reinicia por etapa; el de la etapa padre se conserva
+            current, peak = tracemalloc.get_traced_memory()
+            if parent is not None:
+                parent.peak = max(parent.peak, peak)
+            self.base = current
+            tracemalloc.reset_peak()
+        # Un perfil por etapa: mientras corre una etapa anidada el perfil
+        # de la exterior se pausa, cada .prof tiene solo el tiempo propio
+        if 'cprofile' in tracer.profilers:
+            import cProfile
+            if parent is not None and parent.profiler is not None:
+                parent.profiler.disable()
+            self.profiler = cProfile.Profile()
+        tracer.stack.append(self)
+        self.event['start'] = time.time()
+        self.t0 = time.perf_counter()
+        if self.profiler is not None:
+            self.profiler.enable()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.profiler is not None:
+            self.profiler.disable()
+        elapsed = time.perf_counter() - self.t0
+        tracer = self.tracer
+        tracer.stack.pop()
+        parent = tracer.stack[-1] if tracer.stack else None
+        event = self.event
+        event['seconds'] = elapsed
+        peak_rss = _peak_rss_mb()
+        if peak_rss is not None:
+            event['peak_rss_mb'] = peak_rss
+        if 'tracemalloc' in tracer.profilers:
+            import tracemalloc
+            peak = max(self.peak, tracemalloc.get_traced_memory()[1])
+            # Memoria asignada por encima de la que habia al entrar
+            event['traced_peak_mb'] = (peak - self.base) / 2**20
+            if parent is not None:
+                parent.peak = max(parent.peak, peak)
+        if self.profiler is not None:
+            tracer.profile_dir.mkdir(parents=True, exist_ok=True)
+            path = tracer.profile_dir / '{}-{}-{}.prof'.format(
+                event['stage'], os.getpid(), time.perf_counter_ns())
+            self.profiler.dump_stats(path)
+            event['profile'] = str(path)
+            if parent is not None and parent.profiler is not None:
+                parent.profiler.enable()
+        if exc_type is not None:
+            event['error'] = exc_type.__name__
+        event['pid'] = os.getpid()
+        tracer.emit(event)
+        return False
+
+
+def stage(name, rows_in=None, **fields):
+    """Contexto que mide una etapa; `ctx['rows_out'] = n` anota la salida."""
+    if _tracer is None:
+        return _NULL
+    if rows_in is not None:
+        fields['rows_in'] = rows_in
+    return _Stage(_tracer, name, fields)
+
+
+configure_from_env()
@@ -0,0 +1,123 @@
+# coding: utf-8
+
+# Ciclo de vida de las plataformas, calculado en lugar de leido de las
+# graficas. Las ventas por año se acomodan en una matriz (serie x año) con
+# una fila por plataforma y region, y todas las metricas salen de
+# operaciones de NumPy sobre esa matriz.
+
+import numpy as np
+import pandas as pd
+
+from .cube import MEASURES
+
+
+# Regla de plataforma activa: sigue vendiendo en el ultimo año, tiene al
+# menos ACTIVE_MIN_SHARE de las ventas de ese año y no ha superado la vida
+# tipica (mediana) de las plataformas ya retiradas.
+ACTIVE_MIN_SHARE = 0.10
+
+
+def year_matrix(cube, regions=MEASURES, by='platform'):
+    """Ventas por año: DataFrame con indice (`by`, region) y un año por
+    columna (años sin ventas en 0)."""
+    columns = [f'{region}_sum' for region in regions]
+    sums = cube.sums(['year_of_release', by], columns)
+    sums.columns = list(regions)
+    if sums.empty:
+        # Corte sin filas (p. ej. since posterior al ultimo año)
+        index = pd.MultiIndex.from_arrays([[], []], names=[by, 'region'])
+        return pd.DataFrame(index=index, columns=pd.Index([], dtype=int),
+                            dtype='float64')
+    wide = sums.stack().unstack('year_of_release', fill_value=0.0)
+    wide.index = wide.index.set_names([by, 'region'])
+    years = wide.columns.astype(int)
+    full = np.arange(years.min(), years.max() + 1)
+    return wide.reindex(columns=full, fill_value=0.0)
+
+
+def year_growth(matrix):
+    """Crecimiento año contra año de cada fila de `matrix` (serie x año).
+
+    ventas / ventas del año anterior - 1 (NaN si el año anterior no
+    vendio); una columna por año desde el segundo.
+    """
+    sales = matrix.to_numpy(dtype='float64')
+    with np.errstate(divide='ignore', invalid='ignore'):
+        growth = sales[:, 1:] / sales[:, :-1] - 1
+    growth[~np.isfinite(growth)] = np.nan
+    return pd.DataFrame(growth, index=matrix.index,
+                        columns=matrix.columns[1:])
+
+
+def lifecycle_metrics(matrix):
+    """Metricas de ciclo de vida por fila de `matrix` (serie x año).
+
+    first/peak/last_year, lifespan, peak_sales, half_life (años desde el
+    pico hasta caer a la mitad o menos; NaN si aun no pasa) y latest_growth
+    (la ultima columna de year_growth).
+    """
+    growth = year_growth(matrix).to_numpy()
+    if growth.shape[1]:
+        growth = growth[:, -1]
+    else:
+        growth = np.full(len(matrix), np.nan)
+    sales = matrix.to_numpy(dtype='float64')
+    years = matrix.columns.to_numpy()
+    if sales.shape[1] == 0:
+        # Sin años: ninguna fila tiene ventas y el resultado queda vacio
+        sales = np.zeros((len(matrix), 1))
+        years = np.zeros(1, dtype=int)
+    steps = np.arange(sales.shape[1])
+
+    selling = sales > 0
+    has_sales = selling.any(axis=1)
+    first = np.argmax(selling, axis=1)
+    last = sales.shape[1] - 1 - np.argmax(selling[:, ::-1], axis=1)
+    peak = np.argmax(sales, axis=1)
+    peak_sales = sales[np.arange(len(sales)), peak]
+
+    after_peak = ((sales <= peak_sales[:, None] / 2)
+                  & (steps[None, :] > peak[:, None]))
+    fell = after_peak.any(axis=1)
+    half_life = np.where(fell, np.argmax(after_peak, axis=1) - peak, np.nan)
+
+    metrics = pd.DataFrame({
+        'first_year': years[first],
+        'peak_year': years[peak],
+        'last_year': years[last],
+        'lifespan': last - first + 1,
+        'peak_sales': peak_sales,
+        'total_sales': sales.sum(axis=1),
+        'latest_sales': sales[:, -1],
+        'half_life': half_life,
+        'latest_growth': growth,
+    }, index=matrix.index)
+    return metrics[has_sales]
+
+
+def platform_lifecycles(cube, regions=MEASURES):
+    """lifecycle_metrics para todas las plataformas x regiones del cubo."""
+    return lifecycle_metrics(year_matrix(cube, regions))
+
+
+def typical_lifespan(lifecycles, region='total_sales'):
+    """Mediana de vida (años) de las plataformas que ya dejaron de vender."""
+    if lifecycles.empty:
+        return float('nan')
+    table = lifecycles.xs(region, level='region')
+    latest = table['last_year'].max()
+    return float(table.loc[table['last_year'] < latest, 'lifespan'].median())
+
+
+def active_platforms(lifecycles, region='total_sales',
+                     min_share=ACTIVE_MIN_SHARE):
+    """Plataformas activas segun la regla, de mayor a menor venta reciente."""
+    if lifecycles.empty:
+        return []
+    table = lifecycles.xs(region, level='region')
+    latest = table['last_year'].max()
+    share = table['latest_sales'] / table['latest_sales'].sum()
+    age = latest - table['first_year'] + 1
+    active = table[(table['last_year'] == latest) & (share >= min_share)
+                   & (age <= typical_lifespan(lifecycles, region))]
+    return list(active.sort_values('latest_sales', ascending=False).index)
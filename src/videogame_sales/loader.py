@@ -0,0 +1,144 @@
+# coding: utf-8
+
+# Cargador tipado del catalogo de videojuegos.
+# Declara el esquema completo antes de leer para que el CSV se convierta en
+# una sola pasada, sin los astype/replace posteriores del notebook.
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .instrument import stage
+
+
+DEFAULT_PATH = Path(__file__).resolve().parents[2] / 'Data' / 'games.csv'
+
+# Subir este numero cuando cambien las reglas de limpieza de load_games,
+# asi se invalidan las tablas guardadas en cache
+CLEANING_VERSION = 1
+
+SALES_COLUMNS = ['na_sales', 'eu_sales', 'jp_sales', 'other_sales']
+
+# Esquema del CSV original (con los nombres tal como vienen en el archivo)
+COLUMN_DTYPES = {
+    'Name': 'string',
+    'Platform': 'category',
+    'Year_of_Release': 'Int16',
+    'Genre': 'category',
+    'NA_sales': 'float32',
+    'EU_sales': 'float32',
+    'JP_sales': 'float32',
+    'Other_sales': 'float32',
+    'Critic_Score': 'Int8',
+    'User_Score': 'float32',
+    'Rating': 'category',
+}
+
+# El mismo esquema con los nombres ya en snake_case
+SCHEMA = {column.lower(): dtype for column, dtype in COLUMN_DTYPES.items()}
+
+CATEGORY_COLUMNS = [c for c, dtype in SCHEMA.items() if dtype == 'category']
+
+# 'tbd' en user_score significa que aun no hay calificacion
+NA_VALUES = ['tbd']
+
+DEFAULT_CHUNKSIZE = 250_000
+
+
+def _default_engine():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return 'c'
+    return 'pyarrow'
+
+
+def load_games(path=DEFAULT_PATH, engine=None, compact=False):
+    """Carga y limpia el catalogo de juegos en una sola pasada.
+
+    Devuelve el DataFrame con columnas en snake_case, tipos compactos,
+    sin las filas que no tienen name/genre y con `total_sales` calculado.
+    Con compact=True name se guarda como pool de categorias (ver
+    compact.compact_games).
+    """
+    if engine is None:
+        engine = _default_engine()
+
+    with stage('load.parse', engine=engine) as ctx:
+        df = pd.read_csv(path, dtype=COLUMN_DTYPES,
+                         na_values=NA_VALUES, engine=engine)
+        ctx['rows_out'] = len(df)
+    with stage('load.clean', rows_in=len(df)) as ctx:
+        df = _finish(_snake_case(df))
+        ctx['rows_out'] = len(df)
+    if compact:
+        from .compact import compact_games
+        df = compact_games(df)
+    return df
+
+
+def read_games_chunks(path=DEFAULT_PATH, chunksize=DEFAULT_CHUNKSIZE):
+    """Lee y limpia el CSV por bloques de `chunksize` filas.
+
+    Cada bloque pasa por las mismas reglas que load_games; la memoria usada
+    depende del tamaño del bloque y no del archivo. El motor pyarrow no
+    soporta lectura por bloques, asi que aqui siempre se usa el de C.
+    """
+    reader = pd.read_csv(path, dtype=COLUMN_DTYPES, na_values=NA_VALUES,
+                         chunksize=chunksize)
+    with reader:
+        for chunk in reader:
+            with stage('load.chunk', rows_in=len(chunk)) as ctx:
+                chunk = _finish(_snake_case(chunk))
+                ctx['rows_out'] = len(chunk)
+            yield chunk
+
+
+def clean_games(raw):
+    """Aplica las mismas reglas de load_games a un DataFrame ya en memoria.
+
+    Sirve para lotes que no vienen de un CSV (p. ej. el feed diario); acepta
+    columnas con los nombres originales o en snake_case.
+    """
+    with stage('clean', rows_in=len(raw)) as ctx:
+        df = _snake_case(raw).replace(NA_VALUES, np.nan)
+        for column, dtype in SCHEMA.items():
+            if dtype not in ('string', 'category'):
+                df[column] = pd.to_numeric(df[column])
+        df = _finish(df.astype(SCHEMA)[list(SCHEMA)])
+        ctx['rows_out'] = len(df)
+    return df
+
+
+def align_categories(*frames):
+    """Unifica las categorias de platform/genre/rating entre DataFrames.
+
+    pd.concat convierte a object las categoricas con categorias distintas;
+    despues de alinear, la concatenacion conserva el tipo category.
+    """
+    aligned = [frame.copy(deep=False) for frame in frames]
+    for column in CATEGORY_COLUMNS:
+        categories = pd.Index([])
+        for frame in aligned:
+            if column in frame:
+                categories = categories.union(frame[column].cat.categories)
+        for frame in aligned:
+            if column in frame:
+                frame[column] = frame[column].cat.set_categories(categories)
+    return aligned
+
+
+def _snake_case(df):
+    df = df.copy(deep=False)
+    df.columns = df.columns.str.lower().str.replace(' ', '_')
+    return df
+
+
+def _finish(df):
+    # Las filas sin name tampoco tienen genre, no sirven para el analisis
+    df = df.dropna(subset=['name', 'genre'])
+    df = df.reset_index(drop=True)
+
+    df['total_sales'] = df[SALES_COLUMNS].sum(axis=1)
+    return df
@@ -0,0 +1,177 @@
+# coding: utf-8
+
+# Graficos del analisis. matplotlib y seaborn se importan dentro de cada
+# funcion para que cargar el paquete no pague ese costo. Ninguna funcion
+# llama a plt.show(): devuelven la figura y el que llama decide si
+# mostrarla o guardarla.
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+import numpy as np
+import pandas as pd
+
+
+# Con headless() activo las figuras se crean con Figure + FigureCanvasAgg,
+# sin pasar por pyplot ni cambiar el backend del que llama
+_HEADLESS = ContextVar('headless', default=False)
+
+
+@contextmanager
+def headless():
+    """Crea las figuras fuera de pyplot (para guardarlas sin pantalla)."""
+    token = _HEADLESS.set(True)
+    try:
+        yield
+    finally:
+        _HEADLESS.reset(token)
+
+
+def _pyplot():
+    from matplotlib import pyplot as plt
+    return plt
+
+
+def _subplots(*args, **kwargs):
+    if not _HEADLESS.get():
+        return _pyplot().subplots(*args, **kwargs)
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    fig = Figure(figsize=kwargs.pop('figsize', None))
+    FigureCanvasAgg(fig)
+    return fig, fig.subplots(*args, **kwargs)
+
+
+def games_per_year(counts):
+    fig, ax = _subplots(figsize=(10, 5))
+    ax.bar(counts.index, counts.values)
+    ax.set_xlabel('Año de lanzamiento')
+    ax.set_ylabel('Numero de juegos lanzados')
+    ax.set_title('Cantidad de juegos lanzados por año')
+    ax.grid(axis='y')
+    fig.tight_layout()
+    return fig
+
+
+def platform_sales_trend(year_sales, title):
+    import seaborn as sns
+    fig, ax = _subplots(figsize=(12, 6))
+    # Como texto para que la leyenda no liste las categorias sin datos
+    sns.lineplot(data=year_sales, x='year_of_release', y='total_sales',
+                 hue=year_sales['platform'].astype(str), ax=ax)
+    ax.set_title(title)
+    ax.set_xlabel('Año de lanzamiento')
+    ax.set_ylabel('Ventas globales [M]')
+    ax.grid(True)
+    fig.tight_layout()
+    return fig
+
+
+def sales_boxplot(df, platforms, title):
+    import seaborn as sns
+    fig, ax = _subplots(figsize=(12, 6))
+    sns.boxplot(data=df, x='platform', y='total_sales', order=platforms,
+                ax=ax)
+    ax.set_title(title)
+    ax.set_xlabel('Plataforma')
+    ax.set_ylabel('Ventas globales [M]')
+    ax.grid(True)
+    return fig
+
+
+# Arriba de este numero de puntos score_vs_sales usa la malla 2D
+SCATTER_MAX_POINTS = 20_000
+
+SCATTER_MODES = ('auto', 'points', 'hist2d', 'sample')
+
+
+def score_vs_sales(df, score, title, xlabel, mode='auto', bins=60,
+                   max_points=5000):
+    """Dispersion de `score` vs total_sales.
+
+    mode='points' dibuja un marcador por juego, 'hist2d' cuenta los juegos
+    en una malla (color en escala log) y 'sample' dibuja una submuestra
+    estratificada con los atipicos. 'auto' usa 'points' hasta
+    SCATTER_MAX_POINTS filas y 'hist2d' arriba de eso.
+    """
+    if mode not in SCATTER_MODES:
+        raise ValueError(f'modo no soportado: {mode!r}')
+    if mode == 'auto':
+        mode = 'points' if len(df) <= SCATTER_MAX_POINTS else 'hist2d'
+
+    fig, ax = _subplots(figsize=(12, 5))
+    if mode == 'hist2d':
+        from matplotlib.colors import LogNorm
+
+        from .density import bin_points
+        counts, x_edges, y_edges = bin_points(df[score], df['total_sales'],
+                                              bins=bins)
+        counts = np.ma.masked_equal(counts, 0)
+        # Sin puntos la malla queda toda enmascarada y LogNorm no tiene
+        # rango: se deja el eje vacio
+        if counts.count():
+            mesh = ax.pcolormesh(x_edges, y_edges, counts.T, norm=LogNorm(),
+                                 cmap='viridis')
+            fig.colorbar(mesh, ax=ax, label='Juegos')
+    else:
+        import seaborn as sns
+        if mode == 'sample':
+            from .density import downsample_points
+            x, y = downsample_points(df[score], df['total_sales'],
+                                     max_points=max_points)
+            df = pd.DataFrame({score: x, 'total_sales': y})
+        sns.scatterplot(data=df, x=score, y='total_sales', alpha=0.5, ax=ax)
+    ax.set_title(title)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel('Ventas Globales [M]')
+    ax.grid(True)
+    return fig
+
+
+def genre_overview(stats):
+    """Numero de juegos, ventas totales y promedio por genero (3 paneles)."""
+    import seaborn as sns
+    fig, axes = _subplots(1, 3, figsize=(14, 6))
+    panels = [
+        ('count', 'viridis', 'Número de juegos por género',
+         'Número de juegos'),
+        ('total', 'plasma', 'Ventas totales por género',
+         'Ventas globales [M]'),
+        ('mean', 'magma', 'Promedio de ventas por género',
+         'Promedio de ventas [M]'),
+    ]
+    for ax, (column, palette, title, xlabel) in zip(axes, panels):
+        values = stats[column].sort_values(ascending=False)
+        labels = values.index.astype(str)
+        sns.barplot(x=values.values, y=labels, hue=labels, alpha=0.7,
+                    palette=palette, legend=False, ax=ax)
+        ax.set_title(title)
+        ax.set_xlabel(xlabel)
+        ax.set_ylabel('Género')
+    fig.tight_layout()
+    return fig
+
+
+def region_bars(series_by_region, titles, colors, xlabel):
+    """Una barra por region (NA, EU, JP) con las series ya ordenadas."""
+    fig, axes = _subplots(1, len(series_by_region), figsize=(20, 6))
+    for ax, series, title, color in zip(axes, series_by_region, titles,
+                                        colors):
+        series.plot(kind='bar', ax=ax, color=color)
+        ax.set_title(title)
+        ax.set_xlabel(xlabel)
+    axes[0].set_ylabel('Ventas en millones')
+    fig.tight_layout()
+    return fig
+
+
+def esrb_sales(pivot):
+    fig, ax = _subplots(figsize=(10, 6))
+    pivot.plot(kind='bar', ax=ax)
+    ax.set_title('Ventas promedio por clasificacion ESRB y región')
+    ax.set_xlabel('Clasificación ESRB')
+    ax.set_ylabel('Ventas promedio [M]')
+    ax.grid(axis='y')
+    ax.tick_params(axis='x', rotation=0)
+    fig.tight_layout()
+    return fig
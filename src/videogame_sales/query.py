@@ -0,0 +1,145 @@
+# coding: utf-8
+
+# Capa de consultas con memoria sobre la tabla limpia.
+# El notebook arma los mismos subconjuntos una y otra vez (df_recent,
+# recent_years, las filas de PS4...). GamesQuery guarda cada subconjunto
+# bajo la llave de su predicado (rango de años, plataformas, generos,
+# columnas sin nulos) en un LRU acotado por entradas y por bytes, y lo
+# descarta todo cuando la tabla base cambia.
+
+import threading
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+import pandas as pd
+
+
+QueryKey = namedtuple('QueryKey',
+                      ['since', 'until', 'platforms', 'genres', 'notna'])
+
+
+def _frozen(values):
+    if values is None:
+        return None
+    if isinstance(values, str):
+        values = [values]
+    return frozenset(values)
+
+
+def _columns(values):
+    if isinstance(values, str):
+        values = [values]
+    return tuple(sorted(values))
+
+
+class GamesQuery:
+    """Subconjuntos filtrados y memorizados de una tabla de juegos.
+
+    `source` puede ser un GamesStore (se consulta siempre su tabla actual
+    y cada ingesta, que sube su `version`, invalida la memoria), un
+    SortedGames (los filtros de año/plataforma/genero usan sus indices) o
+    un DataFrame. Un DataFrame no tiene version: se toma una foto al crear
+    el GamesQuery (copia superficial; con copy-on-write no copia datos) y
+    las ediciones posteriores del DataFrame original no se ven. Para
+    consultar una tabla que cambia, usar un GamesStore o crear otro
+    GamesQuery.
+    """
+
+    def __init__(self, source, max_entries=64, max_bytes=512 * 2**20):
+        if isinstance(source, pd.DataFrame):
+            source = source.copy(deep=False)
+        self.source = source
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._base_table = None
+        self._base_version = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def table(self):
+        return getattr(self.source, 'table', self.source)
+
+    def _changed(self):
+        # La tabla "cambio" si es otro objeto (se guarda la referencia, no
+        # el id, que se puede reutilizar) u otra version del store
+        return (self.table is not self._base_table
+                or getattr(self.source, 'version', None)
+                != self._base_version)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def select(self, since=None, until=None, platforms=None, genres=None,
+               notna=()):
+        """Filas que cumplen todos los filtros dados.
+
+        since/until son años inclusivos (los años nulos quedan fuera si se
+        da alguno de los dos); notna son columnas que no deben ser nulas.
+        """
+        key = QueryKey(since, until, _frozen(platforms), _frozen(genres),
+                       _columns(notna))
+        with self._lock:
+            if self._changed():
+                self._entries.clear()
+                self._bytes = 0
+                self._base_table = self.table
+                self._base_version = getattr(self.source, 'version', None)
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key][0]
+            self.misses += 1
+
+        result = self._evaluate(key)
+        size = int(result.memory_usage(index=True, deep=False).sum())
+        with self._lock:
+            # Otro hilo pudo calcular la misma llave mientras tanto: se
+            # conserva esa entrada para no contar sus bytes dos veces
+            if key in self._entries:
+                return self._entries[key][0]
+            if not self._changed() and size <= self.max_bytes:
+                self._entries[key] = (result, size)
+                self._bytes += size
+                self._evict()
+        return result
+
+    def _evaluate(self, key):
+        table = self.table
+        if hasattr(self.source, 'positions'):
+            rows = self.source.select(key.since, key.until, key.platforms,
+                                      key.genres)
+            for column in key.notna:
+                rows = rows[rows[column].notna().to_numpy(bool)]
+            return rows
+
+        mask = np.ones(len(table), dtype=bool)
+        if key.since is not None or key.until is not None:
+            years = table['year_of_release'].to_numpy(dtype='float64',
+                                                      na_value=np.nan)
+            if key.since is not None:
+                mask &= years >= key.since
+            if key.until is not None:
+                mask &= years <= key.until
+        if key.platforms is not None:
+            mask &= table['platform'].isin(key.platforms).to_numpy(bool)
+        if key.genres is not None:
+            mask &= table['genre'].isin(key.genres).to_numpy(bool)
+        for column in key.notna:
+            mask &= table[column].notna().to_numpy(bool)
+        return table[mask]
+
+    def _evict(self):
+        while self._entries and (len(self._entries) > self.max_entries
+                                 or self._bytes > self.max_bytes):
+            _, (_, size) = self._entries.popitem(last=False)
+            self._bytes -= size
+
+    def info(self):
+        return {'entries': len(self._entries), 'bytes': self._bytes,
+                'hits': self.hits, 'misses': self.misses}
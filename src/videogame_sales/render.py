@@ -0,0 +1,121 @@
+# coding: utf-8
+
+# Render de figuras sin pantalla para los reportes nocturnos.
+# Cada figura se dibuja con Figure + FigureCanvasAgg (sin pyplot, asi no se
+# cambia el backend del que llama), opcionalmente en un pool de procesos, y
+# se guarda en PNG/SVG. En la carpeta de salida queda un manifest con el
+# hash de los datos de entrada de cada figura; si el hash no cambio y los
+# archivos existen, la figura no se vuelve a dibujar.
+
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .instrument import stage
+
+
+FORMATS = ('png', 'svg')
+MANIFEST = 'figures.json'
+
+# Subir este numero cuando cambie el estilo de plots.py, para redibujar todo
+RENDER_VERSION = 1
+
+
+def _update_hash(digest, value):
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        labels = (list(value.columns) if isinstance(value, pd.DataFrame)
+                  else value.name)
+        digest.update(repr(labels).encode())
+        digest.update(repr(value.dtypes).encode())
+        digest.update(pd.util.hash_pandas_object(value, index=True)
+                      .to_numpy().tobytes())
+    elif isinstance(value, (list, tuple)):
+        digest.update(b'[')
+        for item in value:
+            _update_hash(digest, item)
+        digest.update(b']')
+    elif isinstance(value, dict):
+        for key in sorted(value):
+            digest.update(repr(key).encode())
+            _update_hash(digest, value[key])
+    elif isinstance(value, np.ndarray):
+        digest.update(value.tobytes())
+    else:
+        digest.update(repr(value).encode())
+
+
+def spec_hash(func, args, kwargs):
+    """Hash de una figura: funcion, datos de entrada y version de estilo."""
+    digest = hashlib.blake2b(digest_size=16)
+    _update_hash(digest, (RENDER_VERSION, func, args, kwargs))
+    return digest.hexdigest()
+
+
+def _init_worker():
+    import matplotlib
+    matplotlib.use('Agg')
+
+
+def _render_one(name, func, args, kwargs, output_dir, formats):
+    from . import plots
+
+    with stage('render.figure', figure=name), plots.headless():
+        fig = getattr(plots, func)(*args, **kwargs)
+        for fmt in formats:
+            fig.savefig(Path(output_dir) / f'{name}.{fmt}')
+    return name
+
+
+def render_figures(df, report, output_dir, formats=('png',), workers=1,
+                   force=False):
+    """Dibuja las figuras del reporte en `output_dir`.
+
+    Devuelve {nombre: 'rendered' | 'cached'}. Con force=True se ignoran los
+    hashes guardados.
+    """
+    from .report import figure_specs
+
+    for fmt in formats:
+        if fmt not in FORMATS:
+            raise ValueError(f'formato no soportado: {fmt!r}')
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = output_dir / MANIFEST
+    manifest = {}
+    if manifest_path.exists() and not force:
+        manifest = json.loads(manifest_path.read_text())
+
+    specs = figure_specs(df, report)
+    hashes = {name: spec_hash(*spec) for name, spec in specs.items()}
+    status, pending = {}, []
+    for name, spec in specs.items():
+        outputs = [output_dir / f'{name}.{fmt}' for fmt in formats]
+        if (manifest.get(name) == hashes[name]
+                and all(path.exists() for path in outputs)):
+            status[name] = 'cached'
+        else:
+            pending.append(name)
+
+    jobs = [(name, *specs[name], str(output_dir), formats)
+            for name in pending]
+    with stage('render', figures=len(specs), pending=len(jobs),
+               workers=workers):
+        if workers == 1 or len(jobs) <= 1:
+            done = [_render_one(*job) for job in jobs]
+        else:
+            with ProcessPoolExecutor(max_workers=workers,
+                                     initializer=_init_worker) as pool:
+                done = list(pool.map(_render_one, *zip(*jobs)))
+
+    for name in done:
+        status[name] = 'rendered'
+        manifest[name] = hashes[name]
+    tmp = manifest_path.with_name(MANIFEST + '.tmp')
+    tmp.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    os.replace(tmp, manifest_path)
+    return {name: status[name] for name in specs}
@@ -0,0 +1,176 @@
+# coding: utf-8
+
+# Reporte completo: las mismas secciones del notebook, calculadas con las
+# funciones del paquete.
+
+import numpy as np
+import pandas as pd
+
+from . import aggregations as agg
+from .cube import SalesCube
+from .instrument import stage
+from .lifecycle import active_platforms, platform_lifecycles, typical_lifespan
+from .stats import pairwise_welch, welch_from_moments
+
+
+REGION_LABELS = {'na_sales': 'NA', 'eu_sales': 'EU', 'jp_sales': 'JP'}
+
+# (nombre, columna, grupo a, grupo b) de las pruebas de hipotesis
+HYPOTHESES = [
+    ('xone_vs_pc_user_score', 'platform', 'XOne', 'PC'),
+    ('action_vs_sports_user_score', 'genre', 'Action', 'Sports'),
+]
+
+
+def _cube_correlations(cube, platforms):
+    """Misma tabla que agg.score_correlations, calculada desde el cubo."""
+    user = cube.correlation('platform', 'user_score')
+    critic = cube.correlation('platform', 'critic_score')
+    return pd.DataFrame({
+        platform: {'User Score Corr': user[platform],
+                   'Critic Score Corr': critic[platform]}
+        for platform in platforms})
+
+
+def _cube_hypothesis(cube, by, a, b):
+    moments = cube.score_moments(by)
+    if not {a, b} <= set(moments.index[moments['n'] >= 2]):
+        # Sin datos de alguno de los grupos (p. ej. un CSV vacio)
+        return {'statistic': float('nan'), 'pvalue': float('nan')}
+    result = welch_from_moments(*moments.loc[a, ['n', 'mean', 'var']],
+                                *moments.loc[b, ['n', 'mean', 'var']])
+    return {'statistic': float(result.statistic),
+            'pvalue': float(result.pvalue)}
+
+
+def build_report(df=None, cube=None, genre_median=None):
+    """Calcula todas las tablas del analisis a partir de la tabla limpia.
+
+    Los totales, promedios, correlaciones y pruebas t salen de cortes del
+    cubo de agregacion (se construye aqui si no se pasa uno); solo la
+    mediana por genero vuelve a las filas. Con solo el cubo (modo por
+    bloques o cubo de otro backend) la mediana es `genre_median` (desde
+    RECENT_YEAR, indexada por genero) o NaN.
+    """
+    if cube is None:
+        with stage('report.cube', rows_in=len(df)) as ctx:
+            cube = SalesCube.from_frame(df)
+            ctx['cells'] = len(cube.cells)
+    recent = cube.since(agg.RECENT_YEAR)
+    trends = recent.since(agg.TRENDS_YEAR)
+    year_platform = ['year_of_release', 'platform']
+
+    # Las plataformas activas salen de la regla de ciclo de vida en lugar
+    # de la lista fija del notebook
+    with stage('report.lifecycle'):
+        lifecycle = platform_lifecycles(cube)
+        active = active_platforms(lifecycle)
+
+    genre_stats = pd.DataFrame({
+        'count': recent.count('genre'),
+        'total': recent.total('genre'),
+        'mean': recent.mean('genre'),
+    })
+    if df is not None:
+        with stage('report.genre_median', rows_in=len(df)):
+            genre_stats['median'] = agg.filter_since(
+                df, agg.RECENT_YEAR).groupby(
+                    'genre', observed=True)['total_sales'].median()
+    elif genre_median is not None:
+        genre_stats['median'] = pd.Series(genre_median).reindex(
+            genre_stats.index.astype(str)).to_numpy()
+    else:
+        genre_stats['median'] = np.nan
+    genre_stats = genre_stats.sort_values('count', ascending=False)
+
+    with stage('report.sections'):
+        report = {
+            'games_per_year': cube.count('year_of_release').sort_index(
+                ascending=False),
+            'platform_year_sales_top': agg.top_platform_series(
+                recent.total(year_platform).reset_index(), 10),
+            'platform_trends_top': agg.top_platform_series(
+                trends.total(year_platform).reset_index(), 6),
+            'lifecycle': lifecycle,
+            'typical_lifespan': typical_lifespan(lifecycle),
+            'active_platforms': active,
+            'correlations': _cube_correlations(recent, active),
+            'genre_stats': genre_stats,
+            'top_platforms_region': {
+                region: recent.top('platform', region, n=10)
+                for region in agg.REGION_COLUMNS},
+            'top_genres_region': {
+                region: recent.top('genre', region, n=10)
+                for region in agg.REGION_COLUMNS},
+            'esrb_sales': pd.DataFrame({
+                region: recent.mean('rating', region)
+                for region in agg.REGION_COLUMNS}),
+            'rating_counts': recent.count('rating').sort_values(
+                ascending=False),
+            'hypotheses': {
+                name: _cube_hypothesis(recent, by, a, b)
+                for name, by, a, b in HYPOTHESES},
+            # Todos los pares de plataformas y de generos, con correccion
+            # de Holm
+            'pairwise_tests': {
+                by: pairwise_welch(recent.score_moments(by))
+                for by in ('platform', 'genre')},
+        }
+    return report
+
+
+def figure_specs(df, report):
+    """Receta de cada figura: nombre -> (funcion de plots, args, kwargs).
+
+    Los argumentos son solo los agregados (o las columnas) que la figura
+    necesita, de modo que se pueden hashear y mandar a otro proceso.
+    """
+    recent = agg.filter_since(df, agg.RECENT_YEAR)
+    trends = agg.filter_since(recent, agg.TRENDS_YEAR)
+    ps4_games = recent[recent['platform'] == 'PS4']
+    active = report['active_platforms']
+    active_rows = agg.filter_platforms(trends, active)
+    regions = agg.REGION_COLUMNS
+
+    return {
+        'games_per_year': ('games_per_year', (report['games_per_year'],), {}),
+        'platform_sales': ('platform_sales_trend', (
+            report['platform_year_sales_top'],
+            'Ventas totales por año y plataforma'), {}),
+        'platform_trends': ('platform_sales_trend', (
+            report['platform_trends_top'],
+            'Tendencia de ventar por plataforma (desde 2010)'), {}),
+        'active_platforms_boxplot': ('sales_boxplot', (
+            active_rows[['platform', 'total_sales']], active,
+            'Distribución de ventas por plataforma (2010-2016)'), {}),
+        'ps4_user_score': ('score_vs_sales', (
+            ps4_games[['user_score', 'total_sales']], 'user_score',
+            'PS4 Ventas vs Calificaciones de Usuarios',
+            'Calificacion de Usuario'), {}),
+        'ps4_critic_score': ('score_vs_sales', (
+            ps4_games[['critic_score', 'total_sales']], 'critic_score',
+            'PS4 Ventas vs Calificaciones Criticas',
+            'Calificacion de Critica'), {}),
+        'genre_overview': ('genre_overview', (report['genre_stats'],), {}),
+        'platform_region': ('region_bars', (
+            [report['top_platforms_region'][r] for r in regions],
+            ['Ventas por plataforma en Norteamérica',
+             'Ventas por plataforma en Europa',
+             'Ventas por plataforma en Japón'],
+            ['skyblue', 'lightgreen', 'salmon'], 'Plataforma'), {}),
+        'genre_region': ('region_bars', (
+            [report['top_genres_region'][r] for r in regions],
+            ['Ventas por género en NA', 'Ventas por género en EU',
+             'Ventas por género en JP'],
+            ['mediumslateblue', 'mediumseagreen', 'coral'], 'Género'), {}),
+        'esrb_sales': ('esrb_sales', (report['esrb_sales'],), {}),
+    }
+
+
+def build_figures(df, report):
+    """Genera las figuras del reporte (importa matplotlib/seaborn aqui)."""
+    from . import plots
+
+    return {name: getattr(plots, func)(*args, **kwargs)
+            for name, (func, args, kwargs)
+            in figure_specs(df, report).items()}
@@ -0,0 +1,204 @@
+# coding: utf-8
+
+# Bootstrap y pruebas de permutacion para las estadisticas del analisis
+# (medias por grupo, r de Pearson, t de Welch).
+# Cada lote de remuestreos se genera como una matriz de indices (lote x n) y
+# la estadistica se calcula por filas con NumPy. Los lotes se reparten en un
+# pool de procesos; cada lote tiene su propia semilla derivada de la semilla
+# principal (SeedSequence.spawn), asi el resultado no depende del numero de
+# procesos.
+
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+
+BootstrapResult = namedtuple('BootstrapResult',
+                             ['estimate', 'low', 'high', 'n_resamples'])
+PermutationResult = namedtuple('PermutationResult',
+                               ['statistic', 'pvalue', 'n_resamples'])
+
+# Tamaño de lote: a lo mas BATCH_ROWS remuestreos y BATCH_ELEMENTS indices
+# (~32 MB en int64). No depende del numero de procesos, para que los
+# resultados tampoco dependan de el.
+BATCH_ROWS = 500
+BATCH_ELEMENTS = 1 << 22
+
+
+# Estadisticas por filas: cada una recibe matrices (lote x n)
+
+def _mean(x):
+    return x.mean(axis=1)
+
+
+def _pearson(x, y):
+    xc = x - x.mean(axis=1, keepdims=True)
+    yc = y - y.mean(axis=1, keepdims=True)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return (xc * yc).sum(axis=1) / np.sqrt(
+            (xc * xc).sum(axis=1) * (yc * yc).sum(axis=1))
+
+
+def _mean_diff(a, b):
+    return a.mean(axis=1) - b.mean(axis=1)
+
+
+def _welch_t(a, b):
+    se = (a.var(axis=1, ddof=1) / a.shape[1]
+          + b.var(axis=1, ddof=1) / b.shape[1])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return (a.mean(axis=1) - b.mean(axis=1)) / np.sqrt(se)
+
+
+# nombre -> (funcion, tipo). 'paired': los arreglos comparten filas (x, y);
+# 'two_sample': dos muestras independientes (a, b).
+STATISTICS = {
+    'mean': (_mean, 'paired'),
+    'pearson': (_pearson, 'paired'),
+    'mean_diff': (_mean_diff, 'two_sample'),
+    'welch_t': (_welch_t, 'two_sample'),
+}
+
+
+def _observed(statistic, data):
+    func, _ = STATISTICS[statistic]
+    return float(func(*(np.asarray(d)[np.newaxis, :] for d in data))[0])
+
+
+def _bootstrap_batch(statistic, data, seed, size):
+    func, kind = STATISTICS[statistic]
+    rng = np.random.default_rng(seed)
+    if kind == 'paired':
+        n = len(data[0])
+        idx = rng.integers(0, n, size=(size, n))
+        return func(*(d[idx] for d in data))
+    # Cada muestra se remuestrea por separado
+    return func(*(d[rng.integers(0, len(d), size=(size, len(d)))]
+                  for d in data))
+
+
+def _permutation_batch(statistic, data, seed, size):
+    func, kind = STATISTICS[statistic]
+    rng = np.random.default_rng(seed)
+    if kind == 'paired':
+        # Se rompe el emparejamiento permutando el segundo arreglo
+        x, y = data
+        idx = rng.permuted(np.tile(np.arange(len(y)), (size, 1)), axis=1)
+        return func(np.broadcast_to(x, idx.shape), y[idx])
+    a, b = data
+    pooled = np.concatenate([a, b])
+    idx = rng.permuted(np.tile(np.arange(len(pooled)), (size, 1)), axis=1)
+    shuffled = pooled[idx]
+    return func(shuffled[:, :len(a)], shuffled[:, len(a):])
+
+
+_BATCHES = {'bootstrap': _bootstrap_batch, 'permutation': _permutation_batch}
+
+# Datos del proceso trabajador, se cargan una vez por proceso
+_worker_data = None
+
+
+def _init_worker(data):
+    global _worker_data
+    _worker_data = data
+
+
+def _run_worker_batch(mode, statistic, seed, size):
+    return _BATCHES[mode](statistic, _worker_data, seed, size)
+
+
+def _batch_sizes(n_resamples, n):
+    per_batch = max(1, min(BATCH_ROWS, BATCH_ELEMENTS // max(n, 1)))
+    sizes = [per_batch] * (n_resamples // per_batch)
+    if n_resamples % per_batch:
+        sizes.append(n_resamples % per_batch)
+    return sizes
+
+
+def resample(mode, statistic, data, n_resamples, seed=0, workers=1):
+    """Distribucion remuestreada de `statistic` (n_resamples valores).
+
+    mode es 'bootstrap' o 'permutation'. Con workers > 1 los lotes se
+    calculan en un ProcessPoolExecutor; el resultado es el mismo para
+    cualquier numero de procesos con la misma semilla.
+    """
+    if statistic not in STATISTICS:
+        raise ValueError(f'estadistica no soportada: {statistic!r}')
+    data = tuple(np.asarray(d, dtype='float64') for d in data)
+    sizes = _batch_sizes(n_resamples, sum(len(d) for d in data))
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+    if workers == 1:
+        parts = [_BATCHES[mode](statistic, data, s, size)
+                 for s, size in zip(seeds, sizes)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=_init_worker,
+                                 initargs=(data,)) as pool:
+            parts = list(pool.map(_run_worker_batch, [mode] * len(sizes),
+                                  [statistic] * len(sizes), seeds, sizes))
+    return np.concatenate(parts)
+
+
+def bootstrap_ci(statistic, data, n_resamples=10_000, confidence=0.95,
+                 seed=0, workers=1):
+    """Intervalo de confianza bootstrap por percentiles."""
+    distribution = resample('bootstrap', statistic, data, n_resamples,
+                            seed, workers)
+    tail = (1 - confidence) / 2
+    low, high = np.nanquantile(distribution, [tail, 1 - tail])
+    return BootstrapResult(_observed(statistic, data), float(low),
+                           float(high), n_resamples)
+
+
+def permutation_test(statistic, data, n_resamples=10_000, seed=0,
+                     workers=1):
+    """p-valor de dos colas de una prueba de permutacion.
+
+    Para 'pearson'/'mean' se permuta el segundo arreglo contra el primero;
+    para 'welch_t'/'mean_diff' se reasignan las etiquetas de grupo.
+    """
+    if statistic == 'mean':
+        raise ValueError("la prueba de permutacion necesita dos arreglos; "
+                         "use 'pearson', 'mean_diff' o 'welch_t'")
+    observed = _observed(statistic, data)
+    distribution = resample('permutation', statistic, data, n_resamples,
+                            seed, workers)
+    extreme = np.count_nonzero(np.abs(distribution) >= abs(observed))
+    return PermutationResult(observed,
+                             float((extreme + 1) / (n_resamples + 1)),
+                             n_resamples)
+
+
+def score_intervals(df, n_resamples=10_000, seed=0, workers=1):
+    """IC bootstrap y p-valores de permutacion para las conclusiones del
+    notebook: correlaciones de PS4 y las dos pruebas de user_score.
+    """
+    import pandas as pd
+
+    from .aggregations import RECENT_YEAR, SCORE_COLUMNS, filter_since
+    from .report import HYPOTHESES
+    from .stats import group_values
+
+    recent = filter_since(df, RECENT_YEAR)
+    ps4 = recent[recent['platform'] == 'PS4'][
+        SCORE_COLUMNS + ['total_sales']].dropna().astype('float64')
+
+    cases = [(f'PS4 {score} vs total_sales', 'pearson',
+              (ps4[score], ps4['total_sales'])) for score in SCORE_COLUMNS]
+    for name, by, a, b in HYPOTHESES:
+        cases.append((name, 'welch_t',
+                      (group_values(recent, 'user_score', by, a),
+                       group_values(recent, 'user_score', by, b))))
+
+    rows = []
+    for name, statistic, data in cases:
+        ci = bootstrap_ci(statistic, data, n_resamples, seed=seed,
+                          workers=workers)
+        test = permutation_test(statistic, data, n_resamples, seed=seed,
+                                workers=workers)
+        rows.append({'case': name, 'statistic': statistic,
+                     'estimate': ci.estimate, 'low': ci.low, 'high': ci.high,
+                     'perm_pvalue': test.pvalue})
+    return pd.DataFrame(rows).set_index('case')
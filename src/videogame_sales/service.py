@@ -0,0 +1,291 @@
+# coding: utf-8
+
+# Servicio HTTP/JSON local para consultar el analisis sin correr el batch.
+# La tabla limpia y el cubo se cargan una sola vez al arrancar; cada endpoint
+# corta el cubo con los parametros de la URL. Las respuestas se guardan en un
+# LRU por (ruta, parametros) y el servidor atiende peticiones en hilos.
+#
+#   python -m videogame_sales.service --port 8000
+#   curl 'localhost:8000/top?region=eu_sales&since=2010&n=5'
+
+import argparse
+import functools
+import json
+import math
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+from .cube import MEASURES, SalesCube
+from .loader import DEFAULT_PATH
+
+
+GROUP_KEYS = ('platform', 'genre', 'rating', 'year_of_release')
+DEFAULT_CACHE_SIZE = 1024
+
+
+class BadRequest(ValueError):
+    pass
+
+
+def _finite(obj):
+    # NaN/inf no son JSON valido: se mandan como null
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(value) for value in obj]
+    return obj
+
+
+def _records(obj):
+    """DataFrame/Series -> lista de dicts serializable (NaN -> null)."""
+    unnamed = all(name is None for name in obj.index.names)
+    frame = obj.reset_index(drop=unnamed)
+    return json.loads(frame.to_json(orient='records'))
+
+
+class QueryService:
+    """Endpoints del analisis sobre una tabla y su cubo ya cargados."""
+
+    def __init__(self, table, cube=None, cache_size=DEFAULT_CACHE_SIZE):
+        from .index import SortedGames
+        from .query import GamesQuery
+
+        # Las consultas por filas (Spearman) cortan rangos de años sobre la
+        # tabla ordenada por (platform, year_of_release) con busqueda binaria
+        self.index = SortedGames(table)
+        self.table = self.index.table
+        self.cube = cube if cube is not None else SalesCube.from_frame(table)
+        self.query = GamesQuery(self.index)
+        self.endpoints = {
+            '/health': self.health,
+            '/top': self.top,
+            '/genres': self.genres,
+            '/esrb': self.esrb,
+            '/correlations': self.correlations,
+            '/welch': self.welch,
+            '/welch/pairs': self.welch_pairs,
+            '/lifecycle': self.lifecycle,
+        }
+        self._respond = functools.lru_cache(maxsize=cache_size)(
+            self._compute)
+
+    # Parametros
+
+    @staticmethod
+    def _int(params, name, default=None):
+        value = params.get(name)
+        if value is None:
+            return default
+        try:
+            return int(value)
+        except ValueError:
+            raise BadRequest(f'{name} debe ser entero: {value!r}') from None
+
+    @staticmethod
+    def _choice(params, name, choices, default):
+        value = params.get(name, default)
+        if value not in choices:
+            raise BadRequest(f'{name} debe ser uno de {list(choices)}')
+        return value
+
+    def _slice(self, params):
+        since = self._int(params, 'since')
+        until = self._int(params, 'until')
+        cube = self.cube
+        if since is not None and until is not None:
+            return cube.between(since, until)
+        if since is not None:
+            return cube.since(since)
+        if until is not None:
+            return cube.between(-1, until)
+        return cube
+
+    # Endpoints
+
+    def health(self, params):
+        return {'status': 'ok', 'rows': len(self.table),
+                'cube_cells': len(self.cube)}
+
+    def top(self, params):
+        by = self._choice(params, 'by', GROUP_KEYS, 'platform')
+        region = self._choice(params, 'region', MEASURES, 'total_sales')
+        n = self._int(params, 'n', 5)
+        return _records(self._slice(params).top(by, region, n))
+
+    def genres(self, params):
+        import pandas as pd
+
+        region = self._choice(params, 'region', MEASURES, 'total_sales')
+        cube = self._slice(params)
+        stats = pd.DataFrame({
+            'count': cube.count('genre'),
+            'total': cube.total('genre', region),
+            'mean': cube.mean('genre', region),
+            'var': cube.var('genre', region),
+        }).sort_values('total', ascending=False)
+        return _records(stats)
+
+    def esrb(self, params):
+        import pandas as pd
+
+        cube = self._slice(params)
+        return _records(pd.DataFrame({
+            region: cube.mean('rating', region)
+            for region in ('na_sales', 'eu_sales', 'jp_sales')}))
+
+    def correlations(self, params):
+        by = self._choice(params, 'by', GROUP_KEYS, 'platform')
+        method = self._choice(params, 'method', ('pearson', 'spearman'),
+                              'pearson')
+        if method == 'pearson':
+            import pandas as pd
+
+            cube = self._slice(params)
+            table = pd.DataFrame({
+                'n': cube.sums(by, 'scored_count'),
+                'user_score': cube.correlation(by, 'user_score'),
+                'critic_score': cube.correlation(by, 'critic_score'),
+            })
+            return _records(table[table['n'] > 0])
+
+        # Spearman necesita los rangos, se calcula sobre las filas
+        from .correlations import grouped_correlations
+        rows = self.query.select(since=self._int(params, 'since'),
+                                 until=self._int(params, 'until'))
+        return _records(grouped_correlations(rows, by, methods=['spearman']))
+
+    def welch(self, params):
+        from .stats import welch_from_moments
+
+        by = self._choice(params, 'by', GROUP_KEYS, 'platform')
+        a, b = params.get('a'), params.get('b')
+        if not a or not b:
+            raise BadRequest('faltan los grupos a y b')
+        moments = self._slice(params).score_moments(by)
+        if moments.index.dtype.kind in 'iu':
+            # year_of_release: los grupos llegan como texto en la URL
+            a, b = self._int(params, 'a'), self._int(params, 'b')
+        for group in (a, b):
+            if group not in moments.index:
+                raise BadRequest(f'grupo sin datos: {group!r}')
+            if moments.loc[group, 'n'] < 2:
+                raise BadRequest(f'grupo con menos de 2 datos: {group!r}')
+        result = welch_from_moments(*moments.loc[a, ['n', 'mean', 'var']],
+                                    *moments.loc[b, ['n', 'mean', 'var']])
+        return {'by': by, 'a': a, 'b': b,
+                'statistic': float(result.statistic),
+                'df': float(result.df), 'pvalue': float(result.pvalue)}
+
+    def welch_pairs(self, params):
+        from .stats import CORRECTIONS, pairwise_welch
+
+        by = self._choice(params, 'by', GROUP_KEYS, 'platform')
+        correction = self._choice(params, 'correction', CORRECTIONS, 'holm')
+        table = pairwise_welch(self._slice(params).score_moments(by),
+                               correction)
+        return _records(table.astype({'group_a': str, 'group_b': str}))
+
+    def lifecycle(self, params):
+        from .lifecycle import active_platforms, platform_lifecycles
+
+        region = self._choice(params, 'region', MEASURES, 'total_sales')
+        lifecycles = platform_lifecycles(self._slice(params))
+        if lifecycles.empty:
+            return {'active_platforms': [], 'platforms': []}
+        return {'active_platforms': active_platforms(lifecycles, region),
+                'platforms': _records(lifecycles.xs(region, level='region'))}
+
+    def warm(self):
+        """Importa scipy y pasa una vez por cada endpoint, para que la
+        primera peticion real no pague esos costos."""
+        import scipy.stats  # noqa: F401
+
+        for path in self.endpoints:
+            params = {'a': 'XOne', 'b': 'PC'} if path == '/welch' else {}
+            self.handle(path, params)
+
+    # Despacho
+
+    def _compute(self, path, params):
+        endpoint = self.endpoints.get(path)
+        if endpoint is None:
+            return 404, json.dumps({'error': f'ruta desconocida: {path}'})
+        try:
+            payload = endpoint(dict(params))
+        except BadRequest as exc:
+            return 400, json.dumps({'error': str(exc)})
+        return 200, json.dumps(_finite(payload), ensure_ascii=False,
+                               allow_nan=False)
+
+    def handle(self, path, params):
+        """(status, cuerpo JSON) de una peticion; usa el cache LRU."""
+        try:
+            return self._respond(path, tuple(sorted(params.items())))
+        except Exception as exc:
+            # Un error inesperado no debe cerrar la conexion sin respuesta.
+            # Se atrapa fuera del LRU para que un error transitorio no
+            # quede guardado para esa URL.
+            return 500, json.dumps(
+                {'error': f'{type(exc).__name__}: {exc}'})
+
+    def cache_info(self):
+        return self._respond.cache_info()
+
+
+def make_handler(service):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlsplit(self.path)
+            status, body = service.handle(url.path.rstrip('/') or '/',
+                                          dict(parse_qsl(url.query)))
+            data = body.encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type',
+                             'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def make_server(service, host='127.0.0.1', port=8000):
+    """Servidor con un hilo por peticion (port=0 elige un puerto libre)."""
+    server = ThreadingHTTPServer((host, port), make_handler(service))
+    server.daemon_threads = True
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='videogame_sales.service',
+        description='Servicio HTTP/JSON del analisis de videojuegos')
+    parser.add_argument('--data', default=DEFAULT_PATH)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--cache-size', type=int, default=DEFAULT_CACHE_SIZE)
+    args = parser.parse_args(argv)
+
+    from .cache import load_games_cached
+
+    service = QueryService(load_games_cached(args.data),
+                           cache_size=args.cache_size)
+    service.warm()
+    server = make_server(service, args.host, args.port)
+    print(f'Escuchando en http://{args.host}:{server.server_address[1]}')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
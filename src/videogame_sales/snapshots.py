@@ -0,0 +1,250 @@
+# coding: utf-8
+
+# Comparacion de varias exportaciones (snapshots) del catalogo.
+# Cada snapshot se resume con las secciones del reporte que interesa seguir
+# en el tiempo (top de plataformas/generos por region, estadisticas por
+# genero, correlaciones, pruebas t, ciclo de vida) en un pool de procesos.
+# Los resumenes y las tablas limpias se guardan por hash del contenido del
+# CSV: un snapshot que no cambio (o dos archivos iguales) no se vuelve a
+# leer ni a calcular. Al final se arma una tabla por seccion con una columna
+# por snapshot y lo que cambio entre el primero y el ultimo.
+
+import argparse
+import json
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+from . import aggregations as agg
+from .cache import source_fingerprint
+from .instrument import stage
+from .loader import CLEANING_VERSION
+
+# Subir este numero cuando cambie el contenido de snapshot_summary
+SUMMARY_VERSION = 1
+
+
+def snapshot_summary(df):
+    """Secciones comparables del reporte para una tabla limpia."""
+    from .correlations import grouped_correlations
+    from .report import build_report
+
+    report = build_report(df)
+    recent = agg.filter_since(df, agg.RECENT_YEAR)
+    return {
+        'overview': pd.Series({
+            'games': len(df),
+            'last_year': df['year_of_release'].max(),
+            'typical_lifespan': report['typical_lifespan'],
+            'active_platforms': ', '.join(report['active_platforms']),
+        }),
+        'top_platforms': report['top_platforms_region'],
+        'top_genres': report['top_genres_region'],
+        'genre_stats': report['genre_stats'],
+        'correlations': grouped_correlations(recent, 'platform'),
+        'hypotheses': pd.DataFrame(report['hypotheses']).T,
+    }
+
+
+def _summary_path(cache_dir, digest):
+    return (Path(cache_dir) / 'snapshots'
+            / f'{digest}-c{CLEANING_VERSION}-s{SUMMARY_VERSION}.pkl')
+
+
+def _digests(snapshots, cache_dir):
+    # Hash de contenido por snapshot; las huellas de la corrida anterior
+    # evitan releer los archivos que no cambiaron de tamaño/mtime
+    index_path = Path(cache_dir) / 'snapshots' / 'fingerprints.json'
+    index = json.loads(index_path.read_text()) if index_path.exists() else {}
+    digests = {}
+    for label, path in snapshots.items():
+        key = str(path.resolve())
+        index[key] = source_fingerprint(path, index.get(key))
+        digests[label] = index[key]['hash']
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    index_path.write_text(json.dumps(index, indent=2, sort_keys=True))
+    return digests
+
+
+def _summarize(path, digest, cache_dir):
+    # Corre en el pool: resumen guardado o carga (con cache) + reporte
+    summary_path = _summary_path(cache_dir, digest)
+    if summary_path.exists():
+        return pd.read_pickle(summary_path)
+
+    from .cache import load_games_cached
+
+    with stage('snapshot', path=str(path)) as ctx:
+        df = load_games_cached(path, cache_dir=Path(cache_dir) / digest)
+        ctx['rows_out'] = len(df)
+        summary = snapshot_summary(df)
+    summary_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = summary_path.with_name(summary_path.name + '.tmp')
+    pd.to_pickle(summary, tmp)
+    tmp.replace(summary_path)
+    return summary
+
+
+def snapshot_labels(paths):
+    """Etiqueta por ruta: el nombre del archivo o, si se repite, la carpeta."""
+    paths = [Path(p) for p in paths]
+    stems = [p.stem for p in paths]
+    return [p.stem if stems.count(p.stem) == 1 else p.parent.name
+            for p in paths]
+
+
+def run_snapshots(snapshots, workers=1, cache_dir=None):
+    """Resume cada snapshot ({etiqueta: ruta}); devuelve {etiqueta: resumen}.
+
+    Los archivos con el mismo contenido se resumen una sola vez. El cache
+    va en `cache_dir` (por defecto .cache junto al primer snapshot).
+    """
+    snapshots = {label: Path(path) for label, path in snapshots.items()}
+    if cache_dir is None:
+        cache_dir = next(iter(snapshots.values())).parent / '.cache'
+
+    digests = _digests(snapshots, cache_dir)
+    jobs = {}
+    for label, digest in digests.items():
+        jobs.setdefault(digest, snapshots[label])
+
+    args = [(path, digest, str(cache_dir)) for digest, path in jobs.items()]
+    if workers == 1 or len(args) <= 1:
+        results = [_summarize(*job) for job in args]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_summarize, *zip(*args)))
+    by_digest = dict(zip(jobs, results))
+    return {label: by_digest[digest] for label, digest in digests.items()}
+
+
+def _side_by_side(tables, value=None):
+    # {etiqueta: Series/DataFrame} -> una columna por snapshot
+    columns = {label: (table if value is None else table[value])
+               for label, table in tables.items()}
+    return pd.DataFrame(columns)
+
+
+def _with_change(wide, rank=False):
+    labels = list(wide.columns)
+    out = wide.copy()
+    out['change'] = wide[labels[-1]] - wide[labels[0]]
+    if rank:
+        ranks = wide.rank(ascending=False, method='min')
+        # Positivo: subio en el ranking entre el primer y el ultimo snapshot
+        out['rank_change'] = ranks[labels[0]] - ranks[labels[-1]]
+    return out
+
+
+def compare_snapshots(summaries):
+    """Tablas de comparacion: una columna por snapshot y `change`.
+
+    `change` es ultimo - primero; en los tops, `rank_change` > 0 indica que
+    el elemento subio de lugar. Un NaN quiere decir que en ese snapshot el
+    elemento no estaba en el top (o no tenia datos).
+    """
+    comparison = {
+        'overview': _side_by_side(
+            {label: s['overview'] for label, s in summaries.items()}),
+    }
+    for section, by in (('top_platforms', 'platform'),
+                        ('top_genres', 'genre')):
+        tables = []
+        for region in agg.REGION_COLUMNS:
+            wide = _with_change(_side_by_side(
+                {label: s[section][region]
+                 for label, s in summaries.items()}), rank=True)
+            wide.index = wide.index.astype(str)
+            wide.index.name = by
+            tables.append(wide.reset_index().assign(region=region))
+        table = pd.concat(tables, ignore_index=True)
+        comparison[section] = table.set_index(['region', by])
+
+    comparison['genre_stats'] = pd.concat({
+        metric: _with_change(_side_by_side(
+            {label: s['genre_stats'] for label, s in summaries.items()},
+            metric), rank=metric == 'total')
+        for metric in ('count', 'total', 'mean', 'median')},
+        names=['metric', 'genre'])
+
+    correlations = {
+        label: s['correlations'].assign(
+            platform=s['correlations']['platform'].astype(str)).set_index(
+                ['platform', 'score'])
+        for label, s in summaries.items()}
+    comparison['correlations'] = _with_change(
+        _side_by_side(correlations, 'pearson'))
+
+    hypotheses = _with_change(_side_by_side(
+        {label: s['hypotheses'] for label, s in summaries.items()},
+        'pvalue'))
+    comparison['hypotheses'] = hypotheses
+    return comparison
+
+
+def write_comparison(comparison, output_dir):
+    """Un CSV por seccion en `output_dir`."""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for name, table in comparison.items():
+        table.to_csv(output_dir / f'{name}.csv')
+
+
+def print_comparison(comparison, alpha=0.05, n=5):
+    labels = list(comparison['overview'].columns)
+    print(f"Snapshots: {', '.join(labels)}")
+    print(comparison['overview'].to_string())
+
+    for section, title in (('top_platforms', 'Plataformas'),
+                           ('top_genres', 'Generos')):
+        for region in agg.REGION_COLUMNS:
+            table = comparison[section].loc[region]
+            moved = table['change'].abs().sort_values(ascending=False)
+            label = region.split('_')[0].upper()
+            print(f'\n{title} en {label} que mas cambiaron:')
+            print(table.loc[moved.index[:n]].to_string(
+                float_format='{:.2f}'.format))
+
+    hypotheses = comparison['hypotheses'][labels]
+    flips = (hypotheses < alpha).nunique(axis=1) > 1
+    print('\np-valores de las pruebas de hipotesis:')
+    print(comparison['hypotheses'].to_string())
+    if flips.any():
+        print(f"Cambia la conclusion (alpha={alpha}): "
+              f"{', '.join(hypotheses.index[flips])}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='videogame_sales.snapshots',
+        description='Compara el analisis entre varias exportaciones')
+    parser.add_argument('snapshots', nargs='+',
+                        help='CSV de cada snapshot, en orden (ETIQUETA=RUTA '
+                             'o solo RUTA)')
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--cache-dir', type=Path)
+    parser.add_argument('--alpha', type=float, default=0.05)
+    parser.add_argument('--output', type=Path,
+                        help='carpeta para los CSV de comparacion')
+    args = parser.parse_args(argv)
+
+    pairs = [item.split('=', 1) if '=' in item else (None, item)
+             for item in args.snapshots]
+    labels = snapshot_labels([path for _, path in pairs])
+    snapshots = {label or default: path
+                 for (label, path), default in zip(pairs, labels)}
+    if len(snapshots) < len(pairs):
+        parser.error('las etiquetas de los snapshots se repiten')
+
+    comparison = compare_snapshots(
+        run_snapshots(snapshots, args.workers, args.cache_dir))
+    print_comparison(comparison, args.alpha)
+    if args.output:
+        write_comparison(comparison, args.output)
+        print(f'\nTablas en {args.output}')
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,114 @@
+# coding: utf-8
+
+# Pruebas de hipotesis. scipy se importa solo al ejecutar una prueba.
+
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from .cube import _as_list
+
+ALPHA = 0.05
+
+CORRECTIONS = ('holm', 'bh')
+
+
+def group_values(df, value, by, group):
+    """Valores no nulos de `value` para las filas donde `by == group`."""
+    return df[(df[by] == group) & (df[value].notna())][value]
+
+
+def welch_ttest(df, value, by, a, b):
+    """Prueba t de Welch (varianzas distintas) de `value` entre a y b."""
+    from scipy import stats
+
+    return stats.ttest_ind(group_values(df, value, by, a).astype(float),
+                           group_values(df, value, by, b).astype(float),
+                           equal_var=False)
+
+
+WelchResult = namedtuple('WelchResult', ['statistic', 'pvalue', 'df'])
+
+
+def welch_from_moments(n1, mean1, var1, n2, mean2, var2):
+    """Prueba t de Welch desde n, media y varianza muestral de cada grupo.
+
+    Da el mismo resultado que ttest_ind(..., equal_var=False) sin necesitar
+    las filas, por lo que sirve con los momentos del cubo de agregacion.
+    """
+    from scipy import stats
+
+    se1 = var1 / n1
+    se2 = var2 / n2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        statistic = (mean1 - mean2) / np.sqrt(se1 + se2)
+        df = (se1 + se2) ** 2 / (se1 ** 2 / (n1 - 1) + se2 ** 2 / (n2 - 1))
+    pvalue = 2 * stats.t.sf(np.abs(statistic), df)
+    return WelchResult(statistic, pvalue, df)
+
+
+def group_moments(df, value, by):
+    """n, media y varianza muestral de `value` (sin nulos) por grupo."""
+    values = df[value].astype('float64')
+    grouped = values.groupby([df[key] for key in _as_list(by)],
+                             observed=True)
+    return pd.DataFrame({'n': grouped.count(), 'mean': grouped.mean(),
+                         'var': grouped.var(ddof=1)})
+
+
+def adjust_pvalues(pvalues, method='holm'):
+    """Correccion por comparaciones multiples (Holm o Benjamini-Hochberg).
+
+    Los NaN se conservan y no cuentan como pruebas.
+    """
+    if method not in CORRECTIONS:
+        raise ValueError(f'correccion no soportada: {method!r}')
+    pvalues = np.asarray(pvalues, dtype='float64')
+    adjusted = np.full_like(pvalues, np.nan)
+    valid = np.flatnonzero(~np.isnan(pvalues))
+    m = len(valid)
+    if m == 0:
+        return adjusted
+
+    order = valid[np.argsort(pvalues[valid], kind='stable')]
+    ranked = pvalues[order]
+    rank = np.arange(1, m + 1)
+    if method == 'holm':
+        scaled = np.maximum.accumulate((m - rank + 1) * ranked)
+    else:
+        scaled = np.minimum.accumulate((m / rank * ranked)[::-1])[::-1]
+    adjusted[order] = np.minimum(scaled, 1.0)
+    return adjusted
+
+
+def pairwise_welch(moments, correction='holm', alpha=ALPHA):
+    """Prueba de Welch para todos los pares de grupos de `moments`.
+
+    `moments` es una tabla con columnas n/mean/var por grupo (la de
+    group_moments o SalesCube.score_moments). Todas las pruebas se evaluan
+    con arreglos de NumPy, sin un ttest_ind por par.
+    """
+    moments = moments[moments['n'] >= 2]
+    n = moments['n'].to_numpy(dtype='float64')
+    mean = moments['mean'].to_numpy(dtype='float64')
+    var = moments['var'].to_numpy(dtype='float64')
+    i, j = np.triu_indices(len(moments), k=1)
+
+    result = welch_from_moments(n[i], mean[i], var[i], n[j], mean[j], var[j])
+    labels = moments.index.to_flat_index()
+    table = pd.DataFrame({
+        'group_a': labels[i], 'group_b': labels[j],
+        'n_a': n[i].astype('int64'), 'n_b': n[j].astype('int64'),
+        'mean_a': mean[i], 'mean_b': mean[j],
+        'statistic': result.statistic, 'df': result.df,
+        'pvalue': result.pvalue,
+    })
+    table['pvalue_adj'] = adjust_pvalues(table['pvalue'], correction)
+    table['reject'] = table['pvalue_adj'] < alpha
+    return table
+
+
+def pairwise_welch_tests(df, value, by, correction='holm', alpha=ALPHA):
+    """Welch para cada par de grupos de `by` (p. ej. todas las plataformas)."""
+    return pairwise_welch(group_moments(df, value, by), correction, alpha)
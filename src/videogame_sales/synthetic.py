@@ -0,0 +1,117 @@
+# coding: utf-8
+
+# Generador de catalogos sinteticos con la forma de Data/games.csv, para
+# medir el pipeline con 1M/10M/100M filas.
+# Cada fila sintetica parte de una fila real elegida al azar, asi se conserva
+# la distribucion conjunta de plataforma/genero/año/rating, los 'tbd' de
+# user_score y las filas sin nombre. Ventas y calificaciones llevan ruido
+# para que los valores no se repitan tal cual. El CSV se escribe por bloques
+# de CHUNK_ROWS filas con semillas derivadas (SeedSequence.spawn): la memoria
+# no depende del total y el mismo (rows, seed) produce el mismo archivo.
+
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .loader import COLUMN_DTYPES, DEFAULT_PATH
+
+CHUNK_ROWS = 1_000_000
+
+RAW_SALES = ['NA_sales', 'EU_sales', 'JP_sales', 'Other_sales']
+
+# Desviacion del ruido multiplicativo (lognormal) de las ventas y del ruido
+# aditivo de las calificaciones
+SALES_NOISE = 0.15
+CRITIC_NOISE = 3
+USER_NOISE = 0.3
+
+
+def read_source(path=DEFAULT_PATH):
+    """CSV original como texto, con vacios y 'tbd' tal cual."""
+    return pd.read_csv(path, dtype=str, keep_default_na=False)
+
+
+def _numeric(column):
+    return pd.to_numeric(column.replace({'': None, 'tbd': None})).to_numpy(
+        dtype='float64', na_value=np.nan)
+
+
+def _template(raw):
+    # Columnas de la fuente listas para indexar por posicion
+    return {
+        'raw': raw,
+        'sales': np.column_stack([_numeric(raw[c]) for c in RAW_SALES]),
+        'critic': _numeric(raw['Critic_Score']),
+        'user': _numeric(raw['User_Score']),
+    }
+
+
+def _sample(template, rng, start, size):
+    raw = template['raw']
+    idx = rng.integers(0, len(raw), size)
+    chunk = raw.iloc[idx].reset_index(drop=True)
+
+    # Nombres unicos; los vacios se quedan vacios
+    ids = pd.Series(np.arange(start, start + size)).astype(str)
+    names = chunk['Name']
+    chunk['Name'] = names.where(names == '', names + ' #' + ids)
+
+    sales = template['sales'][idx] * rng.lognormal(0, SALES_NOISE, (size, 4))
+    chunk[RAW_SALES] = sales.round(2)
+
+    critic = template['critic'][idx] + rng.integers(
+        -CRITIC_NOISE, CRITIC_NOISE + 1, size)
+    chunk['Critic_Score'] = np.clip(critic, 0, 100)
+
+    user = np.clip(template['user'][idx]
+                   + rng.normal(0, USER_NOISE, size), 0, 10).round(1)
+    numeric = ~np.isnan(user)
+    chunk['User_Score'] = chunk['User_Score'].astype(object)
+    chunk.loc[numeric, 'User_Score'] = user[numeric]
+    return chunk[list(COLUMN_DTYPES)]
+
+
+def synthetic_chunks(rows, seed=0, source=DEFAULT_PATH,
+                     chunk_rows=CHUNK_ROWS):
+    """Bloques crudos (nombres de columna del CSV) que suman `rows` filas."""
+    template = _template(read_source(source))
+    n_chunks = -(-rows // chunk_rows)
+    seeds = np.random.SeedSequence(seed).spawn(n_chunks)
+    for i, child in enumerate(seeds):
+        start = i * chunk_rows
+        size = min(chunk_rows, rows - start)
+        yield _sample(template, np.random.default_rng(child), start, size)
+
+
+def synthetic_games(rows, seed=0, source=DEFAULT_PATH):
+    """Catalogo sintetico crudo en memoria (pasar por clean_games)."""
+    return pd.concat(synthetic_chunks(rows, seed, source), ignore_index=True)
+
+
+def write_synthetic_csv(path, rows, seed=0, source=DEFAULT_PATH):
+    """Escribe el catalogo sintetico por bloques; devuelve la ruta."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8', newline='') as out:
+        for i, chunk in enumerate(synthetic_chunks(rows, seed, source)):
+            chunk.to_csv(out, header=i == 0, index=False)
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='videogame_sales.synthetic',
+        description='Genera un catalogo sintetico con la forma de games.csv')
+    parser.add_argument('--rows', type=int, required=True)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--source', default=DEFAULT_PATH)
+    parser.add_argument('--out', required=True)
+    args = parser.parse_args(argv)
+    write_synthetic_csv(args.out, args.rows, args.seed, args.source)
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,18 @@
+# coding: utf-8
+
+# Los tests importan el paquete desde src/ sin instalarlo, igual que los
+# benchmarks.
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+
+@pytest.fixture(scope='session')
+def games():
+    from videogame_sales.loader import load_games
+
+    return load_games()
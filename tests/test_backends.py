@@ -0,0 +1,110 @@
+# coding: utf-8
+
+# Paridad de los backends Polars y DuckDB contra pandas en Data/games.csv
+# (y en el Parquet ya limpio). Se omiten si la dependencia no esta.
+
+import pandas as pd
+import pytest
+
+from videogame_sales.backends import (
+    TOP_COLUMNS, TOP_KEYS, backend_report, get_backend)
+
+# Las sumas en float32 cambian en el ultimo digito segun el orden
+RTOL = 1e-5
+SINCE = [None, 1995, 2010]
+
+
+def assert_same(expected, actual):
+    if isinstance(expected, pd.Series):
+        pd.testing.assert_series_equal(expected, actual, rtol=RTOL,
+                                       check_index_type=False)
+    else:
+        pd.testing.assert_frame_equal(expected, actual, rtol=RTOL,
+                                      check_index_type=False)
+
+
+@pytest.fixture(scope='module')
+def reference():
+    return get_backend('pandas')
+
+
+@pytest.fixture(scope='module', params=['polars', 'duckdb'])
+def backend(request):
+    pytest.importorskip(request.param)
+    return get_backend(request.param)
+
+
+@pytest.mark.parametrize('since', SINCE)
+@pytest.mark.parametrize('by', TOP_KEYS)
+def test_top_n(reference, backend, by, since):
+    for column in TOP_COLUMNS:
+        for n in (5, 100):
+            assert_same(reference.top_n(column, by, n, since),
+                        backend.top_n(column, by, n, since))
+
+
+def test_top_n_drops_missing_groups(backend):
+    top = backend.top_n('na_sales', 'rating', 100, 2010)
+    assert top.index.notna().all()
+
+
+@pytest.mark.parametrize('since', SINCE)
+@pytest.mark.parametrize('section', ['games_per_year', 'platform_year_sales',
+                                     'genre_stats', 'esrb_sales'])
+def test_sections(reference, backend, section, since):
+    assert_same(getattr(reference, section)(since),
+                getattr(backend, section)(since))
+
+
+def test_rejects_unknown_columns(backend):
+    with pytest.raises(ValueError):
+        backend.top_n('na_sales', 'name')
+
+
+@pytest.mark.parametrize('name', ['pandas', 'polars', 'duckdb'])
+def test_parquet_source(games, tmp_path, reference, name):
+    pytest.importorskip('pyarrow')
+    if name != 'pandas':
+        pytest.importorskip(name)
+    path = tmp_path / 'games.parquet'
+    games.to_parquet(path)
+    expected = backend_report(reference)
+    actual = backend_report(get_backend(name, path))
+    for key, value in expected.items():
+        if isinstance(value, dict):
+            for region in value:
+                assert_same(value[region], actual[key][region])
+        else:
+            assert_same(value, actual[key])
+
+
+def assert_same_report(expected, actual, where=''):
+    if isinstance(expected, dict):
+        assert expected.keys() == actual.keys(), where
+        for key in expected:
+            assert_same_report(expected[key], actual[key], f'{where}/{key}')
+    elif isinstance(expected, (pd.Series, pd.DataFrame)):
+        assert_same(expected, actual)
+    elif isinstance(expected, float):
+        assert actual == pytest.approx(expected, rel=RTOL), where
+    else:
+        assert expected == actual, where
+
+
+@pytest.mark.parametrize('name', ['pandas', 'polars', 'duckdb'])
+def test_build_report_on_backend_cube(games, name):
+    from videogame_sales.aggregations import RECENT_YEAR
+    from videogame_sales.report import build_report
+
+    if name != 'pandas':
+        pytest.importorskip(name)
+    backend = get_backend(name)
+    cube = backend.sales_cube()
+    report = build_report(cube=cube,
+                          genre_median=backend.genre_stats(RECENT_YEAR)[
+                              'median'])
+    expected = build_report(games)
+    # La mediana de pandas sale en float32 (la columna de ventas)
+    expected['genre_stats'] = expected['genre_stats'].astype(
+        {'median': 'float64'})
+    assert_same_report(expected, report)
@@ -0,0 +1,100 @@
+# coding: utf-8
+
+# Cache columnar de la tabla limpia: acierto, fallo, cambio solo de mtime,
+# cambio de contenido, cambio de CLEANING_VERSION, meta corrupto y tabla
+# compacta.
+
+import json
+import os
+import shutil
+
+import pandas as pd
+import pytest
+
+pytest.importorskip('pyarrow')
+
+from videogame_sales import cache  # noqa: E402
+from videogame_sales.loader import DEFAULT_PATH  # noqa: E402
+
+
+@pytest.fixture
+def csv(tmp_path):
+    path = tmp_path / 'games.csv'
+    shutil.copyfile(DEFAULT_PATH, path)
+    return path
+
+
+@pytest.fixture
+def loads(monkeypatch):
+    # Cuenta las lecturas del CSV: cada una es un fallo de cache
+    calls = []
+    load_games = cache.load_games
+
+    def counted(path, **kwargs):
+        calls.append(path)
+        return load_games(path, **kwargs)
+
+    monkeypatch.setattr(cache, 'load_games', counted)
+    return calls
+
+
+@pytest.mark.parametrize('fmt', cache.FORMATS)
+def test_hit_after_miss(csv, loads, fmt):
+    first = cache.load_games_cached(csv, fmt=fmt)
+    second = cache.load_games_cached(csv, fmt=fmt)
+    assert len(loads) == 1
+    pd.testing.assert_frame_equal(first, second)
+    data_path, meta_path = cache.cache_paths(csv, fmt=fmt)
+    assert data_path.exists() and meta_path.exists()
+
+
+def test_mtime_only_change_is_a_hit(csv, loads):
+    cache.load_games_cached(csv)
+    st = os.stat(csv)
+    os.utime(csv, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    cache.load_games_cached(csv)
+    assert len(loads) == 1
+    _, meta_path = cache.cache_paths(csv)
+    meta = json.loads(meta_path.read_text())
+    assert meta['source']['mtime_ns'] == st.st_mtime_ns + 10**9
+
+
+def test_content_change_is_a_miss(csv, loads):
+    before = cache.load_games_cached(csv)
+    lines = csv.read_text(encoding='utf-8').splitlines(keepends=True)
+    csv.write_text(''.join(lines[:-100]), encoding='utf-8')
+    after = cache.load_games_cached(csv)
+    assert len(loads) == 2
+    assert len(after) == len(before) - 100
+
+
+def test_cleaning_version_bump_is_a_miss(csv, loads, monkeypatch):
+    cache.load_games_cached(csv)
+    monkeypatch.setattr(cache, 'CLEANING_VERSION', cache.CLEANING_VERSION + 1)
+    cache.load_games_cached(csv)
+    cache.load_games_cached(csv)
+    assert len(loads) == 2
+
+
+@pytest.mark.parametrize('content', ['{"source": {"si', '', '[]', '{}'])
+def test_unreadable_meta_is_a_miss(csv, loads, content):
+    cache.load_games_cached(csv)
+    _, meta_path = cache.cache_paths(csv)
+    meta_path.write_text(content)
+    cache.load_games_cached(csv)
+    assert len(loads) == 2
+    # El meta se reescribe completo y la siguiente corrida acierta
+    cache.load_games_cached(csv)
+    assert len(loads) == 2
+    assert not list(meta_path.parent.glob('*.tmp'))
+
+
+def test_compact_table_has_its_own_cache(csv, loads):
+    full = cache.load_games_cached(csv)
+    compact = cache.load_games_cached(csv, compact=True)
+    again = cache.load_games_cached(csv, compact=True)
+    assert len(loads) == 2
+    assert isinstance(again['name'].dtype, pd.CategoricalDtype)
+    pd.testing.assert_frame_equal(compact, again, check_categorical=False)
+    pd.testing.assert_frame_equal(full, cache.load_games_cached(csv))
+    assert len(loads) == 2
@@ -0,0 +1,42 @@
+# coding: utf-8
+
+# Validacion de opciones de la linea de comandos (antes de cargar datos).
+
+import pytest
+
+from videogame_sales.cli import main
+
+
+@pytest.mark.parametrize('argv', [
+    ['--formats', 'pdf', '--figures', 'salida'],
+    ['--formats', 'png,jpg'],
+    ['--formats', ''],
+])
+def test_unsupported_formats(argv, capsys):
+    with pytest.raises(SystemExit) as exc:
+        main(argv)
+    assert exc.value.code == 2
+    assert '--formats' in capsys.readouterr().err
+
+
+@pytest.mark.parametrize('argv', [
+    ['--backend', 'duckdb', '--figures', 'salida'],
+    ['--backend', 'polars', '--chunksize', '1000'],
+    ['--backend', 'spark'],
+])
+def test_backend_only_builds_the_report(argv, capsys):
+    with pytest.raises(SystemExit) as exc:
+        main(argv)
+    assert exc.value.code == 2
+    assert '--backend' in capsys.readouterr().err
+
+
+def test_forecast_without_enough_years(tmp_path, capsys):
+    from videogame_sales.loader import DEFAULT_PATH
+
+    path = tmp_path / 'empty.csv'
+    with open(DEFAULT_PATH, encoding='utf-8') as source:
+        path.write_text(source.readline(), encoding='utf-8')
+    assert main(['--data', str(path), '--chunksize', '100',
+                 '--forecast']) == 0
+    assert 'Sin pronostico' in capsys.readouterr().out
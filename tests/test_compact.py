@@ -0,0 +1,40 @@
+# coding: utf-8
+
+# Modo compacto de la tabla: mismos datos que load_games con name como
+# pool de categorias, menos memoria y el mismo reporte.
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from videogame_sales.compact import frame_bytes, subset_positions
+from videogame_sales.loader import load_games
+from videogame_sales.report import build_report
+
+
+@pytest.fixture(scope='module')
+def compact():
+    return load_games(compact=True)
+
+
+def test_same_values_less_memory(games, compact):
+    assert isinstance(compact['name'].dtype, pd.CategoricalDtype)
+    pd.testing.assert_frame_equal(
+        compact.astype({'name': games['name'].dtype}), games)
+    assert frame_bytes(compact) < frame_bytes(games)
+
+
+def test_report_is_unchanged(games, compact):
+    expected, actual = build_report(games), build_report(compact)
+    pd.testing.assert_frame_equal(expected['genre_stats'],
+                                  actual['genre_stats'])
+    pd.testing.assert_frame_equal(expected['correlations'],
+                                  actual['correlations'])
+    assert expected['active_platforms'] == actual['active_platforms']
+
+
+def test_subset_positions(games):
+    mask = (games['platform'] == 'PS4').to_numpy()
+    positions = subset_positions(mask)
+    assert positions.dtype == np.int32
+    pd.testing.assert_frame_equal(games.iloc[positions], games[mask])
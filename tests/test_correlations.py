@@ -0,0 +1,49 @@
+# coding: utf-8
+
+# Correlaciones por grupo contra el loop del notebook (filtrar por
+# plataforma y llamar Series.corr).
+
+import numpy as np
+import pandas as pd
+
+from videogame_sales import aggregations as agg
+from videogame_sales.correlations import grouped_correlations
+
+
+def _loop(df, platforms):
+    table = {}
+    for platform in platforms:
+        rows = df[df['platform'] == platform].dropna(
+            subset=agg.SCORE_COLUMNS)
+        table[platform] = [rows['total_sales'].corr(rows[score])
+                           for score in agg.SCORE_COLUMNS]
+    return pd.DataFrame(table, index=['User Score Corr',
+                                      'Critic Score Corr'])
+
+
+def test_score_correlations_matches_loop(games):
+    recent = agg.filter_since(games, agg.RECENT_YEAR)
+    platforms = ['PS4', 'XOne', '3DS', 'PC']
+    pd.testing.assert_frame_equal(agg.score_correlations(recent, platforms),
+                                  _loop(recent, platforms), rtol=1e-9)
+
+
+def test_score_correlations_platform_without_scores(games):
+    # DS no tiene juegos calificados desde 2016: NaN, como el loop
+    recent = agg.filter_since(games, 2016)
+    table = agg.score_correlations(recent, ['PS4', 'DS'])
+    assert list(table.columns) == ['PS4', 'DS']
+    assert table['DS'].isna().all()
+    assert table['PS4'].notna().all()
+
+
+def test_spearman_is_pearson_on_ranks(games):
+    recent = agg.filter_since(games, 2010)
+    table = grouped_correlations(recent, 'genre', methods=['spearman'])
+    row = table[(table['genre'] == 'Action')
+                & (table['score'] == 'user_score')].iloc[0]
+    rows = recent[recent['genre'] == 'Action'].dropna(
+        subset=agg.SCORE_COLUMNS)
+    expected = rows['user_score'].corr(rows['total_sales'],
+                                       method='spearman')
+    assert np.isclose(row['spearman'], expected, rtol=1e-9)
@@ -0,0 +1,82 @@
+# coding: utf-8
+
+# Pronostico vectorizado: recuperacion de series conocidas, backtest y la
+# tabla por plataforma/genero.
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from videogame_sales.cube import SalesCube
+from videogame_sales.forecast import (
+    MODELS, _loglinear, backtest, backtest_summary, forecast_matrix,
+    sales_forecast)
+
+
+def _matrix(rows, first_year=2008):
+    rows = np.asarray(rows, dtype=np.float64)
+    years = range(first_year, first_year + rows.shape[1])
+    return pd.DataFrame(rows, columns=list(years),
+                        index=[f's{i}' for i in range(len(rows))])
+
+
+def test_loglinear_recovers_exponential_decay():
+    t = np.arange(8)
+    history = np.vstack([100 * 0.5 ** t, 3 * 1.2 ** t])
+    expected = [100 * 0.5 ** 8, 3 * 1.2 ** 8]
+    np.testing.assert_allclose(_loglinear(history), expected, rtol=1e-9)
+
+
+def test_loglinear_skips_years_without_sales():
+    # Los ceros no entran al ajuste; con un solo año vendido no hay
+    # pendiente y se repite el ultimo valor
+    t = np.arange(6)
+    decay = 50 * 0.7 ** t
+    decay[2] = 0
+    history = np.vstack([decay, [0, 0, 0, 0, 0, 4.0]])
+    np.testing.assert_allclose(_loglinear(history),
+                               [50 * 0.7 ** 6, 4.0], rtol=1e-9)
+
+
+def test_forecast_matrix_is_not_negative():
+    matrix = _matrix([[10, 8, 6, 4, 2, 1]])
+    forecasts = forecast_matrix(matrix)
+    assert list(forecasts.columns) == list(MODELS)
+    assert (forecasts.to_numpy() >= 0).all()
+    assert forecasts.loc['s0', 'naive'] == 1
+
+
+def test_backtest_needs_three_years_before_holdout():
+    with pytest.raises(ValueError, match='3 años'):
+        backtest(_matrix([[1, 2, 3, 4, 5]]), holdout=3)
+    errors = backtest(_matrix([[1, 2, 3, 4, 5, 6]]), holdout=3)
+    assert errors.shape == (1, len(MODELS))
+
+
+def test_backtest_is_exact_on_constant_series():
+    matrix = _matrix([[5.0] * 8, [2.0] * 8])
+    errors = backtest(matrix, holdout=3)
+    np.testing.assert_allclose(errors.to_numpy(), 0, atol=1e-9)
+
+
+def test_backtest_summary():
+    matrix = _matrix([[1, 2, 3, 4, 5, 6], [6, 5, 4, 3, 2, 1]])
+    errors = backtest(matrix, holdout=2, models=['naive'])
+    summary = backtest_summary(matrix, errors, holdout=2)
+    # naive se equivoca por 1 en cada año retenido
+    assert summary.loc['naive', 'mae'] == pytest.approx(1.0)
+    assert summary.loc['naive', 'wape'] == pytest.approx(1 / 3.5)
+    assert summary.loc['naive', 'series_won'] == 2
+
+
+def test_sales_forecast_table(games):
+    cube = SalesCube.from_frame(games)
+    table, summary = sales_forecast(cube, 'platform', summary=True)
+    assert (table['year'] == 2017).all()
+    assert set(table['model']) <= set(MODELS)
+    picked = table[list(MODELS)].to_numpy()[
+        np.arange(len(table)),
+        [list(MODELS).index(m) for m in table['model']]]
+    np.testing.assert_allclose(table['forecast'], picked)
+    assert summary['series_won'].sum() == len(table)
+    pd.testing.assert_frame_equal(sales_forecast(cube, 'platform'), table)
@@ -0,0 +1,99 @@
+# coding: utf-8
+
+# SortedGames contra mascaras booleanas sobre la tabla sin ordenar: rangos
+# de años abiertos/cerrados, años nulos (ordenados como inf), plataformas y
+# generos, y GamesQuery usando los indices.
+
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from videogame_sales.index import SortedGames
+from videogame_sales.query import GamesQuery
+
+
+YEARS = [None, 1980, 2006, 2015, 2016, 2030]
+PLATFORMS = [None, ['PS4'], ['Wii', 'DS'], ['GB', 'no-existe']]
+GENRES = [None, ['Puzzle'], ['Action', 'Sports']]
+
+
+@pytest.fixture(scope='module')
+def index(games):
+    return SortedGames(games)
+
+
+def _mask(df, since, until, platforms, genres):
+    years = df['year_of_release'].to_numpy(dtype='float64', na_value=np.nan)
+    mask = np.ones(len(df), dtype=bool)
+    if since is not None:
+        mask &= years >= since
+    if until is not None:
+        mask &= years <= until
+    if platforms is not None:
+        mask &= df['platform'].isin(platforms).to_numpy(bool)
+    if genres is not None:
+        mask &= df['genre'].isin(genres).to_numpy(bool)
+    return df[mask]
+
+
+def _same_rows(result, expected):
+    # SortedGames reordena la tabla: se compara como conjunto de filas
+    key = ['name', 'platform', 'year_of_release', 'genre', 'total_sales']
+    left = result[key].astype(str).sort_values(key).reset_index(drop=True)
+    right = expected[key].astype(str).sort_values(key).reset_index(drop=True)
+    pd.testing.assert_frame_equal(left, right)
+
+
+def test_table_is_sorted(index, games):
+    assert len(index) == len(games)
+    codes = index.table['platform'].cat.codes.to_numpy()
+    assert (np.diff(codes) >= 0).all()
+    for code, platform in enumerate(index.platforms):
+        lo, hi = index.platform_offsets[code:code + 2]
+        assert (index.table['platform'].iloc[lo:hi] == platform).all()
+        # Años ascendentes con los nulos (inf) al final de la plataforma
+        years = index.years[lo:hi]
+        assert (years[1:] >= years[:-1]).all()
+
+
+@pytest.mark.parametrize('since,until', [
+    (since, until) for since, until in itertools.product(YEARS, YEARS)
+    if since is None or until is None or since <= until])
+@pytest.mark.parametrize('platforms', PLATFORMS)
+@pytest.mark.parametrize('genres', GENRES)
+def test_select_matches_mask(index, games, since, until, platforms, genres):
+    expected = _mask(games, since, until, platforms, genres)
+    positions = index.positions(since, until, platforms, genres)
+    assert (np.diff(positions) > 0).all()
+    _same_rows(index.table.iloc[positions], expected)
+    _same_rows(index.select(since, until, platforms, genres), expected)
+
+
+def test_null_years_only_without_range(index, games):
+    nulls = games['year_of_release'].isna().sum()
+    assert nulls > 0
+    assert len(index.select()) == len(games)
+    assert len(index.select(since=1900)) == len(games) - nulls
+    assert len(index.select(until=3000)) == len(games) - nulls
+
+
+def test_single_platform_range_is_a_slice(index):
+    rows = index.select(since=2013, until=2015, platforms='PS4')
+    assert rows['year_of_release'].between(2013, 2015).all()
+    assert (rows['platform'] == 'PS4').all()
+    # Un solo bloque: rebanada contigua, sin reunir posiciones
+    assert np.shares_memory(
+        rows['total_sales'].to_numpy(),
+        index.table['total_sales'].to_numpy())
+
+
+def test_query_uses_index(index, games):
+    query = GamesQuery(index)
+    rows = query.select(since=2010, until=2014, platforms=['PS3', 'X360'],
+                        notna='user_score')
+    expected = _mask(games, 2010, 2014, ['PS3', 'X360'], None)
+    _same_rows(rows, expected[expected['user_score'].notna()])
+    assert query.select(since=2010, until=2014, platforms=['X360', 'PS3'],
+                        notna=['user_score']) is rows
@@ -0,0 +1,45 @@
+# coding: utf-8
+
+# Ingesta incremental: conteos del resultado y cubo igual al recalculado.
+
+import pandas as pd
+
+from videogame_sales.cube import SalesCube
+from videogame_sales.ingest import GamesStore
+
+
+def raw_rows(frame):
+    # clean_games acepta columnas en snake_case; total_sales se recalcula
+    return frame.drop(columns='total_sales')
+
+
+def assert_cube_matches(store):
+    expected = SalesCube.from_frame(store.table).sums(
+        'platform', 'total_sales_sum')
+    actual = store.cube.sums('platform', 'total_sales_sum')
+    pd.testing.assert_series_equal(expected, actual.loc[expected.index],
+                                   check_exact=False)
+
+
+def test_reingest_duplicate_key(games):
+    store = GamesStore(games)
+    key = ((games['name'] == 'Madden NFL 13') & (games['platform'] == 'PS3')
+           & (games['year_of_release'] == 2012))
+    assert key.sum() == 2
+
+    result = store.ingest(raw_rows(games[key].tail(1)))
+    assert result == (0, 1, 2)
+    assert len(store.table) == len(games) - 1
+    assert_cube_matches(store)
+
+
+def test_ingest_new_and_corrected(games):
+    store = GamesStore(games)
+    batch = games.head(2).copy()
+    batch.loc[0, 'na_sales'] = 1.0
+    batch.loc[1, 'name'] = 'Juego nuevo'
+    result = store.ingest(raw_rows(batch))
+    assert (result.added, result.replaced, result.retracted) == (1, 1, 1)
+    assert len(store.table) == len(games) + 1
+    assert store.version == 1
+    assert_cube_matches(store)
@@ -0,0 +1,90 @@
+# coding: utf-8
+
+# Eventos de la instrumentacion por etapas y su costo cuando esta apagada.
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from videogame_sales import instrument
+from videogame_sales.instrument import stage
+
+SRC = Path(__file__).resolve().parents[1] / 'src'
+
+
+@pytest.fixture
+def trace(tmp_path):
+    path = tmp_path / 'events.jsonl'
+    instrument.configure(path)
+    yield path
+    instrument.configure(None)
+
+
+def events(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_disabled_stage_is_shared_noop():
+    assert not instrument.enabled()
+    assert stage('a') is stage('b')
+
+
+def test_nested_stage_events(trace):
+    with stage('outer', rows_in=10) as outer:
+        with stage('inner') as inner:
+            inner['rows_out'] = 3
+        outer['rows_out'] = 5
+    inner_event, outer_event = events(trace)
+    assert inner_event['stage'] == 'inner'
+    assert inner_event['parent'] == 'outer'
+    assert inner_event['depth'] == 1
+    assert (outer_event['rows_in'], outer_event['rows_out']) == (10, 5)
+    assert outer_event['seconds'] >= inner_event['seconds']
+
+
+def test_missing_resource_module(trace, monkeypatch):
+    # Como en Windows: sin resource el evento sale sin peak_rss_mb
+    monkeypatch.setitem(sys.modules, 'resource', None)
+    with stage('load'):
+        pass
+    (event,) = events(trace)
+    assert 'peak_rss_mb' not in event
+
+
+def test_package_imports_without_resource():
+    code = ("import sys; sys.modules['resource'] = None; "
+            "import videogame_sales, videogame_sales.cli")
+    subprocess.run([sys.executable, '-c', code], check=True,
+                   env={**os.environ, 'PYTHONPATH': str(SRC)})
+
+
+@pytest.mark.parametrize('platform,maxrss', [('linux', 2048 * 1024),
+                                             ('darwin', 2048 * 2**20)])
+def test_peak_rss_units(monkeypatch, platform, maxrss):
+    # ru_maxrss viene en KB en Linux y en bytes en macOS
+    resource = pytest.importorskip('resource')
+    usage = type('Usage', (), {'ru_maxrss': maxrss})
+    monkeypatch.setattr(resource, 'getrusage', lambda who: usage)
+    monkeypatch.setattr(instrument.sys, 'platform', platform)
+    assert instrument._peak_rss_mb() == 2048
+
+
+def test_trace_to_missing_directory_is_a_usage_error(tmp_path, capsys):
+    from videogame_sales.cli import main
+
+    with pytest.raises(SystemExit) as exc:
+        main(['--trace', str(tmp_path / 'no' / 'events.jsonl')])
+    assert exc.value.code == 2
+    assert '--trace' in capsys.readouterr().err
+    assert not instrument.enabled()
+
+
+def test_bad_trace_env_only_warns(tmp_path):
+    with pytest.warns(UserWarning, match=instrument.TRACE_ENV):
+        instrument.configure_from_env(
+            {instrument.TRACE_ENV: str(tmp_path / 'no' / 'events.jsonl')})
+    assert not instrument.enabled()
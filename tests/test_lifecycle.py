@@ -0,0 +1,97 @@
+# coding: utf-8
+
+# Ciclo de vida sobre una matriz sintetica con primer/pico/ultimo año,
+# vida media y plataformas activas conocidos.
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from videogame_sales.cube import SalesCube
+from videogame_sales.lifecycle import (
+    active_platforms, lifecycle_metrics, platform_lifecycles,
+    typical_lifespan, year_growth, year_matrix)
+
+
+YEARS = list(range(2000, 2011))
+
+# Ventas por año desde 2000 (ceros al final implicitos)
+SERIES = {
+    'A': [1, 4, 8, 4, 2, 1],                       # retirada, vida 6
+    'B': [0, 2, 6, 10, 9, 6, 5, 3, 1],             # retirada, vida 8
+    'C': [0, 0, 0, 0, 1, 3, 5, 6, 6, 5, 4],        # activa, edad 7
+    'D': [0, 0, 0, 0, 0, 0, 0, 0, 2, 5, 9],        # activa, creciendo
+    'E': [0, 0, 0, 0, 0, 0, 0, 0, 0, 0.1, 0.2],    # menos del 10%
+    'F': [1] * 10 + [3],                           # mas vieja que la tipica
+}
+
+
+@pytest.fixture
+def matrix():
+    rows = [values + [0] * (len(YEARS) - len(values))
+            for values in SERIES.values()]
+    index = pd.MultiIndex.from_product([list(SERIES), ['total_sales']],
+                                       names=['platform', 'region'])
+    return pd.DataFrame(np.array(rows, dtype='float64'), index=index,
+                        columns=YEARS)
+
+
+def test_metrics(matrix):
+    metrics = lifecycle_metrics(matrix).xs('total_sales', level='region')
+    expected = pd.DataFrame({
+        'first_year': [2000, 2001, 2004, 2008, 2009, 2000],
+        'peak_year': [2002, 2003, 2007, 2010, 2010, 2010],
+        'last_year': [2005, 2008, 2010, 2010, 2010, 2010],
+        'lifespan': [6, 8, 7, 3, 2, 11],
+        'half_life': [1, 3, np.nan, np.nan, np.nan, np.nan],
+    }, index=pd.Index(list(SERIES), name='platform'))
+    pd.testing.assert_frame_equal(metrics[expected.columns], expected,
+                                  check_dtype=False)
+    assert metrics.loc['B', 'peak_sales'] == 10
+    assert metrics.loc['C', 'total_sales'] == 30
+    assert metrics.loc['D', 'latest_growth'] == pytest.approx(0.8)
+    assert np.isnan(metrics.loc['A', 'latest_growth'])
+
+
+def test_rows_without_sales_are_dropped(matrix):
+    matrix.loc[('G', 'total_sales'), :] = 0.0
+    assert 'G' not in lifecycle_metrics(matrix).index.get_level_values(0)
+
+
+def test_year_growth(matrix):
+    growth = year_growth(matrix)
+    assert list(growth.columns) == YEARS[1:]
+    np.testing.assert_allclose(growth.loc[('D', 'total_sales'),
+                                          [2009, 2010]], [1.5, 0.8])
+    # Caer a cero es -100%; sin ventas el año anterior no hay base
+    assert growth.loc[('A', 'total_sales'), 2006] == -1
+    assert np.isnan(growth.loc[('A', 'total_sales'), 2007])
+    assert np.isnan(growth.loc[('C', 'total_sales'), 2004])
+    pd.testing.assert_series_equal(
+        lifecycle_metrics(matrix)['latest_growth'], growth[2010],
+        check_names=False)
+
+
+def test_active_rule(matrix):
+    lifecycles = lifecycle_metrics(matrix)
+    # Mediana de vida de las retiradas A (6) y B (8)
+    assert typical_lifespan(lifecycles) == 7
+    # E vende menos del 10% del ultimo año y F ya supero la vida tipica
+    assert active_platforms(lifecycles) == ['D', 'C']
+    assert active_platforms(lifecycles, min_share=0.5) == ['D']
+
+
+def test_from_cube(games):
+    cube = SalesCube.from_frame(games)
+    matrix = year_matrix(cube)
+    lifecycles = platform_lifecycles(cube)
+    ps2 = lifecycles.loc[('PS2', 'total_sales')]
+    rows = games[games['platform'] == 'PS2']
+    assert ps2['first_year'] == rows['year_of_release'].min()
+    assert ps2['last_year'] == rows['year_of_release'].max()
+    assert ps2['total_sales'] == pytest.approx(
+        rows.dropna(subset=['year_of_release'])['total_sales']
+        .astype('float64').sum())
+    assert matrix.shape[1] == (matrix.columns.max()
+                               - matrix.columns.min() + 1)
+    assert active_platforms(lifecycles) == ['PS4', 'XOne', '3DS']
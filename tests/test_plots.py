@@ -0,0 +1,37 @@
+# coding: utf-8
+
+# Dispersion score vs ventas en todos sus modos, incluidos los casos sin
+# puntos.
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip('matplotlib')
+
+from videogame_sales.plots import (  # noqa: E402
+    SCATTER_MODES, headless, score_vs_sales)
+
+
+@pytest.mark.parametrize('mode', SCATTER_MODES)
+@pytest.mark.parametrize('values', [[], [np.nan, np.nan]])
+def test_score_vs_sales_without_points(tmp_path, mode, values):
+    df = pd.DataFrame({'critic_score': values, 'total_sales': values},
+                      dtype='float64')
+    with headless():
+        fig = score_vs_sales(df, 'critic_score', 'Sin datos', 'Critica',
+                             mode=mode)
+        fig.savefig(tmp_path / 'empty.png')
+    assert (tmp_path / 'empty.png').exists()
+
+
+@pytest.mark.parametrize('mode', SCATTER_MODES)
+def test_score_vs_sales_modes(games, tmp_path, mode):
+    rows = games[['critic_score', 'total_sales']].astype('float64')
+    with headless():
+        fig = score_vs_sales(rows, 'critic_score', 'PS4', 'Critica',
+                             mode=mode)
+        fig.savefig(tmp_path / 'scatter.png')
+    assert fig.axes[0].get_title() == 'PS4'
+    # hist2d agrega la barra de color como un segundo eje
+    assert len(fig.axes) == (2 if mode == 'hist2d' else 1)
@@ -0,0 +1,72 @@
+# coding: utf-8
+
+# Memoria de GamesQuery: aciertos, foto de DataFrames e invalidacion con
+# GamesStore.
+
+from videogame_sales.ingest import GamesStore
+from videogame_sales.query import GamesQuery
+
+
+def test_cached_subset(games):
+    query = GamesQuery(games)
+    first = query.select(since=2010)
+    assert query.select(since=2010) is first
+    assert query.info()['hits'] == 1
+    assert first['year_of_release'].min() == 2010
+
+
+def test_dataframe_source_is_a_snapshot(games):
+    df = games.copy()
+    query = GamesQuery(df)
+    cached = query.select(since=2010)
+    row = cached.index[0]
+    df.loc[row, 'total_sales'] = 999
+    # La edicion no llega ni a la memoria ni a consultas nuevas
+    assert query.select(since=2010).loc[row, 'total_sales'] != 999
+    assert query.select(since=2009).loc[row, 'total_sales'] != 999
+
+
+def test_store_ingest_invalidates(games):
+    store = GamesStore(games)
+    query = GamesQuery(store)
+    before = query.select(since=2010)
+    batch = games[games['year_of_release'] == 2012].head(1).drop(
+        columns='total_sales')
+    batch['name'] = 'Juego nuevo'
+    store.ingest(batch)
+    after = query.select(since=2010)
+    assert after is not before
+    assert len(after) == len(before) + 1
+
+
+def test_concurrent_misses_count_bytes_once(games):
+    import threading
+
+    query = GamesQuery(games)
+    barrier = threading.Barrier(4)
+    evaluate = query._evaluate
+
+    def slow_evaluate(key):
+        # Los cuatro hilos fallan la misma llave antes de que alguno inserte
+        barrier.wait()
+        return evaluate(key)
+
+    query._evaluate = slow_evaluate
+    threads = [threading.Thread(target=query.select, kwargs={'since': 2010})
+               for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    info = query.info()
+    assert info['entries'] == 1
+    assert info['misses'] == 4
+    result, size = query._entries[next(iter(query._entries))]
+    assert info['bytes'] == size
+
+
+def test_notna_accepts_a_column_name(games):
+    query = GamesQuery(games)
+    rows = query.select(notna='user_score')
+    assert rows['user_score'].notna().all()
+    assert query.select(notna=['user_score']) is rows
@@ -0,0 +1,31 @@
+# coding: utf-8
+
+# El render sin pantalla no debe cambiar el backend ni las figuras abiertas
+# del que llama (notebook, --show).
+
+import pytest
+
+matplotlib = pytest.importorskip('matplotlib')
+
+from videogame_sales.render import render_figures  # noqa: E402
+from videogame_sales.report import build_report  # noqa: E402
+
+
+def test_render_keeps_caller_backend(games, tmp_path):
+    from matplotlib import pyplot as plt
+
+    plt.switch_backend('svg')
+    fig = plt.figure()
+    try:
+        status = render_figures(games, build_report(games), tmp_path,
+                                formats=('png',))
+        assert set(status.values()) == {'rendered'}
+        assert matplotlib.get_backend() == 'svg'
+        assert plt.get_fignums() == [fig.number]
+        assert all((tmp_path / f'{name}.png').exists() for name in status)
+
+        again = render_figures(games, build_report(games), tmp_path,
+                               formats=('png',))
+        assert set(again.values()) == {'cached'}
+    finally:
+        plt.close(fig)
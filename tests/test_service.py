@@ -0,0 +1,100 @@
+# coding: utf-8
+
+# Respuestas del servicio HTTP/JSON en casos limite: cortes vacios, grupos
+# con un solo dato, grupos numericos y errores inesperados.
+
+import json
+
+import pandas as pd
+import pytest
+
+from videogame_sales.service import QueryService
+
+
+@pytest.fixture(scope='module')
+def service(games):
+    return QueryService(games)
+
+
+def get(service, path, **params):
+    status, body = service.handle(path, {k: str(v) for k, v in params.items()})
+    return status, json.loads(body)
+
+
+def test_lifecycle_empty_slice(service):
+    status, body = get(service, '/lifecycle', since=2030)
+    assert status == 200
+    assert body == {'active_platforms': [], 'platforms': []}
+
+
+def test_lifecycle_single_year(service):
+    status, body = get(service, '/lifecycle', since=2016)
+    assert status == 200
+    assert body['platforms']
+
+
+def test_welch_rejects_groups_with_one_value(service):
+    status, body = get(service, '/welch', by='genre', a='Puzzle',
+                       b='Action', since=2016)
+    assert status == 400
+    assert 'Puzzle' in body['error']
+
+
+def test_welch_by_year(service):
+    status, body = get(service, '/welch', by='year_of_release', a=2010,
+                       b=2011)
+    assert status == 200
+    assert (body['a'], body['b']) == (2010, 2011)
+    assert 0 <= body['pvalue'] <= 1
+
+    status, _ = get(service, '/welch', by='year_of_release', a='x', b=2011)
+    assert status == 400
+
+
+def test_unexpected_error_is_500(games):
+    service = QueryService(games)
+    service.endpoints['/boom'] = lambda params: 1 / 0
+    status, body = get(service, '/boom')
+    assert status == 500
+    assert 'ZeroDivisionError' in body['error']
+
+
+def test_errors_are_not_cached(games):
+    service = QueryService(games)
+    calls = []
+
+    def flaky(params):
+        calls.append(params)
+        if len(calls) == 1:
+            raise RuntimeError('fallo transitorio')
+        return {'ok': True}
+
+    service.endpoints['/flaky'] = flaky
+    assert get(service, '/flaky')[0] == 500
+    assert get(service, '/flaky') == (200, {'ok': True})
+    assert get(service, '/flaky') == (200, {'ok': True})
+    assert len(calls) == 2
+
+
+def test_nan_is_sent_as_null(games):
+    service = QueryService(games)
+    service.endpoints['/nan'] = lambda params: {'value': float('nan')}
+    status, body = get(service, '/nan')
+    assert status == 200
+    assert body == {'value': None}
+
+
+def test_spearman_rows_come_from_the_sorted_index(service, games):
+    from videogame_sales.correlations import grouped_correlations
+
+    status, body = get(service, '/correlations', method='spearman',
+                       since=2010, until=2014)
+    assert status == 200
+    rows = games[games['year_of_release'].between(2010, 2014)]
+    expected = grouped_correlations(rows, 'platform', methods=['spearman'])
+    got = {(r['platform'], r['score']): r['spearman'] for r in body}
+    for row in expected.itertuples():
+        value = got[(row.platform, row.score)]
+        assert (value is None) == pd.isna(row.spearman)
+        if value is not None:
+            assert value == pytest.approx(row.spearman, rel=1e-8)
@@ -0,0 +1,130 @@
+# coding: utf-8
+
+# Correcciones de Holm/BH contra implementaciones de referencia (un ciclo
+# por hipotesis) y scipy, y Welch vectorizado contra ttest_ind por par.
+
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+stats = pytest.importorskip('scipy.stats')
+
+from videogame_sales.stats import (  # noqa: E402
+    adjust_pvalues, group_moments, pairwise_welch, pairwise_welch_tests,
+    welch_from_moments, welch_ttest)
+
+
+def holm_reference(pvalues):
+    m = len(pvalues)
+    order = sorted(range(m), key=lambda k: pvalues[k])
+    adjusted, running = [0.0] * m, 0.0
+    for rank, k in enumerate(order):
+        running = max(running, min(1.0, (m - rank) * pvalues[k]))
+        adjusted[k] = running
+    return adjusted
+
+
+def bh_reference(pvalues):
+    m = len(pvalues)
+    order = sorted(range(m), key=lambda k: pvalues[k], reverse=True)
+    adjusted, running = [0.0] * m, 1.0
+    for position, k in enumerate(order):
+        rank = m - position
+        running = min(running, pvalues[k] * m / rank)
+        adjusted[k] = running
+    return adjusted
+
+
+@pytest.fixture(scope='module')
+def pvalues():
+    rng = np.random.default_rng(0)
+    values = np.concatenate([rng.uniform(0, 1, 200),
+                             rng.uniform(0, 1e-3, 50),
+                             [0.0, 1.0, 0.01, 0.01, 0.01]])
+    return rng.permutation(values)
+
+
+def test_holm_matches_reference(pvalues):
+    np.testing.assert_allclose(adjust_pvalues(pvalues, 'holm'),
+                               holm_reference(list(pvalues)), rtol=1e-12)
+
+
+def test_bh_matches_reference_and_scipy(pvalues):
+    adjusted = adjust_pvalues(pvalues, 'bh')
+    np.testing.assert_allclose(adjusted, bh_reference(list(pvalues)),
+                               rtol=1e-12)
+    np.testing.assert_allclose(adjusted,
+                               stats.false_discovery_control(pvalues),
+                               rtol=1e-12)
+
+
+@pytest.mark.parametrize('method', ['holm', 'bh'])
+def test_nan_pvalues_are_kept_and_not_counted(pvalues, method):
+    with_nan = np.insert(pvalues, [0, 10, 10, len(pvalues)], np.nan)
+    adjusted = adjust_pvalues(with_nan, method)
+    nan = np.isnan(with_nan)
+    assert np.isnan(adjusted[nan]).all()
+    np.testing.assert_allclose(adjusted[~nan],
+                               adjust_pvalues(pvalues, method), rtol=1e-12)
+    assert np.isnan(adjust_pvalues([np.nan, np.nan], method)).all()
+    assert len(adjust_pvalues([], method)) == 0
+
+
+def test_unknown_correction():
+    with pytest.raises(ValueError):
+        adjust_pvalues([0.1], 'bonferroni')
+
+
+def test_welch_from_moments_matches_ttest_ind():
+    rng = np.random.default_rng(1)
+    a = rng.normal(7, 1.5, 40)
+    b = rng.normal(6.5, 0.5, 9)
+    result = welch_from_moments(len(a), a.mean(), a.var(ddof=1),
+                                len(b), b.mean(), b.var(ddof=1))
+    expected = stats.ttest_ind(a, b, equal_var=False)
+    assert result.statistic == pytest.approx(expected.statistic, rel=1e-10)
+    assert result.pvalue == pytest.approx(expected.pvalue, rel=1e-10)
+    assert result.df == pytest.approx(expected.df, rel=1e-10)
+
+
+def test_pairwise_welch_matches_ttest_ind(games):
+    recent = games[games['year_of_release'] >= 2010]
+    table = pairwise_welch_tests(recent, 'user_score', 'genre')
+    groups = {genre: rows['user_score'].dropna().astype(float).to_numpy()
+              for genre, rows in recent.groupby('genre', observed=True)}
+    groups = {genre: values for genre, values in groups.items()
+              if len(values) >= 2}
+    assert len(table) == len(list(itertools.combinations(groups, 2)))
+    for row in table.itertuples():
+        expected = stats.ttest_ind(groups[row.group_a], groups[row.group_b],
+                                   equal_var=False)
+        assert row.statistic == pytest.approx(expected.statistic, rel=1e-8)
+        assert row.pvalue == pytest.approx(expected.pvalue, rel=1e-8)
+        direct = welch_ttest(recent, 'user_score', 'genre', row.group_a,
+                             row.group_b)
+        assert row.pvalue == pytest.approx(direct.pvalue, rel=1e-8)
+    np.testing.assert_allclose(table['pvalue_adj'],
+                               adjust_pvalues(table['pvalue'], 'holm'))
+    assert (table['reject'] == (table['pvalue_adj'] < 0.05)).all()
+
+
+def test_pairwise_welch_small_and_constant_groups():
+    df = pd.DataFrame({
+        'group': ['a'] * 5 + ['b'] * 4 + ['c'] + ['d'] * 3 + ['e'] * 3,
+        'value': [1, 2, 3, 4, 5, 2, 3, 3, 9, 7, 4, 4, 4, 5, 5, 5],
+    })
+    moments = group_moments(df, 'value', 'group')
+    table = pairwise_welch(moments)
+    # c tiene un solo dato: no entra a ningun par ni cuenta en la correccion
+    assert 'c' not in set(table['group_a']) | set(table['group_b'])
+    assert len(table) == 6
+    # d y e son constantes: su par no tiene p-valor y queda como NaN
+    de = table[(table['group_a'] == 'd') & (table['group_b'] == 'e')]
+    assert de['pvalue'].isna().all() and de['pvalue_adj'].isna().all()
+    assert not de['reject'].any()
+    valid = table['pvalue'].notna()
+    np.testing.assert_allclose(table.loc[valid, 'pvalue_adj'],
+                               holm_reference(list(table.loc[valid,
+                                                             'pvalue'])))
@@ -0,0 +1,80 @@
+# coding: utf-8
+
+# El reporte por bloques (cubo armado con read_games_chunks) debe dar lo
+# mismo que el reporte sobre la tabla completa de Data/games.csv. La unica
+# diferencia esperada es la mediana por genero, que sin filas queda en NaN.
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from videogame_sales.cube import SalesCube
+from videogame_sales.loader import read_games_chunks
+from videogame_sales.report import build_report
+
+RTOL = 1e-9
+
+
+def assert_same(expected, actual, where):
+    if isinstance(expected, dict):
+        assert expected.keys() == actual.keys(), where
+        for key in expected:
+            assert_same(expected[key], actual[key], f'{where}/{key}')
+    elif isinstance(expected, pd.DataFrame):
+        pd.testing.assert_frame_equal(expected, actual, rtol=RTOL,
+                                      obj=where)
+    elif isinstance(expected, pd.Series):
+        pd.testing.assert_series_equal(expected, actual, rtol=RTOL,
+                                       obj=where)
+    elif isinstance(expected, float):
+        assert actual == pytest.approx(expected, rel=RTOL), where
+    else:
+        assert expected == actual, where
+
+
+@pytest.fixture(scope='module')
+def full_report(games):
+    return build_report(games)
+
+
+@pytest.mark.parametrize('chunksize', [1000, 4096, 50_000])
+def test_streaming_report_matches_in_memory(full_report, chunksize):
+    cube = SalesCube.from_chunks(read_games_chunks(chunksize=chunksize))
+    streamed = build_report(cube=cube)
+
+    assert streamed['genre_stats']['median'].isna().all()
+    expected = dict(full_report)
+    actual = dict(streamed)
+    expected['genre_stats'] = expected['genre_stats'].drop(columns='median')
+    actual['genre_stats'] = actual['genre_stats'].drop(columns='median')
+    assert_same(expected, actual, 'report')
+
+
+def test_chunks_cover_all_rows(games):
+    rows = sum(len(chunk) for chunk in read_games_chunks(chunksize=1000))
+    assert rows == len(games)
+    assert np.isclose(
+        sum(chunk['total_sales'].sum()
+            for chunk in read_games_chunks(chunksize=1000)),
+        games['total_sales'].sum())
+
+
+def test_header_only_csv(tmp_path):
+    from videogame_sales.cube import KEYS, MOMENTS
+    from videogame_sales.loader import DEFAULT_PATH
+
+    path = tmp_path / 'empty.csv'
+    with open(DEFAULT_PATH, encoding='utf-8') as source:
+        path.write_text(source.readline(), encoding='utf-8')
+    cube = SalesCube.from_chunks(read_games_chunks(path, chunksize=100))
+    assert isinstance(cube, SalesCube)
+    assert len(cube) == 0
+    assert list(cube.cells.columns) == KEYS + MOMENTS
+
+    report = build_report(cube=cube)
+    assert report['genre_stats'].empty
+    assert report['active_platforms'] == []
+    assert np.isnan(report['typical_lifespan'])
+    assert all(np.isnan(result['pvalue'])
+               for result in report['hypotheses'].values())
+    assert all(table.empty for table in report['pairwise_tests'].values())